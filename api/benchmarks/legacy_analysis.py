@@ -0,0 +1,63 @@
+"""Benchmark analyzing a legacy Python protocol with a simulating runner.
+
+Runs a protocol that transfers from every well of a 96-well plate to
+twelve wells of another through a simulating `ProtocolRunner`, the way
+`opentrons analyze` and robot-server analysis do. Every legacy command
+message reported by the protocol becomes a ProtocolEngine action.
+"""
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from opentrons.protocol_reader import ProtocolReader
+from opentrons.protocol_runner import create_simulating_runner
+
+PROTOCOL = """
+metadata = {"apiLevel": "2.12"}
+
+def run(ctx):
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    source = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+    destination = ctx.load_labware("corning_96_wellplate_360ul_flat", 3)
+    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+
+    pipette.pick_up_tip()
+    for well in source.wells():
+        pipette.transfer(10, well, destination.rows()[0], new_tip="never")
+    pipette.drop_tip()
+"""
+RUNS = 3
+
+
+async def _main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        protocol_path = Path(directory) / "protocol.py"
+        protocol_path.write_text(PROTOCOL)
+        source = await ProtocolReader().read_saved(
+            files=[protocol_path], directory=None
+        )
+
+        best_seconds = float("inf")
+
+        for _ in range(RUNS):
+            runner = await create_simulating_runner()
+            start = time.perf_counter()
+            result = await runner.run(source)
+            best_seconds = min(best_seconds, time.perf_counter() - start)
+            assert result.state_summary.errors == []
+
+    command_count = len(result.commands)
+    print(
+        f"analysis ({command_count} commands, best of {RUNS}): "
+        f"{best_seconds:.2f}s, {best_seconds / command_count * 1e6:.0f}us per command"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark simulating a 96x96 transfer protocol with `opentrons.simulate`.
+
+Simulates a protocol that transfers from every well of a 96-well plate
+to every well of another, for 9216 aspirates and 9216 dispenses,
+each of which publishes run log messages through the protocol's Broker.
+Also measures the cost of publishing a single command's messages,
+with and without a subscriber, to track the run log's share of the total.
+"""
+import io
+import time
+
+# Imported first, because importing the commands modules first
+# runs into a circular import through opentrons.protocol_api
+from opentrons.simulate import simulate
+
+from opentrons.broker import Broker
+from opentrons.commands import protocol_commands
+from opentrons.commands.publisher import publish_context
+from opentrons.commands.types import CommandMessage
+
+PROTOCOL = """
+metadata = {"apiLevel": "2.12"}
+
+def run(ctx):
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    source = ctx.load_labware("corning_96_wellplate_360ul_flat", 2)
+    destination = ctx.load_labware("corning_96_wellplate_360ul_flat", 3)
+    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+
+    pipette.pick_up_tip()
+    for well in source.wells():
+        pipette.transfer(10, well, destination.wells(), new_tip="never")
+    pipette.drop_tip()
+"""
+PUBLISH_COUNT = 100000
+
+
+def _measure_publish_us(broker: Broker) -> float:
+    command = protocol_commands.comment("hello")
+    start = time.perf_counter()
+    for _ in range(PUBLISH_COUNT):
+        with publish_context(broker=broker, command=command):
+            pass
+    return (time.perf_counter() - start) / PUBLISH_COUNT * 1e6
+
+
+def _ignore_message(message: CommandMessage) -> None:
+    pass
+
+
+def main() -> None:
+    """Run the benchmark."""
+    start = time.perf_counter()
+    runlog, _ = simulate(io.StringIO(PROTOCOL), file_name="transfer.py")
+    simulate_seconds = time.perf_counter() - start
+
+    print(
+        f"simulate ({len(runlog)} run log entries): {simulate_seconds:.2f}s, "
+        f"{simulate_seconds / len(runlog) * 1e6:.1f}us per entry"
+    )
+
+    broker = Broker()
+    print(f"publish without subscribers: {_measure_publish_us(broker):.2f}us")
+
+    broker.subscribe("command", _ignore_message)
+    print(f"publish with a subscriber: {_measure_publish_us(broker):.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark simulating many short protocols, one after another.
+
+Simulates a short Python protocol repeatedly, either with a new simulating
+runner from `create_simulating_runner()` each time, or with runners from a
+single `SimulatingRunnerFactory`, which reuses its simulated robot and deck.
+"""
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Tuple
+
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+from opentrons.protocol_runner import (
+    ProtocolRunner,
+    SimulatingRunnerFactory,
+    create_simulating_runner,
+)
+
+PROTOCOL = """
+metadata = {"apiLevel": "2.12"}
+
+def run(ctx):
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_300ul", 1)
+    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+    pipette.pick_up_tip()
+    pipette.drop_tip()
+"""
+RUNS = 100
+
+
+async def _measure_ms(
+    create_runner: Callable[[], Awaitable[ProtocolRunner]], source: ProtocolSource
+) -> Tuple[float, float]:
+    """Get the average milliseconds to set up a runner, and to set up and run it."""
+    setup_seconds = 0.0
+    start = time.perf_counter()
+
+    for _ in range(RUNS):
+        setup_start = time.perf_counter()
+        runner = await create_runner()
+        setup_seconds += time.perf_counter() - setup_start
+
+        result = await runner.run(source)
+        assert result.state_summary.errors == []
+
+    total_seconds = time.perf_counter() - start
+    return setup_seconds / RUNS * 1e3, total_seconds / RUNS * 1e3
+
+
+async def _main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        protocol_path = Path(directory) / "protocol.py"
+        protocol_path.write_text(PROTOCOL)
+        source = await ProtocolReader().read_saved(
+            files=[protocol_path], directory=None
+        )
+
+        factory = await SimulatingRunnerFactory.build()
+
+        # Warm up imports and caches shared by both approaches
+        await _measure_ms(create_simulating_runner, source)
+
+        reused_setup_ms, reused_total_ms = await _measure_ms(
+            factory.create_runner, source
+        )
+        fresh_setup_ms, fresh_total_ms = await _measure_ms(
+            create_simulating_runner, source
+        )
+
+    for name, reused_ms, fresh_ms in [
+        ("setup", reused_setup_ms, fresh_setup_ms),
+        ("setup and run", reused_total_ms, fresh_total_ms),
+    ]:
+        print(
+            f"{name} ({RUNS} runs): {reused_ms:.2f}ms with a reused simulator, "
+            f"{fresh_ms:.2f}ms with a new simulator ({fresh_ms / reused_ms:.2f}x)"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    asyncio.run(_main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark StateStore waiters against a long stream of actions.
+
+Dispatches 50,000 command update actions into a StateStore while 100 tasks
+wait on the completion of upcoming commands, once with waiters that re-check
+their condition after every state change (`wait_for`) and once with waiters
+subscribed only to the commands they care about (`wait_for_topics`).
+
+Like `ProtocolEngine`, every command gets its own waiter: whenever a waited-on
+command completes, a new waiter starts on the command 100 places later. So the
+run also shows any per-topic bookkeeping left behind by finished waiters,
+as a per-action cost that grows over the run.
+"""
+import asyncio
+import time
+from datetime import datetime
+from collections import deque
+from typing import Awaitable, Callable, Deque
+
+from opentrons_shared_data.deck import load as load_deck
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import (
+    FailCommandAction,
+    PlayAction,
+    UpdateCommandAction,
+)
+from opentrons.protocol_engine.state import Config, StateStore
+
+ACTION_COUNT = 50_000
+WAITER_COUNT = 100
+
+# each command is dispatched as running, then as succeeded
+COMMAND_COUNT = ACTION_COUNT // 2
+
+WaitForComplete = Callable[[StateStore, str], Awaitable[object]]
+
+
+def _create_command(command_id: str, status: commands.CommandStatus) -> commands.Home:
+    return commands.Home(
+        id=command_id,
+        key=command_id,
+        status=status,
+        createdAt=datetime.now(),
+        params=commands.HomeParams(),
+    )
+
+
+def _create_state_store() -> StateStore:
+    state_store = StateStore(
+        config=Config(),
+        deck_definition=load_deck("ot2_standard", 3),
+        deck_fixed_labware=[],
+        is_door_open=False,
+    )
+    state_store.handle_action(PlayAction(requested_at=datetime.now()))
+
+    for i in range(COMMAND_COUNT):
+        command = _create_command(f"command-{i}", commands.CommandStatus.QUEUED)
+        state_store.handle_action(UpdateCommandAction(command=command))
+
+    return state_store
+
+
+async def _wait_for(state_store: StateStore, command_id: str) -> object:
+    return await state_store.wait_for(
+        state_store.commands.get_is_complete, command_id=command_id
+    )
+
+
+async def _wait_for_topics(state_store: StateStore, command_id: str) -> object:
+    return await state_store.wait_for_topics(
+        [command_id, FailCommandAction],
+        state_store.commands.get_is_complete,
+        command_id=command_id,
+    )
+
+
+async def _run(wait_for_complete: WaitForComplete) -> float:
+    state_store = _create_state_store()
+    waiters: Deque["asyncio.Task[object]"] = deque()
+
+    def start_waiter(command_index: int) -> None:
+        if command_index < COMMAND_COUNT:
+            command_id = f"command-{command_index}"
+            waiters.append(
+                asyncio.create_task(wait_for_complete(state_store, command_id))
+            )
+
+    for i in range(WAITER_COUNT):
+        start_waiter(i)
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+
+    for i in range(COMMAND_COUNT):
+        command_id = f"command-{i}"
+
+        for status in (
+            commands.CommandStatus.RUNNING,
+            commands.CommandStatus.SUCCEEDED,
+        ):
+            command = _create_command(command_id, status)
+            state_store.handle_action(UpdateCommandAction(command=command))
+            # yield to the event loop so woken waiters get a chance to run
+            await asyncio.sleep(0)
+
+        await waiters.popleft()
+        start_waiter(i + WAITER_COUNT)
+
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    for name, wait_for_complete in (
+        ("wait_for", _wait_for),
+        ("wait_for_topics", _wait_for_topics),
+    ):
+        elapsed = await _run(wait_for_complete)
+        print(
+            f"{name}: {ACTION_COUNT} actions, {WAITER_COUNT} waiters: "
+            f"{elapsed:.3f}s ({elapsed / ACTION_COUNT * 1e6:.1f}us per action)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
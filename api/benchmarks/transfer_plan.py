@@ -0,0 +1,71 @@
+"""Benchmark planning transfers between 384-well plates with `TransferPlan`.
+
+Iterates transfer, distribute, and consolidate plans with varying volumes,
+air gaps, mixes, touch tips, and blow outs, without executing any of the
+planned commands, to track the cost of planning on its own.
+"""
+import time
+from typing import Iterator
+
+from opentrons import simulate
+from opentrons.protocol_api import ProtocolContext
+from opentrons.protocols.advanced_control import transfers
+from opentrons.types import TransferTipPolicy
+
+RUNS = 10
+
+
+def _plans(ctx: ProtocolContext) -> Iterator[transfers.TransferPlan]:
+    source = ctx.load_labware("corning_384_wellplate_112ul_flat", 1)
+    destination = ctx.load_labware("corning_384_wellplate_112ul_flat", 2)
+    tip_rack = ctx.load_labware("opentrons_96_tiprack_300ul", 3)
+    pipette = ctx.load_instrument("p300_single_gen2", "left", tip_racks=[tip_rack])
+
+    volumes = [10 + well % 490 for well in range(384)]
+    options = transfers.TransferOptions(
+        transfer=transfers.Transfer(
+            new_tip=TransferTipPolicy.NEVER,
+            air_gap=5,
+            mix_strategy=transfers.MixStrategy.BOTH,
+            touch_tip_strategy=transfers.TouchTipStrategy.ALWAYS,
+            blow_out_strategy=transfers.BlowOutStrategy.DEST,
+        )
+    )
+
+    for mode, sources, dests in [
+        ("transfer", source.wells(), destination.wells()),
+        ("distribute", source.wells()[0], destination.wells()),
+        ("consolidate", source.wells(), destination.wells()[0]),
+    ]:
+        yield transfers.TransferPlan(
+            volumes,
+            sources,
+            dests,
+            pipette,
+            max_volume=300,
+            api_version=ctx.api_version,
+            mode=mode,
+            options=options,
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    ctx = simulate.get_protocol_api("2.12")
+    plans = list(_plans(ctx))
+
+    command_count = 0
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        for plan in plans:
+            command_count += sum(1 for _ in plan)
+    seconds = time.perf_counter() - start
+
+    print(
+        f"planned {command_count} commands: {seconds:.2f}s, "
+        f"{seconds / command_count * 1e6:.2f}us per command"
+    )
+
+
+if __name__ == "__main__":
+    main()
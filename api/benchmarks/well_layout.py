@@ -0,0 +1,112 @@
+"""Benchmark ProtocolEngine well layout lookups on a 384-well plate.
+
+Loads a 384-well plate into a StateStore, then looks up the plate's wells
+and rows, as a pipetting-heavy protocol would. Each lookup is compared to
+the equivalent computation straight from the labware definition, which is
+how these lookups worked before the precomputed well layouts.
+"""
+import re
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List
+
+from opentrons_shared_data.deck import load as load_deck
+from opentrons_shared_data.labware import load_definition
+from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
+
+from opentrons.protocol_engine import commands
+from opentrons.protocol_engine.actions import UpdateCommandAction
+from opentrons.protocol_engine.state import Config, StateStore
+from opentrons.protocol_engine.types import DeckSlotLocation
+from opentrons.protocols.models import LabwareDefinition
+from opentrons.types import DeckSlotName
+
+LOAD_NAME = "corning_384_wellplate_112ul_flat"
+LABWARE_ID = "plate"
+
+
+def _create_state_store() -> StateStore:
+    state_store = StateStore(
+        config=Config(),
+        deck_definition=load_deck("ot2_standard", 3),
+        deck_fixed_labware=[],
+        is_door_open=False,
+    )
+    definition = LabwareDefinition.parse_obj(load_definition(LOAD_NAME, 1))
+    command = commands.LoadLabware(
+        id="load-plate",
+        key="load-plate",
+        status=commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime.now(),
+        params=commands.LoadLabwareParams(
+            loadName=LOAD_NAME,
+            namespace="opentrons",
+            version=1,
+            location=DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        ),
+        result=commands.LoadLabwareResult(
+            labwareId=LABWARE_ID, definition=definition, offsetId=None
+        ),
+    )
+    state_store.handle_action(UpdateCommandAction(command=command))
+    return state_store
+
+
+def _measure_us(lookup: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        lookup()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def _get_well_rows_from_definition(state_store: StateStore) -> Dict[str, List[str]]:
+    definition = state_store.labware.get_definition(LABWARE_ID)
+    wells_by_rows = defaultdict(list)
+    pattern = re.compile(WELL_NAME_PATTERN, re.X)
+    for col in definition.ordering:
+        for well_name in col:
+            match = pattern.match(well_name)
+            assert match
+            wells_by_rows[match.group(1)].append(well_name)
+    return wells_by_rows
+
+
+def main() -> None:
+    """Run the benchmark."""
+    state_store = _create_state_store()
+    well_count = len(state_store.labware.get_wells(LABWARE_ID))
+
+    assert state_store.labware.get_well_rows(
+        LABWARE_ID
+    ) == _get_well_rows_from_definition(state_store)
+
+    results = {
+        "get_wells": (
+            _measure_us(lambda: state_store.labware.get_wells(LABWARE_ID), 1000),
+            _measure_us(
+                lambda: [
+                    well_name
+                    for column in state_store.labware.get_definition(
+                        LABWARE_ID
+                    ).ordering
+                    for well_name in column
+                ],
+                1000,
+            ),
+        ),
+        "get_well_rows": (
+            _measure_us(lambda: state_store.labware.get_well_rows(LABWARE_ID), 1000),
+            _measure_us(lambda: _get_well_rows_from_definition(state_store), 1000),
+        ),
+    }
+
+    for name, (cached, uncached) in results.items():
+        print(
+            f"{name} ({well_count} wells): {cached:.1f}us precomputed, "
+            f"{uncached:.1f}us from the definition ({uncached / cached:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -34,8 +34,12 @@ class Broker:
 
         return unsubscribe
 
+    def has_subscribers(self, topic: Literal["command"]) -> bool:
+        return bool(self.subscriptions.get(topic))
+
     def publish(self, topic: Literal["command"], message: types.CommandMessage) -> None:
-        [handler(message) for handler in self.subscriptions.get(topic, [])]
+        for handler in self.subscriptions.get(topic, ()):
+            handler(message)
 
     def set_logger(self, logger: logging.Logger) -> None:
         self.logger = logger
@@ -1,22 +1,32 @@
 """Opentrons analyze CLI."""
+import asyncio
 import click
+import multiprocessing
+import sys
+import time
 
 from anyio import run, Path as AsyncPath
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 from pydantic import BaseModel
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Union
 from typing_extensions import Literal
 
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocol_reader import (
     ProtocolReader,
+    ProtocolSource,
     ProtocolFileRole,
     ProtocolType,
     JsonProtocolConfig,
     ProtocolFilesInvalidError,
 )
-from opentrons.protocol_runner import create_simulating_runner
+from opentrons.protocol_runner import (
+    ProtocolRunResult,
+    SimulatingRunnerFactory,
+    create_simulating_runner,
+)
 from opentrons.protocol_engine import (
     Command,
     ErrorOccurrence,
@@ -39,13 +49,46 @@ from opentrons.protocol_engine import (
     help="Return analysis results as machine-readable JSON.",
     type=click.Path(path_type=AsyncPath),
 )
-def analyze(files: Sequence[Path], json_output: Optional[Path]) -> None:
+@click.option(
+    "--summary",
+    is_flag=True,
+    help=(
+        "Only return the protocol's files, config, and metadata, without"
+        " simulating it or fully reading large JSON files."
+    ),
+)
+@click.option(
+    "--batch",
+    is_flag=True,
+    help=(
+        "Analyze every protocol in the given directories, writing one JSON result"
+        " per protocol, per line, as each finishes. Each file or subdirectory"
+        " in a given directory is a separate protocol."
+    ),
+)
+@click.option(
+    "--workers",
+    help="How many protocols to analyze in parallel in batch mode.",
+    type=click.IntRange(min=1),
+)
+def analyze(
+    files: Sequence[Path],
+    json_output: Optional[Path],
+    summary: bool,
+    batch: bool,
+    workers: Optional[int],
+) -> None:
     """Analyze a protocol.
 
     You can use `opentrons analyze` to get a protocol's expected
     equipment and commands.
     """
-    run(_analyze, files, json_output)
+    if batch and summary:
+        raise click.UsageError("`--summary` is not supported in batch mode.")
+    elif batch:
+        _analyze_batch(files, json_output, workers)
+    else:
+        run(_analyze, files, json_output, summary)
 
 
 def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
@@ -63,9 +106,14 @@ def _get_input_files(files_and_dirs: Sequence[Path]) -> List[Path]:
 async def _analyze(
     files_and_dirs: Sequence[Path],
     json_output: Optional[AsyncPath],
+    summary: bool,
 ) -> None:
     input_files = _get_input_files(files_and_dirs)
 
+    if summary:
+        await _summarize(input_files, json_output)
+        return
+
     try:
         protocol_source = await ProtocolReader().read_saved(
             files=input_files,
@@ -78,24 +126,192 @@ async def _analyze(
     analysis = await runner.run(protocol_source)
 
     if json_output:
-        results = AnalyzeResults(
+        results = _get_analyze_results(protocol_source, analysis)
+
+        await json_output.write_text(
+            results.json(exclude_none=True),
+            encoding="utf-8",
+        )
+
+    else:
+        raise click.UsageError(
+            "Currently, this tool only supports JSON mode. Use `--json-output`."
+        )
+
+
+def _get_analyze_results(
+    protocol_source: ProtocolSource, analysis: ProtocolRunResult
+) -> "AnalyzeResults":
+    return AnalyzeResults(
+        createdAt=datetime.now(tz=timezone.utc),
+        files=[
+            ProtocolFile(name=f.path.name, role=f.role) for f in protocol_source.files
+        ],
+        config=(
+            JsonConfig(schemaVersion=protocol_source.config.schema_version)
+            if isinstance(protocol_source.config, JsonProtocolConfig)
+            else PythonConfig(apiVersion=protocol_source.config.api_version)
+        ),
+        metadata=protocol_source.metadata,
+        commands=analysis.commands,
+        errors=analysis.state_summary.errors,
+        labware=analysis.state_summary.labware,
+        pipettes=analysis.state_summary.pipettes,
+        modules=analysis.state_summary.modules,
+        liquids=analysis.state_summary.liquids,
+    )
+
+
+def _get_batch_protocols(directories: Sequence[Path]) -> List[Path]:
+    protocols: List[Path] = []
+
+    for directory in directories:
+        if not directory.is_dir():
+            raise click.UsageError(
+                f'In batch mode, "{directory}" must be a directory of protocols.'
+            )
+
+        protocols.extend(
+            sorted(p for p in directory.iterdir() if not p.name.startswith("."))
+        )
+
+    return protocols
+
+
+def _analyze_batch(
+    directories: Sequence[Path],
+    json_output: Optional[Path],
+    workers: Optional[int],
+) -> None:
+    protocols = _get_batch_protocols(directories)
+    output = open(json_output, "w", encoding="utf-8") if json_output else sys.stdout
+
+    # Workers are started from scratch rather than forked, and are reused
+    # from one protocol to the next, keeping their imports, caches,
+    # and simulated robot warm
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_batch_worker,
+    ) as executor:
+        futures: Dict["Future[str]", Path] = {
+            executor.submit(_analyze_batch_protocol, protocol): protocol
+            for protocol in protocols
+        }
+
+        try:
+            for future in as_completed(futures):
+                _write_batch_result(output, futures[future], future)
+        finally:
+            if output is not sys.stdout:
+                output.close()
+
+
+def _write_batch_result(output: TextIO, protocol: Path, future: "Future[str]") -> None:
+    try:
+        line = future.result()
+    except Exception as error:
+        # The worker itself failed, rather than the protocol's analysis
+        line = BatchResult(
+            protocol=protocol.name,
+            error=f"Analysis worker failed: {error!r}",
+        ).json(exclude_none=True)
+
+    output.write(line + "\n")
+    output.flush()
+
+
+class _BatchWorker:
+    """A batch worker process's event loop and simulated robot."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.runner_factory = self.loop.run_until_complete(
+            SimulatingRunnerFactory.build()
+        )
+
+
+_batch_worker: Optional[_BatchWorker] = None
+
+
+def _init_batch_worker() -> None:
+    global _batch_worker
+    _batch_worker = _BatchWorker()
+
+
+def _analyze_batch_protocol(protocol: Path) -> str:
+    """Analyze a single protocol in a batch worker process.
+
+    Returns:
+        The protocol's `BatchResult`, as a single line of JSON.
+    """
+    assert _batch_worker is not None, "Expected batch worker to be initialized"
+    return _batch_worker.loop.run_until_complete(
+        _analyze_batch_protocol_async(protocol, _batch_worker.runner_factory)
+    )
+
+
+async def _analyze_batch_protocol_async(
+    protocol: Path, runner_factory: SimulatingRunnerFactory
+) -> str:
+    start_time = time.perf_counter()
+    input_files = [f for f in _get_input_files([protocol]) if f.is_file()]
+
+    try:
+        protocol_source = await ProtocolReader().read_saved(
+            files=input_files,
+            directory=None,
+        )
+    except ProtocolFilesInvalidError as error:
+        read_seconds = time.perf_counter() - start_time
+        return BatchResult(
+            protocol=protocol.name,
+            error=str(error),
+            timing=BatchTiming(readSeconds=read_seconds, totalSeconds=read_seconds),
+        ).json(exclude_none=True)
+
+    read_time = time.perf_counter()
+    runner = await runner_factory.create_runner()
+    analysis = await runner.run(protocol_source)
+    end_time = time.perf_counter()
+
+    return BatchResult(
+        protocol=protocol.name,
+        analysis=_get_analyze_results(protocol_source, analysis),
+        timing=BatchTiming(
+            readSeconds=read_time - start_time,
+            simulateSeconds=end_time - read_time,
+            totalSeconds=end_time - start_time,
+        ),
+    ).json(exclude_none=True)
+
+
+async def _summarize(
+    input_files: Sequence[Path],
+    json_output: Optional[AsyncPath],
+) -> None:
+    try:
+        protocol_summary = await ProtocolReader().read_saved_summary(
+            files=input_files,
+            directory=None,
+        )
+    except ProtocolFilesInvalidError as error:
+        raise click.ClickException(str(error))
+
+    if json_output:
+        results = SummaryResults(
             createdAt=datetime.now(tz=timezone.utc),
             files=[
                 ProtocolFile(name=f.path.name, role=f.role)
-                for f in protocol_source.files
+                for f in protocol_summary.files
             ],
             config=(
-                JsonConfig(schemaVersion=protocol_source.config.schema_version)
-                if isinstance(protocol_source.config, JsonProtocolConfig)
-                else PythonConfig(apiVersion=protocol_source.config.api_version)
+                JsonConfig(schemaVersion=protocol_summary.config.schema_version)
+                if isinstance(protocol_summary.config, JsonProtocolConfig)
+                else PythonConfig(apiVersion=protocol_summary.config.api_version)
             ),
-            metadata=protocol_source.metadata,
-            commands=analysis.commands,
-            errors=analysis.state_summary.errors,
-            labware=analysis.state_summary.labware,
-            pipettes=analysis.state_summary.pipettes,
-            modules=analysis.state_summary.modules,
-            liquids=analysis.state_summary.liquids,
+            metadata=protocol_summary.metadata,
         )
 
         await json_output.write_text(
@@ -130,16 +346,41 @@ class PythonConfig(BaseModel):
     apiVersion: APIVersion
 
 
-class AnalyzeResults(BaseModel):
-    """Results of a protocol analysis."""
+class SummaryResults(BaseModel):
+    """A protocol's files, config, and metadata, read without analysis."""
 
     createdAt: datetime
     files: List[ProtocolFile]
     config: Union[JsonConfig, PythonConfig]
     metadata: Dict[str, Any]
+
+
+class AnalyzeResults(SummaryResults):
+    """Results of a protocol analysis."""
+
     commands: List[Command]
     labware: List[LoadedLabware]
     pipettes: List[LoadedPipette]
     modules: List[LoadedModule]
     liquids: List[Liquid]
     errors: List[ErrorOccurrence]
+
+
+class BatchTiming(BaseModel):
+    """How long each stage of a protocol's analysis took in batch mode."""
+
+    readSeconds: float
+    simulateSeconds: Optional[float]
+    totalSeconds: float
+
+
+class BatchResult(BaseModel):
+    """The result of analyzing a single protocol in batch mode.
+
+    Exactly one of `analysis` and `error` is set.
+    """
+
+    protocol: str
+    analysis: Optional[AnalyzeResults]
+    error: Optional[str]
+    timing: Optional[BatchTiming]
@@ -1,8 +1,9 @@
 import functools
 import inspect
+import itertools
+import logging
 from contextlib import contextmanager
 from typing import Any, Callable, Iterator, Optional, TypeVar, cast
-from uuid import uuid4
 
 from opentrons.broker import Broker
 
@@ -38,6 +39,10 @@ CommandPayloadCreator = Callable[..., CommandPayload]
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
 """A function wrapped by the @publish decorator."""
 
+# Message IDs only need to pair up a "before" message with its "after" message,
+# so a process-wide counter will do, and is much cheaper than a UUID
+_message_ids = itertools.count()
+
 
 def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
     """Publish messages before and after the decorated function has run."""
@@ -63,6 +68,9 @@ def publish(command: CommandPayloadCreator) -> Callable[[FuncT], FuncT]:
                 broker, Broker
             ), "Only methods of CommandPublisher classes should be decorated."
 
+            if not _should_publish(broker):
+                return func(*args, **kwargs)
+
             func_sig = _inspect_signature(func)
             bound_func_args = func_sig.bind(*args, **kwargs)
             bound_func_args.apply_defaults()
@@ -105,8 +113,15 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
 
     If an `error` is raised in the `with` block, it will be published in the "after"
     message and re-raised.
+
+    If nothing would receive the messages, because the broker has no subscribers
+    and its logger ignores INFO messages, nothing is published.
     """
-    message_id = str(uuid4())
+    if not _should_publish(broker):
+        yield
+        return
+
+    message_id = str(next(_message_ids))
     _do_publish(broker=broker, message_id=message_id, command=command, when="before")
 
     try:
@@ -124,6 +139,13 @@ def publish_context(broker: Broker, command: CommandPayload) -> Iterator[None]:
         _do_publish(broker=broker, message_id=message_id, command=command, when="after")
 
 
+def _should_publish(broker: Broker) -> bool:
+    """Whether anything would receive a command's messages."""
+    return broker.has_subscribers(COMMAND_TOPIC) or broker.logger.isEnabledFor(
+        logging.INFO
+    )
+
+
 @functools.lru_cache(maxsize=None)
 def _inspect_signature(func: Callable[..., Any]) -> inspect.Signature:
     """Inspect function signatures, memoized because it is called very often."""
@@ -148,7 +170,7 @@ def _do_publish(
         "error": error,
     }
 
-    if when == "before":
+    if when == "before" and broker.logger.isEnabledFor(logging.INFO):
         payload_str = ", ".join(f"{k}: {v}" for k, v in payload.items() if k != "text")
         broker.logger.info(f"{name}: {payload_str}")
 
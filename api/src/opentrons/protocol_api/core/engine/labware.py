@@ -104,7 +104,7 @@ class LabwareCore(AbstractLabware[WellCore]):
     def get_tip_tracker(self) -> TipTracker:
         raise NotImplementedError("LabwareCore not implemented")
 
-    def get_well_grid(self) -> WellGrid:
+    def get_well_grid(self) -> WellGrid[WellCore]:
         raise NotImplementedError("LabwareCore not implemented")
 
     def get_wells(self) -> List[WellCore]:
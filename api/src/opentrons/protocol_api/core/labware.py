@@ -108,7 +108,7 @@ class AbstractLabware(DeckItem, ABC, Generic[WellCoreType]):
         ...
 
     @abstractmethod
-    def get_well_grid(self) -> WellGrid:
+    def get_well_grid(self) -> WellGrid[WellCoreType]:
         ...
 
     @abstractmethod
@@ -120,13 +120,12 @@ class LabwareImplementation(AbstractLabware[WellImplementation]):
 
     def reset_tips(self) -> None:
         if self.is_tiprack():
-            for well in self._wells:
-                well.set_has_tip(True)
+            self._tip_tracker.reset()
 
     def get_tip_tracker(self) -> TipTracker:
         return self._tip_tracker
 
-    def get_well_grid(self) -> WellGrid:
+    def get_well_grid(self) -> WellGrid[WellImplementation]:
         return self._well_name_grid
 
     def get_wells(self) -> List[WellImplementation]:
@@ -2,6 +2,7 @@
 
 import re
 
+from opentrons.protocols.api_support.tip_rack_state import TipRackState
 from opentrons.protocols.geometry.well_geometry import WellGeometry
 from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
 
@@ -25,8 +26,12 @@ class WellImplementation(AbstractWellCore):
         self, well_geometry: WellGeometry, display_name: str, has_tip: bool, name: str
     ) -> None:
         self._display_name = display_name
-        self._has_tip = has_tip
         self._name = name
+        # A well starts out with its own single-well tip state,
+        # until a tip tracker binds it to its tip rack's state
+        self._tip_state = TipRackState(column_lengths=[1], has_tip=has_tip)
+        self._tip_column = 0
+        self._tip_row = 0
 
         match = WellImplementation.pattern.match(name)
         assert match, (
@@ -39,11 +44,21 @@ class WellImplementation(AbstractWellCore):
 
     def has_tip(self) -> bool:
         """Whether the well contains a tip."""
-        return self._has_tip
+        return self._tip_state.has_tip(self._tip_column, self._tip_row)
 
     def set_has_tip(self, value: bool) -> None:
         """Set the well as containing or not containing a tip."""
-        self._has_tip = value
+        self._tip_state.set_tips(self._tip_column, self._tip_row, 1, value)
+
+    def bind_tip_state(self, tip_state: TipRackState, column: int, row: int) -> None:
+        """Keep the well's tip presence in its tip rack's shared state.
+
+        The well's current tip presence is copied into `tip_state`.
+        """
+        tip_state.set_tips(column, row, 1, self.has_tip())
+        self._tip_state = tip_state
+        self._tip_column = column
+        self._tip_row = row
 
     def get_display_name(self) -> str:
         """Get the well's full display name."""
@@ -1,5 +1,5 @@
 """Action pipeline module."""
-from typing import List
+from typing import List, Sequence
 
 from .action_handler import ActionHandler
 from .actions import Action
@@ -28,3 +28,16 @@ class ActionDispatcher:
             handler.handle_action(action)
 
         self._sink.handle_action(action)
+
+    def dispatch_batch(self, actions: Sequence[Action]) -> None:
+        """Dispatch several actions into the pipeline, in order.
+
+        Handlers before the sink receive each action in turn, like with `dispatch`,
+        but the sink receives the whole batch at once, so it can apply the batch
+        and notify anything waiting on it only once.
+        """
+        for action in actions:
+            for handler in self._handlers:
+                handler.handle_action(action)
+
+        self._sink.handle_actions(actions)
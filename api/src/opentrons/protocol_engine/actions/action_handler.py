@@ -1,5 +1,6 @@
 """Abstract interfaces for engine plugins."""
 from abc import ABC, abstractmethod
+from typing import Sequence
 
 from .actions import Action
 
@@ -11,3 +12,12 @@ class ActionHandler(ABC):
     def handle_action(self, action: Action) -> None:
         """React to a state-change action."""
         ...
+
+    def handle_actions(self, actions: Sequence[Action]) -> None:
+        """React to several state-change actions, in order.
+
+        Defaults to handling each action individually; override to
+        react to a batch of actions more efficiently.
+        """
+        for action in actions:
+            self.handle_action(action)
@@ -1,25 +1,37 @@
 """Main ProtocolEngine factory."""
+from typing import List, Optional
+
+from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 from opentrons.hardware_control import HardwareControlAPI
 from opentrons.hardware_control.types import DoorState
 
 from .protocol_engine import ProtocolEngine
-from .resources import DeckDataProvider
+from .resources import DeckDataProvider, DeckFixedLabware
 from .state import Config, StateStore
 
 
 async def create_protocol_engine(
     hardware_api: HardwareControlAPI,
     config: Config,
+    deck_definition: Optional[DeckDefinitionV3] = None,
+    deck_fixed_labware: Optional[List[DeckFixedLabware]] = None,
 ) -> ProtocolEngine:
     """Create a ProtocolEngine instance.
 
     Arguments:
         hardware_api: Hardware control API to pass down to dependencies.
         config: ProtocolEngine configuration.
+        deck_definition: The robot's deck definition. Loaded if not given.
+        deck_fixed_labware: The deck's fixed labware, like the trash.
+            Loaded from the deck definition if not given.
     """
     deck_data = DeckDataProvider()
-    deck_definition = await deck_data.get_deck_definition()
-    deck_fixed_labware = await deck_data.get_deck_fixed_labware(deck_definition)
+
+    if deck_definition is None:
+        deck_definition = await deck_data.get_deck_definition()
+
+    if deck_fixed_labware is None:
+        deck_fixed_labware = await deck_data.get_deck_fixed_labware(deck_definition)
 
     state_store = StateStore(
         config=config,
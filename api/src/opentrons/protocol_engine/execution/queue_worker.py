@@ -3,6 +3,17 @@ import asyncio
 from logging import getLogger
 from typing import Optional
 
+from ..actions import (
+    DoorChangeAction,
+    FailCommandAction,
+    FinishAction,
+    HardwareStoppedAction,
+    PauseAction,
+    PlayAction,
+    QueueCommandAction,
+    StopAction,
+    UpdateCommandAction,
+)
 from ..state import StateStore
 from ..errors import RunStoppedError
 from .command_executor import CommandExecutor
@@ -10,6 +21,21 @@ from .command_executor import CommandExecutor
 
 log = getLogger(__name__)
 
+# The actions that can change what the next queued command is, by changing
+# the command queue, the queue's status, or whether the run is stopped.
+# These are the actions that affect the command store.
+_NEXT_QUEUED_TOPICS = (
+    QueueCommandAction,
+    UpdateCommandAction,
+    FailCommandAction,
+    PlayAction,
+    PauseAction,
+    StopAction,
+    FinishAction,
+    HardwareStoppedAction,
+    DoorChangeAction,
+)
+
 
 class QueueWorker:
     """Handle and track execution of commands queued in ProtocolEngine state."""
@@ -68,8 +94,9 @@ class QueueWorker:
 
     async def _run_commands(self) -> None:
         while not self._state_store.commands.get_stop_requested():
-            command_id = await self._state_store.wait_for(
-                condition=self._state_store.commands.get_next_queued
+            command_id = await self._state_store.wait_for_topics(
+                topics=_NEXT_QUEUED_TOPICS,
+                condition=self._state_store.commands.get_next_queued,
             )
 
             await self._command_executor.execute(command_id=command_id)
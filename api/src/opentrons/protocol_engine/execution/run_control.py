@@ -2,7 +2,16 @@
 import asyncio
 
 from ..state import StateStore
-from ..actions import ActionDispatcher, PauseAction, PauseSource
+from ..actions import (
+    ActionDispatcher,
+    PlayAction,
+    PauseAction,
+    PauseSource,
+    StopAction,
+    FinishAction,
+    HardwareStoppedAction,
+    DoorChangeAction,
+)
 
 
 class RunControlHandler:
@@ -23,8 +32,16 @@ class RunControlHandler:
         """Issue a PauseAction to the store, pausing the run."""
         if not self._state_store.config.ignore_pause:
             self._action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL))
-            await self._state_store.wait_for(
-                condition=self._state_store.commands.get_is_running
+            await self._state_store.wait_for_topics(
+                topics=(
+                    PlayAction,
+                    PauseAction,
+                    StopAction,
+                    FinishAction,
+                    HardwareStoppedAction,
+                    DoorChangeAction,
+                ),
+                condition=self._state_store.commands.get_is_running,
             )
 
     async def wait_for_duration(self, seconds: float) -> None:
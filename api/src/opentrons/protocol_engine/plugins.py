@@ -1,7 +1,7 @@
 """Protocol engine plugin interface."""
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence
 from typing_extensions import final
 
 from .actions import Action, ActionDispatcher, ActionHandler
@@ -36,6 +36,20 @@ class AbstractPlugin(ActionHandler, ABC):
         """
         return self._action_dispatcher.dispatch(action)
 
+    @final
+    def dispatch_batch(self, actions: Sequence[Action]) -> None:
+        """Dispatch several actions into the action pipeline, in order.
+
+        Equivalent to calling `dispatch` for each action, except that
+        the StateStore applies the whole batch before updating its views,
+        and notifies waiters only once.
+
+        Arguments:
+            actions: New ProtocolEngine actions to send into the pipeline.
+                The same caveats as `dispatch` apply to each action.
+        """
+        return self._action_dispatcher.dispatch_batch(actions)
+
     def setup(self) -> None:
         """Run any necessary setup steps prior to plugin usage."""
         ...
@@ -26,6 +26,7 @@ from .actions import (
     FinishAction,
     FinishErrorDetails,
     QueueCommandAction,
+    FailCommandAction,
     AddLabwareOffsetAction,
     AddLabwareDefinitionAction,
     AddLiquidAction,
@@ -152,7 +153,8 @@ class ProtocolEngine:
 
     async def wait_for_command(self, command_id: str) -> None:
         """Wait for a command to be completed."""
-        await self._state_store.wait_for(
+        await self._state_store.wait_for_topics(
+            [command_id, FailCommandAction],
             self._state_store.commands.get_is_complete,
             command_id=command_id,
         )
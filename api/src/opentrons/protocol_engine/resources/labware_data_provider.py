@@ -9,7 +9,7 @@ from typing import Optional, cast
 
 from opentrons_shared_data.labware.dev_types import LabwareDefinition as LabwareDefDict
 from opentrons.protocols.models import LabwareDefinition
-from opentrons.protocols.labware import get_labware_definition
+from opentrons.protocols.labware import get_labware_definition_model
 from opentrons.calibration_storage.get import load_tip_length_calibration
 from opentrons.calibration_storage.types import TipLengthCalNotFound
 
@@ -28,8 +28,9 @@ class LabwareDataProvider:
     ) -> LabwareDefinition:
         """Get a labware definition given the labware's identification.
 
-        Note: this method hits the filesystem, which will have performance
-        implications if it is called often.
+        Definitions are cached for the life of the process, so only the first
+        request for a given labware reads and validates its definition file.
+        The returned model is shared and must not be modified.
         """
         return await to_thread.run_sync(
             LabwareDataProvider._get_labware_definition_sync,
@@ -42,9 +43,7 @@ class LabwareDataProvider:
     def _get_labware_definition_sync(
         load_name: str, namespace: str, version: int
     ) -> LabwareDefinition:
-        return LabwareDefinition.parse_obj(
-            get_labware_definition(load_name, namespace, version)
-        )
+        return get_labware_definition_model(load_name, namespace, version)
 
     @staticmethod
     async def get_calibrated_tip_length(
@@ -25,3 +25,12 @@ class HandlesActions(ABC):
     def handle_action(self, action: Action) -> None:
         """React to a state-change action."""
         ...
+
+    def is_affected_by(self, action: Action) -> bool:
+        """Get whether a given action may change this object's state.
+
+        Actions that cannot affect state do not need to be handled,
+        which allows views of unaffected state to be left untouched.
+        Defaults to `True`; override to narrow.
+        """
+        return True
@@ -1,19 +1,64 @@
 """Simple state change notification interface."""
 import asyncio
+from typing import Collection, Dict, Optional
 
 
 class ChangeNotifier:
-    """An interface tto emit or subscribe to state change notifications."""
+    """An interface tto emit or subscribe to state change notifications.
+
+    Subscribers may optionally wait on a set of topics, in which case they
+    will only be woken by notifications that include at least one of
+    those topics. Subscribers without topics are woken by every notification.
+    """
 
     def __init__(self) -> None:
         """Initialize the ChangeNotifier with an internal Event."""
         self._event = asyncio.Event()
+        # Each topic waiter has its own event, indexed under every topic
+        # it waits on, and removed once the waiter is done waiting.
+        # Dicts are used as insertion-ordered sets, so waiters are woken
+        # in the order they started waiting.
+        self._events_by_topic: Dict[object, Dict[asyncio.Event, None]] = {}
+
+    def notify(self, topics: Optional[Collection[object]] = None) -> None:
+        """Notify `wait`'ers that the state has changed.
 
-    def notify(self) -> None:
-        """Notify all `wait`'ers that the state has changed."""
+        Arguments:
+            topics: What changed. If omitted, all `wait`'ers are notified,
+                regardless of the topics they are waiting on.
+        """
         self._event.set()
 
-    async def wait(self) -> None:
-        """Wait until the next state change notification."""
-        self._event.clear()
-        await self._event.wait()
+        if topics is None:
+            topics = list(self._events_by_topic)
+
+        for topic in topics:
+            for event in self._events_by_topic.get(topic, ()):
+                event.set()
+
+    async def wait(self, topics: Optional[Collection[object]] = None) -> None:
+        """Wait until the next state change notification.
+
+        Arguments:
+            topics: If specified, only wait for a notification
+                that includes at least one of these topics.
+        """
+        if not topics:
+            self._event.clear()
+            await self._event.wait()
+            return
+
+        event = asyncio.Event()
+
+        for topic in topics:
+            self._events_by_topic.setdefault(topic, {})[event] = None
+
+        try:
+            await event.wait()
+        finally:
+            for topic in topics:
+                events = self._events_by_topic[topic]
+                events.pop(event, None)
+
+                if not events:
+                    del self._events_by_topic[topic]
@@ -147,6 +147,22 @@ class CommandState:
     are stored on the individual commands themselves.
     """
 
+    latest_completed_command_id: Optional[str]
+    """The ID of the completed command with the highest index, if any.
+
+    Kept up to date as commands are updated so the "current" command
+    can be found without scanning every command in state.
+    """
+
+    failed_command_id: Optional[str]
+    """The ID of the earliest protocol (non-setup) command with an error, if any."""
+
+    command_counts_by_status: Dict[CommandStatus, int]
+    """The number of commands in state with each status.
+
+    Statuses with no commands are omitted.
+    """
+
 
 class CommandStore(HasState[CommandState], HandlesActions):
     """Command state container."""
@@ -173,6 +189,26 @@ class CommandStore(HasState[CommandState], HandlesActions):
             errors_by_id={},
             run_completed_at=None,
             run_started_at=None,
+            latest_completed_command_id=None,
+            failed_command_id=None,
+            command_counts_by_status={},
+        )
+
+    def is_affected_by(self, action: Action) -> bool:
+        """Get whether an action may change command state."""
+        return isinstance(
+            action,
+            (
+                QueueCommandAction,
+                UpdateCommandAction,
+                FailCommandAction,
+                PlayAction,
+                PauseAction,
+                StopAction,
+                FinishAction,
+                HardwareStoppedAction,
+                DoorChangeAction,
+            ),
         )
 
     def handle_action(self, action: Action) -> None:  # noqa: C901
@@ -203,9 +239,8 @@ class CommandStore(HasState[CommandState], HandlesActions):
 
             next_index = len(self._state.all_command_ids)
             self._state.all_command_ids.append(action.command_id)
-            self._state.commands_by_id[queued_command.id] = CommandEntry(
-                index=next_index,
-                command=queued_command,
+            self._set_command_entry(
+                CommandEntry(index=next_index, command=queued_command)
             )
 
             if action.request.intent == CommandIntent.SETUP:
@@ -223,14 +258,10 @@ class CommandStore(HasState[CommandState], HandlesActions):
             if prev_entry is None:
                 index = len(self._state.all_command_ids)
                 self._state.all_command_ids.append(command.id)
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=index,
-                    command=command,
-                )
+                self._set_command_entry(CommandEntry(index=index, command=command))
             else:
-                self._state.commands_by_id[command.id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=command,
+                self._set_command_entry(
+                    CommandEntry(index=prev_entry.index, command=command)
                 )
 
             self._state.queued_command_ids.discard(command.id)
@@ -250,18 +281,20 @@ class CommandStore(HasState[CommandState], HandlesActions):
             )
 
             prev_entry = self._state.commands_by_id[action.command_id]
-            self._state.commands_by_id[action.command_id] = CommandEntry(
-                index=prev_entry.index,
-                # TODO(mc, 2022-06-06): add new "cancelled" status or similar
-                # and don't set `completedAt` in commands other than the
-                # specific one that failed
-                command=prev_entry.command.copy(
-                    update={
-                        "error": error_occurrence,
-                        "completedAt": action.failed_at,
-                        "status": CommandStatus.FAILED,
-                    }
-                ),
+            self._set_command_entry(
+                CommandEntry(
+                    index=prev_entry.index,
+                    # TODO(mc, 2022-06-06): add new "cancelled" status or similar
+                    # and don't set `completedAt` in commands other than the
+                    # specific one that failed
+                    command=prev_entry.command.copy(
+                        update={
+                            "error": error_occurrence,
+                            "completedAt": action.failed_at,
+                            "status": CommandStatus.FAILED,
+                        }
+                    ),
+                )
             )
 
             if prev_entry.command.intent == CommandIntent.SETUP:
@@ -278,14 +311,16 @@ class CommandStore(HasState[CommandState], HandlesActions):
             for command_id in other_command_ids_to_fail:
                 prev_entry = self._state.commands_by_id[command_id]
 
-                self._state.commands_by_id[command_id] = CommandEntry(
-                    index=prev_entry.index,
-                    command=prev_entry.command.copy(
-                        update={
-                            "completedAt": action.failed_at,
-                            "status": CommandStatus.FAILED,
-                        }
-                    ),
+                self._set_command_entry(
+                    CommandEntry(
+                        index=prev_entry.index,
+                        command=prev_entry.command.copy(
+                            update={
+                                "completedAt": action.failed_at,
+                                "status": CommandStatus.FAILED,
+                            }
+                        ),
+                    )
                 )
 
             if self._state.running_command_id == action.command_id:
@@ -351,6 +386,59 @@ class CommandStore(HasState[CommandState], HandlesActions):
                 elif action.door_state == DoorState.CLOSED:
                     self._state.is_door_blocking = False
 
+    def _set_command_entry(self, entry: CommandEntry) -> None:
+        """Add or replace a command entry, keeping derived indices up to date."""
+        command = entry.command
+        counts = self._state.command_counts_by_status
+        prev_entry = self._state.commands_by_id.get(command.id)
+
+        if prev_entry is not None:
+            prev_status = prev_entry.command.status
+            counts[prev_status] -= 1
+            if counts[prev_status] == 0:
+                del counts[prev_status]
+
+        counts[command.status] = counts.get(command.status, 0) + 1
+        self._state.commands_by_id[command.id] = entry
+
+        latest_completed_id = self._state.latest_completed_command_id
+
+        if _is_complete(command):
+            if (
+                latest_completed_id is None
+                or self._state.commands_by_id[latest_completed_id].index < entry.index
+            ):
+                self._state.latest_completed_command_id = command.id
+        elif latest_completed_id == command.id:
+            # a completed command was moved back to an incomplete status,
+            # which should not happen in practice; fall back to a search
+            self._state.latest_completed_command_id = next(
+                (
+                    cid
+                    for cid in reversed(self._state.all_command_ids[: entry.index])
+                    if _is_complete(self._state.commands_by_id[cid].command)
+                ),
+                None,
+            )
+
+        failed_id = self._state.failed_command_id
+
+        if _is_protocol_failure(command):
+            if (
+                failed_id is None
+                or self._state.commands_by_id[failed_id].index > entry.index
+            ):
+                self._state.failed_command_id = command.id
+        elif failed_id == command.id:
+            self._state.failed_command_id = next(
+                (
+                    cid
+                    for cid in self._state.all_command_ids[entry.index + 1 :]
+                    if _is_protocol_failure(self._state.commands_by_id[cid].command)
+                ),
+                None,
+            )
+
 
 class CommandView(HasState[CommandState]):
     """Read-only command state view."""
@@ -430,17 +518,14 @@ class CommandView(HasState[CommandState]):
                 index=entry.index,
             )
 
-        # TODO(mc, 2022-02-07): this is O(n) in the worst case for no good reason.
-        # Resolve prior to JSONv6 support, where this will matter.
-        for reverse_index, cid in enumerate(reversed(self._state.all_command_ids)):
-            if self.get_is_complete(cid):
-                entry = self._state.commands_by_id[cid]
-                return CurrentCommand(
-                    command_id=entry.command.id,
-                    command_key=entry.command.key,
-                    created_at=entry.command.createdAt,
-                    index=len(self._state.all_command_ids) - reverse_index - 1,
-                )
+        if self._state.latest_completed_command_id:
+            entry = self._state.commands_by_id[self._state.latest_completed_command_id]
+            return CurrentCommand(
+                command_id=entry.command.id,
+                command_key=entry.command.key,
+                created_at=entry.command.createdAt,
+                index=entry.index,
+            )
 
         return None
 
@@ -505,9 +590,11 @@ class CommandView(HasState[CommandState]):
         Arguments:
             command_id: Command to check.
         """
-        status = self.get(command_id).status
+        return _is_complete(self.get(command_id))
 
-        return status == CommandStatus.SUCCEEDED or status == CommandStatus.FAILED
+    def get_count_by_status(self, status: CommandStatus) -> int:
+        """Get the number of commands in state with the given status."""
+        return self._state.command_counts_by_status.get(status, 0)
 
     def get_all_complete(self) -> bool:
         """Get whether all added commands have completed.
@@ -519,10 +606,10 @@ class CommandView(HasState[CommandState]):
         no_command_queued = len(self._state.queued_command_ids) == 0
 
         if no_command_running and no_command_queued:
-            for command_id in self._state.all_command_ids:
-                command = self._state.commands_by_id[command_id].command
-                if command.error and command.intent != CommandIntent.SETUP:
-                    raise ProtocolCommandFailedError(command.error.detail)
+            if self._state.failed_command_id:
+                command = self._state.commands_by_id[self._state.failed_command_id]
+                assert command.command.error is not None
+                raise ProtocolCommandFailedError(command.command.error.detail)
             return True
         else:
             return False
@@ -606,3 +693,14 @@ class CommandView(HasState[CommandState]):
                 return EngineStatus.PAUSED
 
         return EngineStatus.IDLE
+
+
+def _is_complete(command: Command) -> bool:
+    return (
+        command.status == CommandStatus.SUCCEEDED
+        or command.status == CommandStatus.FAILED
+    )
+
+
+def _is_protocol_failure(command: Command) -> bool:
+    return command.error is not None and command.intent != CommandIntent.SETUP
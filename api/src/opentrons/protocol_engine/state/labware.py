@@ -1,13 +1,10 @@
 """Basic labware data state and store."""
 from __future__ import annotations
 
-import re
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Any, Mapping
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, Any, Mapping
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3, SlotDefV3
-from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
 from opentrons_shared_data.pipette.dev_types import LabwareUri
 
 from opentrons.types import DeckSlotName, Point
@@ -30,6 +27,7 @@ from ..types import (
     LabwareOffsetLocation,
     LabwareLocation,
     LoadedLabware,
+    ModuleModel,
     OFF_DECK_LOCATION,
 )
 from ..actions import (
@@ -39,10 +37,25 @@ from ..actions import (
     AddLabwareDefinitionAction,
 )
 from .abstract_store import HasState, HandlesActions
+from .well_layout import WellLayout, create_well_layout
 
 
 _TRASH_LOCATION = DeckSlotLocation(slotName=DeckSlotName.FIXED_TRASH)
 
+# (definition URI, slot name, module model)
+LabwareOffsetKey = Tuple[str, DeckSlotName, Optional[ModuleModel]]
+
+
+def get_labware_offset_key(
+    definition_uri: str, location: LabwareOffsetLocation
+) -> LabwareOffsetKey:
+    """Get the key that labware offsets matching a load are indexed by.
+
+    Two keys are equal if and only if their definition URIs
+    and offset locations are equal.
+    """
+    return definition_uri, location.slotName, location.moduleModel
+
 
 @dataclass
 class LabwareState:
@@ -57,9 +70,17 @@ class LabwareState:
     # We rely on Python 3.7+ preservation of dict insertion order.
     labware_offsets_by_id: Dict[str, LabwareOffset]
 
+    # The ID of the most recently added offset for each definition URI
+    # and location. Every ID here is an element of labware_offsets_by_id.
+    labware_offset_ids_by_key: Dict[LabwareOffsetKey, str]
+
     definitions_by_uri: Dict[str, LabwareDefinition]
     deck_definition: DeckDefinitionV3
 
+    # Indexed by definition URI, with an entry for every definition
+    # in definitions_by_uri. Built from the definition when it's added.
+    well_layout_by_uri: Dict[str, WellLayout] = field(compare=False)
+
 
 class LabwareStore(HasState[LabwareState], HandlesActions):
     """Labware state container."""
@@ -97,11 +118,23 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
 
         self._state = LabwareState(
             definitions_by_uri=definitions_by_uri,
+            well_layout_by_uri={
+                uri: create_well_layout(definition)
+                for uri, definition in definitions_by_uri.items()
+            },
             labware_offsets_by_id={},
+            labware_offset_ids_by_key={},
             labware_by_id=labware_by_id,
             deck_definition=deck_definition,
         )
 
+    def is_affected_by(self, action: Action) -> bool:
+        """Get whether an action may change labware state."""
+        return (
+            isinstance(action, UpdateCommandAction)
+            and action.command.result is not None
+        ) or isinstance(action, (AddLabwareOffsetAction, AddLabwareDefinitionAction))
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         if isinstance(action, UpdateCommandAction):
@@ -123,7 +156,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 load_name=action.definition.parameters.loadName,
                 version=action.definition.version,
             )
-            self._state.definitions_by_uri[uri] = action.definition
+            self._set_definition(uri, action.definition)
 
     def _handle_command(self, command: Command) -> None:
         """Modify state in reaction to a command."""
@@ -148,7 +181,7 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
                 displayName=command.params.displayName,
             )
 
-            self._state.definitions_by_uri[definition_uri] = command.result.definition
+            self._set_definition(definition_uri, command.result.definition)
 
         elif isinstance(command.result, MoveLabwareResult):
             labware_id = command.params.labwareId
@@ -163,6 +196,10 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
             self._state.labware_by_id[labware_id].location = OFF_DECK_LOCATION
             self._state.labware_by_id[labware_id].offsetId = None
 
+    def _set_definition(self, uri: str, definition: LabwareDefinition) -> None:
+        self._state.definitions_by_uri[uri] = definition
+        self._state.well_layout_by_uri[uri] = create_well_layout(definition)
+
     def _add_labware_offset(self, labware_offset: LabwareOffset) -> None:
         """Add a new labware offset to state.
 
@@ -174,6 +211,11 @@ class LabwareStore(HasState[LabwareState], HandlesActions):
 
         self._state.labware_offsets_by_id[labware_offset.id] = labware_offset
 
+        key = get_labware_offset_key(
+            labware_offset.definitionUri, labware_offset.location
+        )
+        self._state.labware_offset_ids_by_key[key] = labware_offset.id
+
 
 class LabwareView(HasState[LabwareState]):
     """Read-only labware state view."""
@@ -295,12 +337,22 @@ class LabwareView(HasState[LabwareState]):
 
     def get_wells(self, labware_id: str) -> List[str]:
         """Get labware wells as a list of well names."""
-        definition = self.get_definition(labware_id=labware_id)
-        wells = list()
-        for col in definition.ordering:
-            for well_name in col:
-                wells.append(well_name)
-        return wells
+        return list(self.get_well_layout(labware_id).names)
+
+    def get_well_layout(self, labware_id: str) -> WellLayout:
+        """Get the precomputed well layout of a labware's definition.
+
+        The result is shared by every labware with the same definition,
+        so it must not be modified.
+        """
+        uri = self.get(labware_id).definitionUri
+
+        try:
+            return self._state.well_layout_by_uri[uri]
+        except KeyError as e:
+            raise errors.LabwareDefinitionDoesNotExistError(
+                f"Labware definition for matching {uri} not found."
+            ) from e
 
     def validate_liquid_allowed_in_labware(
         self, labware_id: str, wells: Mapping[str, Any]
@@ -321,23 +373,13 @@ class LabwareView(HasState[LabwareState]):
 
     def get_well_columns(self, labware_id: str) -> Dict[str, List[str]]:
         """Get well columns."""
-        definition = self.get_definition(labware_id=labware_id)
-        wells_by_cols = defaultdict(list)
-        for i, col in enumerate(definition.ordering):
-            wells_by_cols[f"{i+1}"] = col
-        return wells_by_cols
+        columns = self.get_well_layout(labware_id).columns
+        return {name: list(wells) for name, wells in columns.items()}
 
     def get_well_rows(self, labware_id: str) -> Dict[str, List[str]]:
         """Get well rows."""
-        definition = self.get_definition(labware_id=labware_id)
-        wells_by_rows = defaultdict(list)
-        pattern = re.compile(WELL_NAME_PATTERN, re.X)
-        for col in definition.ordering:
-            for well_name in col:
-                match = pattern.match(well_name)
-                assert match, f"Well name did not match pattern {pattern}"
-                wells_by_rows[match.group(1)].append(well_name)
-        return wells_by_rows
+        rows = self.get_well_layout(labware_id).rows
+        return {name: list(wells) for name, wells in rows.items()}
 
     def get_tip_length(self, labware_id: str) -> float:
         """Get the tip length of a tip rack."""
@@ -436,10 +478,11 @@ class LabwareView(HasState[LabwareState]):
         This implies that if the location involves a module,
         it will *not* match a module that's compatible but not identical.
         """
-        for candidate in reversed(list(self._state.labware_offsets_by_id.values())):
-            if (
-                candidate.definitionUri == definition_uri
-                and candidate.location == location
-            ):
-                return candidate
-        return None
+        offset_id = self._state.labware_offset_ids_by_key.get(
+            get_labware_offset_key(definition_uri, location)
+        )
+        return (
+            self._state.labware_offsets_by_id[offset_id]
+            if offset_id is not None
+            else None
+        )
@@ -24,6 +24,10 @@ class LiquidStore(HasState[LiquidState], HandlesActions):
         """Initialize a liquid store and its state."""
         self._state = LiquidState(liquids_by_id={})
 
+    def is_affected_by(self, action: Action) -> bool:
+        """Get whether an action may change liquid state."""
+        return isinstance(action, AddLiquidAction)
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         if isinstance(action, AddLiquidAction):
@@ -112,6 +112,13 @@ class ModuleStore(HasState[ModuleState], HandlesActions):
             slot_by_module_id={}, hardware_by_module_id={}, substate_by_module_id={}
         )
 
+    def is_affected_by(self, action: Action) -> bool:
+        """Get whether an action may change module state."""
+        return (
+            isinstance(action, UpdateCommandAction)
+            and action.command.result is not None
+        ) or isinstance(action, AddModuleAction)
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         if isinstance(action, UpdateCommandAction):
@@ -72,6 +72,13 @@ class PipetteStore(HasState[PipetteState], HandlesActions):
             attached_tip_labware_by_id={},
         )
 
+    def is_affected_by(self, action: Action) -> bool:
+        """Get whether an action may change pipette state."""
+        return (
+            isinstance(action, UpdateCommandAction)
+            and action.command.result is not None
+        )
+
     def handle_action(self, action: Action) -> None:
         """Modify state in reaction to an action."""
         if isinstance(action, UpdateCommandAction):
@@ -3,12 +3,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from functools import partial
-from typing import Any, Callable, List, Optional, Sequence, TypeVar
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 
 from ..resources import DeckFixedLabware
-from ..actions import Action, ActionHandler
+from ..actions import Action, ActionHandler, UpdateCommandAction, FailCommandAction
 from .abstract_store import HasState, HandlesActions
 from .change_notifier import ChangeNotifier
 from .commands import CommandState, CommandStore, CommandView
@@ -23,6 +33,13 @@ from .state_summary import StateSummary
 
 ReturnT = TypeVar("ReturnT")
 
+StateTopic = Union[type, str]
+"""A topic that waiters may subscribe to, to be notified of specific changes.
+
+An action type matches every action of that type, while a string matches
+any `UpdateCommandAction` or `FailCommandAction` for the command with that ID.
+"""
+
 
 @dataclass(frozen=True)
 class State:
@@ -47,6 +64,8 @@ class StateView(HasState[State]):
     _liquid: LiquidView
     _motion: MotionView
     _config: Config
+    _version: int
+    _summary: Optional[StateSummary]
 
     @property
     def commands(self) -> CommandView:
@@ -88,19 +107,35 @@ class StateView(HasState[State]):
         """Get ProtocolEngine configuration."""
         return self._config
 
+    @property
+    def version(self) -> int:
+        """Get the version of the underlying state.
+
+        The version increases every time an action changes state, and stays
+        the same otherwise. Consumers may compare versions to skip work
+        if nothing has changed since they last looked.
+        """
+        return self._version
+
     def get_summary(self) -> StateSummary:
-        """Get protocol run data."""
-        return StateSummary.construct(
-            status=self.commands.get_status(),
-            errors=self._commands.get_all_errors(),
-            pipettes=self._pipettes.get_all(),
-            labware=self._labware.get_all(),
-            labwareOffsets=self._labware.get_labware_offsets(),
-            modules=self.modules.get_all(),
-            completedAt=self._state.commands.run_completed_at,
-            startedAt=self._state.commands.run_started_at,
-            liquids=self._liquid.get_all(),
-        )
+        """Get protocol run data.
+
+        The summary is cached until the next state change.
+        """
+        if self._summary is None:
+            self._summary = StateSummary.construct(
+                status=self.commands.get_status(),
+                errors=self._commands.get_all_errors(),
+                pipettes=self._pipettes.get_all(),
+                labware=self._labware.get_all(),
+                labwareOffsets=self._labware.get_labware_offsets(),
+                modules=self.modules.get_all(),
+                completedAt=self._state.commands.run_completed_at,
+                startedAt=self._state.commands.run_started_at,
+                liquids=self._liquid.get_all(),
+            )
+
+        return self._summary
 
 
 class StateStore(StateView, ActionHandler):
@@ -156,12 +191,51 @@ class StateStore(StateView, ActionHandler):
 
         Arguments:
             action: An action object representing a state change. Will be
-                passed to all substores so they can react accordingly.
+                passed to every substore it may affect so they can react
+                accordingly. State views are only updated, and waiters only
+                notified, if at least one substore was affected.
         """
-        for substore in self._substores:
+        changed_substores = [
+            substore for substore in self._substores if substore.is_affected_by(action)
+        ]
+
+        for substore in changed_substores:
             substore.handle_action(action)
 
-        self._update_state_views()
+        if changed_substores:
+            self._update_state_views(changed_substores, _get_topics(action))
+
+    def handle_actions(self, actions: Sequence[Action]) -> None:
+        """Modify State in reaction to several actions, in order.
+
+        Equivalent to calling `handle_action` for each action, except that
+        state views are only updated, and waiters only notified, once
+        for the whole batch.
+
+        Arguments:
+            actions: Action objects representing state changes.
+        """
+        changed_substores: List[HandlesActions] = []
+        topics: Set[StateTopic] = set()
+
+        for action in actions:
+            action_changed_substores = [
+                substore
+                for substore in self._substores
+                if substore.is_affected_by(action)
+            ]
+
+            for substore in action_changed_substores:
+                substore.handle_action(action)
+
+                if substore not in changed_substores:
+                    changed_substores.append(substore)
+
+            if action_changed_substores:
+                topics.update(_get_topics(action))
+
+        if changed_substores:
+            self._update_state_views(changed_substores, topics)
 
     async def wait_for(
         self,
@@ -214,10 +288,53 @@ class StateStore(StateView, ActionHandler):
             The exception raised by the `condition` function, if any.
         """
         predicate = partial(condition, *args, **kwargs)
+        return await self._wait_for(predicate, topics=None)
+
+    async def wait_for_topics(
+        self,
+        topics: Collection[StateTopic],
+        condition: Callable[..., Optional[ReturnT]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ReturnT:
+        """Wait for a condition to become true, checking only after certain changes.
+
+        Like `wait_for`, but `condition` is only re-checked after state is changed
+        by an action matching one of the given topics, rather than after every
+        change. Use this when `condition` can only become true in reaction to a
+        known set of actions, so that the waiting task isn't woken needlessly.
+
+        All the caveats of `wait_for` apply. In addition, if `topics` is missing
+        an action that can make `condition` true, this may wait forever. For
+        example, to wait for a command to complete, subscribe to both its ID and
+        `FailCommandAction`, because a failed command fails all queued commands.
+
+        Arguments:
+            topics: Action types and/or command IDs that may make
+                `condition` true.
+            condition: A function that returns a truthy value when the `await`
+                should resolve.
+            *args: Positional arguments to pass to `condition`.
+            **kwargs: Named arguments to pass to `condition`.
+
+        Returns:
+            The truthy value returned by the `condition` function.
+
+        Raises:
+            The exception raised by the `condition` function, if any.
+        """
+        predicate = partial(condition, *args, **kwargs)
+        return await self._wait_for(predicate, topics=topics)
+
+    async def _wait_for(
+        self,
+        predicate: Callable[[], Optional[ReturnT]],
+        topics: Optional[Collection[StateTopic]],
+    ) -> ReturnT:
         is_done = predicate()
 
         while not is_done:
-            await self._change_notifier.wait()
+            await self._change_notifier.wait(topics=topics)
             is_done = predicate()
 
         return is_done
@@ -238,6 +355,8 @@ class StateStore(StateView, ActionHandler):
 
         # Base states
         self._state = state
+        self._version = 0
+        self._summary = None
         self._commands = CommandView(state.commands)
         self._labware = LabwareView(state.labware)
         self._pipettes = PipetteView(state.pipettes)
@@ -256,13 +375,39 @@ class StateStore(StateView, ActionHandler):
             module_view=self._modules,
         )
 
-    def _update_state_views(self) -> None:
-        """Update state view interfaces to use latest underlying values."""
+    def _update_state_views(
+        self,
+        changed_substores: Sequence[HandlesActions],
+        topics: Collection[StateTopic],
+    ) -> None:
+        """Update state view interfaces to use latest underlying values.
+
+        Only views of substores that were changed are touched.
+        """
         next_state = self._get_next_state()
         self._state = next_state
-        self._commands._state = next_state.commands
-        self._labware._state = next_state.labware
-        self._pipettes._state = next_state.pipettes
-        self._modules._state = next_state.modules
-        self._liquid._state = next_state.liquids
-        self._change_notifier.notify()
+        self._version += 1
+        self._summary = None
+
+        if self._command_store in changed_substores:
+            self._commands._state = next_state.commands
+        if self._labware_store in changed_substores:
+            self._labware._state = next_state.labware
+        if self._pipette_store in changed_substores:
+            self._pipettes._state = next_state.pipettes
+        if self._module_store in changed_substores:
+            self._modules._state = next_state.modules
+        if self._liquid_store in changed_substores:
+            self._liquid._state = next_state.liquids
+
+        self._change_notifier.notify(topics=topics)
+
+
+def _get_topics(action: Action) -> Sequence[StateTopic]:
+    """Get the topics of the change notification for an action."""
+    if isinstance(action, UpdateCommandAction):
+        return (UpdateCommandAction, action.command.id)
+    elif isinstance(action, FailCommandAction):
+        return (FailCommandAction, action.command_id)
+    else:
+        return (type(action),)
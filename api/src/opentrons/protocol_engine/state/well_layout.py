@@ -0,0 +1,44 @@
+"""Precomputed well layout of a labware definition."""
+import re
+from dataclasses import dataclass
+from typing import Dict, List
+
+from opentrons_shared_data.labware.constants import WELL_NAME_PATTERN
+from opentrons.protocols.models import LabwareDefinition
+
+_WELL_NAME_REGEX = re.compile(WELL_NAME_PATTERN, re.X)
+
+
+@dataclass(frozen=True)
+class WellLayout:
+    """The names of a labware definition's wells, in order and by row and column.
+
+    These lists must not be modified.
+
+    Attributes:
+        names: Each well's name, in the definition's order, column by column.
+        rows: The names of the wells in each row, by row name, e.g. "A".
+        columns: The names of the wells in each column, by column name, e.g. "1".
+    """
+
+    names: List[str]
+    rows: Dict[str, List[str]]
+    columns: Dict[str, List[str]]
+
+
+def create_well_layout(definition: LabwareDefinition) -> WellLayout:
+    """Build the well layout of a labware definition."""
+    names: List[str] = []
+    rows: Dict[str, List[str]] = {}
+    columns: Dict[str, List[str]] = {}
+
+    for column_index, column in enumerate(definition.ordering):
+        columns[f"{column_index + 1}"] = list(column)
+
+        for well_name in column:
+            match = _WELL_NAME_REGEX.match(well_name)
+            assert match, f"Well name did not match pattern {_WELL_NAME_REGEX}"
+            rows.setdefault(match.group(1), []).append(well_name)
+            names.append(well_name)
+
+    return WellLayout(names=names, rows=rows, columns=columns)
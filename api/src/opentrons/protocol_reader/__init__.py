@@ -4,6 +4,7 @@ from .protocol_reader import ProtocolReader, ProtocolFilesInvalidError
 from .input_file import AbstractInputFile
 from .protocol_source import (
     ProtocolSource,
+    ProtocolSourceSummary,
     ProtocolSourceFile,
     ProtocolFileRole,
     ProtocolType,
@@ -20,6 +21,7 @@ __all__ = [
     "ProtocolFilesInvalidError",
     # values and types
     "ProtocolSource",
+    "ProtocolSourceSummary",
     "ProtocolSourceFile",
     "ProtocolFileRole",
     "ProtocolType",
@@ -6,7 +6,8 @@ from .input_file import AbstractInputFile
 from .file_reader_writer import FileReaderWriter, FileReadError
 from .role_analyzer import RoleAnalyzer, RoleAnalysisFile, RoleAnalysisError
 from .config_analyzer import ConfigAnalyzer, ConfigAnalysisError
-from .protocol_source import ProtocolSource, ProtocolSourceFile
+from .summary_reader import SummaryReader
+from .protocol_source import ProtocolSource, ProtocolSourceFile, ProtocolSourceSummary
 
 
 class ProtocolFilesInvalidError(ValueError):
@@ -21,6 +22,7 @@ class ProtocolReader:
         file_reader_writer: Optional[FileReaderWriter] = None,
         role_analyzer: Optional[RoleAnalyzer] = None,
         config_analyzer: Optional[ConfigAnalyzer] = None,
+        summary_reader: Optional[SummaryReader] = None,
     ) -> None:
         """Initialize the reader with its dependencies.
 
@@ -29,10 +31,12 @@ class ProtocolReader:
             file_reader_writer: Input file reader/writer. Default impl. used if None.
             role_analyzer: File role analyzer. Default impl. used if None.
             config_analyzer: Protocol config analyzer. Default impl. used if None.
+            summary_reader: Protocol summary reader. Default impl. used if None.
         """
         self._file_reader_writer = file_reader_writer or FileReaderWriter()
         self._role_analyzer = role_analyzer or RoleAnalyzer()
         self._config_analyzer = config_analyzer or ConfigAnalyzer()
+        self._summary_reader = summary_reader or SummaryReader()
 
     async def read_and_save(
         self, files: Sequence[AbstractInputFile], directory: Path
@@ -129,3 +133,33 @@ class ProtocolReader:
             metadata=config_analysis.metadata,
             labware_definitions=role_analysis.labware_definitions,
         )
+
+    async def read_saved_summary(
+        self,
+        files: Sequence[Path],
+        directory: Optional[Path],
+    ) -> ProtocolSourceSummary:
+        """Compute a `ProtocolSourceSummary` from protocol source files on the filesystem.
+
+        This finds the same files, config, and metadata as `read_saved`,
+        but only reads as much of each JSON file as it needs to,
+        so large JSON protocols can be listed without loading them into memory.
+        The files are not fully validated, so protocols that this accepts
+        may still be rejected by `read_saved`.
+
+        Arguments:
+            files: The files comprising the protocol.
+            directory: Passed through to `ProtocolSourceSummary.directory`.
+                Otherwise unused.
+
+        Returns:
+            A ProtocolSourceSummary.
+
+        Raises:
+            ProtocolFilesInvalidError: Input file list given to the reader
+                could not be identified as a protocol.
+        """
+        try:
+            return await self._summary_reader.read(files=files, directory=directory)
+        except (FileReadError, RoleAnalysisError, ConfigAnalysisError) as e:
+            raise ProtocolFilesInvalidError(str(e)) from e
@@ -115,3 +115,25 @@ class ProtocolSource:
     metadata: Metadata
     config: ProtocolConfig
     labware_definitions: List[LabwareDefinition]
+
+
+@dataclass(frozen=True)
+class ProtocolSourceSummary:
+    """The parts of a `ProtocolSource` that can be read without parsing every file.
+
+    This is enough to list a protocol, but not to run or analyze it.
+
+    Attributes:
+        directory: The directory containing the protocol files
+            (and only the protocol files), or ``None`` if this is unknown.
+        main_file: The location of the protocol's main file on disk.
+        files: Descriptions of all files that make up the protocol.
+        metadata: Arbitrary metadata specified by the protocols.
+        config: Protocol execution configuration.
+    """
+
+    directory: Optional[Path]
+    main_file: Path
+    files: List[ProtocolSourceFile]
+    metadata: Metadata
+    config: ProtocolConfig
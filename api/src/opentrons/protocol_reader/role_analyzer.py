@@ -79,22 +79,11 @@ class RoleAnalyzer:
                     )
                 )
 
-        if len(main_file_candidates) == 0:
-            if len(files) == 1:
-                raise RoleAnalysisError(
-                    f'"{files[0].name}" is not a valid protocol file.'
-                )
-            else:
-                file_list = ", ".join(f'"{f.name}"' for f in files)
-                raise RoleAnalysisError(f"No valid protocol file found in {file_list}.")
-
-        elif len(main_file_candidates) > 1:
-            file_list = ", ".join(f'"{f.name}"' for f in main_file_candidates)
-            raise RoleAnalysisError(
-                f"Could not pick single main file from {file_list}."
-            )
-        else:
-            main_file = main_file_candidates[0]
+        check_main_file_candidates(
+            candidate_names=[f.name for f in main_file_candidates],
+            file_names=[f.name for f in files],
+        )
+        main_file = main_file_candidates[0]
 
         # ignore extra custom labware files for JSON protocols, while
         # maintaining a reference to the protocol's labware
@@ -109,3 +98,27 @@ class RoleAnalyzer:
             labware_files=labware_files,
             labware_definitions=labware_definitions,
         )
+
+
+def check_main_file_candidates(
+    candidate_names: Sequence[str], file_names: Sequence[str]
+) -> None:
+    """Check that exactly one of a protocol's files could be its main file.
+
+    Arguments:
+        candidate_names: The names of the files that could be the main file.
+        file_names: The names of all the protocol's files.
+
+    Raises:
+        RoleAnalysisError: There is no main file candidate, or more than one.
+    """
+    if len(candidate_names) == 0:
+        if len(file_names) == 1:
+            raise RoleAnalysisError(f'"{file_names[0]}" is not a valid protocol file.')
+        else:
+            file_list = ", ".join(f'"{name}"' for name in file_names)
+            raise RoleAnalysisError(f"No valid protocol file found in {file_list}.")
+
+    elif len(candidate_names) > 1:
+        file_list = ", ".join(f'"{name}"' for name in candidate_names)
+        raise RoleAnalysisError(f"Could not pick single main file from {file_list}.")
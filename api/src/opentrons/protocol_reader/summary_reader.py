@@ -0,0 +1,298 @@
+"""Protocol summary reading, without parsing every file in full."""
+import codecs
+import json.decoder
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from anyio import Path as AsyncPath, create_task_group, open_file
+from pydantic import ValidationError
+
+from opentrons_shared_data.protocol.models import ProtocolSchemaV6
+from opentrons_shared_data.protocol.models.protocol_schema_v6 import (
+    Metadata as MetadataV6,
+)
+from opentrons.protocols.models import JsonProtocol as ProtocolSchemaV5
+from opentrons.protocols.models.json_protocol import Metadata as MetadataV5
+
+from .file_reader_writer import FileReaderWriter
+from .role_analyzer import MainFile, check_main_file_candidates
+from .config_analyzer import ConfigAnalyzer, ConfigAnalysis
+from .protocol_source import (
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolSourceFile,
+    ProtocolSourceSummary,
+)
+
+
+PEEK_SIZE = 16 * 1024
+"""How many bytes of each JSON file to read before falling back to a full parse."""
+
+# Top-level keys that only appear in labware definitions or only in JSON protocols.
+# Protocol Designer writes a protocol's schemaVersion and metadata before its
+# (potentially very large) labware definitions and commands.
+_LABWARE_KEYS = frozenset({"ordering", "wells", "cornerOffsetFromSlot"})
+_PROTOCOL_KEYS = frozenset(
+    {"$otSharedSchema", "robot", "pipettes", "labwareDefinitions", "commands"}
+)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_SCALAR = re.compile(r"[-+.0-9eE]+|true|false|null")
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_decoder = json.decoder.JSONDecoder()
+
+# Decodes the JSON string whose contents start at the given index,
+# returning the string and the index just past its closing quote
+_scanstring: Callable[
+    [str, int], Tuple[str, int]
+] = json.decoder.scanstring  # type: ignore[attr-defined]
+
+
+@dataclass(frozen=True)
+class _SummarizedFile:
+    """A file's role in a protocol, and its config analysis if it's a JSON protocol."""
+
+    path: Path
+    role: Optional[ProtocolFileRole]
+    config_analysis: Optional[ConfigAnalysis] = None
+
+
+class SummaryReader:
+    """Protocol summary reading interface."""
+
+    @staticmethod
+    async def read(
+        files: Sequence[Path], directory: Optional[Path]
+    ) -> ProtocolSourceSummary:
+        """Read a protocol's files, config, and metadata.
+
+        Python files are identified by their extension. JSON files are
+        identified, and a JSON protocol's config and metadata read, from the
+        first `PEEK_SIZE` bytes of each file, if they're there. Otherwise,
+        the file is parsed in full.
+
+        Unlike `ProtocolReader.read_saved()`, this does not validate
+        a JSON file beyond what it needs to find these things.
+
+        Raises:
+            FileReadError: A JSON file could not be identified.
+            RoleAnalysisError: A single main file could not be picked.
+            ConfigAnalysisError: The main file's config could not be read.
+        """
+        summarized_files: List[Optional[_SummarizedFile]] = [None for f in files]
+
+        async def _summarize(path: Path, index: int) -> None:
+            summarized_files[index] = await _summarize_file(path)
+
+        async with create_task_group() as tg:
+            for index, path in enumerate(files):
+                tg.start_soon(_summarize, path, index)
+
+        main_file_candidates: List[_SummarizedFile] = []
+        labware_files: List[_SummarizedFile] = []
+
+        for f in summarized_files:
+            assert f is not None, "Expected all files to be summarized"
+            if f.role == ProtocolFileRole.MAIN:
+                main_file_candidates.append(f)
+            elif f.role == ProtocolFileRole.LABWARE:
+                labware_files.append(f)
+
+        check_main_file_candidates(
+            candidate_names=[f.path.name for f in main_file_candidates],
+            file_names=[path.name for path in files],
+        )
+        main_file = main_file_candidates[0]
+
+        # JSON protocols carry their own labware, so extra labware files are ignored
+        if main_file.config_analysis is not None:
+            config_analysis = main_file.config_analysis
+            labware_files = []
+        else:
+            contents = await AsyncPath(main_file.path).read_bytes()
+            config_analysis = ConfigAnalyzer.analyze(
+                MainFile(
+                    name=main_file.path.name, contents=contents, path=main_file.path
+                )
+            )
+
+        return ProtocolSourceSummary(
+            directory=directory,
+            main_file=main_file.path,
+            files=[
+                ProtocolSourceFile(path=f.path, role=f.role)  # type: ignore[arg-type]
+                for f in [main_file, *labware_files]
+            ],
+            metadata=config_analysis.metadata,
+            config=config_analysis.config,
+        )
+
+
+async def _summarize_file(path: Path) -> _SummarizedFile:
+    name = path.name.lower()
+
+    if name.endswith(".py"):
+        return _SummarizedFile(path=path, role=ProtocolFileRole.MAIN)
+
+    if not name.endswith(".json"):
+        return _SummarizedFile(path=path, role=None)
+
+    async with await open_file(path, "rb") as f:
+        prefix = await f.read(PEEK_SIZE)
+
+    return _summarize_json_prefix(path, prefix) or await _summarize_json_file(path)
+
+
+def _summarize_json_prefix(path: Path, prefix: bytes) -> Optional[_SummarizedFile]:
+    try:
+        # An incremental decoder leaves off a multi-byte character cut by the prefix
+        text = codecs.getincrementaldecoder("utf-8")().decode(prefix)
+    except UnicodeDecodeError:
+        return None
+
+    keys, values = _peek_json_object(text, wanted_keys={"schemaVersion", "metadata"})
+
+    if keys & _LABWARE_KEYS:
+        return _SummarizedFile(path=path, role=ProtocolFileRole.LABWARE)
+
+    if not keys & _PROTOCOL_KEYS:
+        return None
+
+    schema_version = values.get("schemaVersion")
+    raw_metadata = values.get("metadata")
+    metadata_model = (
+        MetadataV6
+        if schema_version == 6
+        else MetadataV5
+        if schema_version in (1, 2, 3, 4, 5)
+        else None
+    )
+
+    if metadata_model is None or not isinstance(raw_metadata, dict):
+        return None
+
+    try:
+        metadata = metadata_model.parse_obj(raw_metadata).dict(exclude_none=True)
+    except ValidationError:
+        return None
+
+    assert isinstance(schema_version, int)
+    return _SummarizedFile(
+        path=path,
+        role=ProtocolFileRole.MAIN,
+        config_analysis=ConfigAnalysis(
+            metadata=metadata,
+            config=JsonProtocolConfig(schema_version=schema_version),
+        ),
+    )
+
+
+async def _summarize_json_file(path: Path) -> _SummarizedFile:
+    buffered_file = (await FileReaderWriter.read([path]))[0]
+
+    if isinstance(buffered_file.data, (ProtocolSchemaV5, ProtocolSchemaV6)):
+        return _SummarizedFile(
+            path=path,
+            role=ProtocolFileRole.MAIN,
+            config_analysis=ConfigAnalyzer.analyze(
+                MainFile(
+                    name=buffered_file.name,
+                    contents=buffered_file.contents,
+                    path=path,
+                    data=buffered_file.data,
+                )
+            ),
+        )
+
+    return _SummarizedFile(path=path, role=ProtocolFileRole.LABWARE)
+
+
+def _peek_json_object(
+    text: str, wanted_keys: Set[str]
+) -> Tuple[Set[str], Dict[str, Any]]:
+    """Find the top-level keys of a JSON object from the start of its text.
+
+    Values are skipped without being decoded, except for those of `wanted_keys`.
+    Scanning stops at the end of the text or at anything unexpected.
+
+    Returns:
+        Every top-level key found, and the values found for `wanted_keys`.
+    """
+    keys: Set[str] = set()
+    values: Dict[str, Any] = {}
+    index = _skip_whitespace(text, 0)
+
+    if not text.startswith("{", index):
+        return keys, values
+
+    index += 1
+
+    try:
+        while True:
+            index = _skip_whitespace(text, index)
+            if text[index] != '"':
+                break
+
+            key, index = _scanstring(text, index + 1)
+            keys.add(key)
+            index = _skip_whitespace(text, index)
+            if text[index] != ":":
+                break
+
+            index = _skip_whitespace(text, index + 1)
+            if key in wanted_keys:
+                values[key], index = _decoder.raw_decode(text, index)
+            else:
+                index = _skip_value(text, index)
+
+            index = _skip_whitespace(text, index)
+            if text[index] != ",":
+                break
+
+            index += 1
+
+    # Raised when the text ends mid-value, or is not valid JSON
+    except (IndexError, ValueError):
+        pass
+
+    return keys, values
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    match = _WHITESPACE.match(text, index)
+    assert match is not None, "Whitespace pattern always matches"
+    return match.end()
+
+
+def _skip_value(text: str, index: int) -> int:
+    """Get the index just past the JSON value that starts at `index`."""
+    if text[index] == '"':
+        return _scanstring(text, index + 1)[1]
+
+    if text[index] not in "[{":
+        match = _SCALAR.match(text, index)
+        if match is None:
+            raise ValueError(f"Unexpected character at index {index}.")
+        return match.end()
+
+    depth = 0
+
+    while True:
+        match = _STRUCTURAL.search(text, index)
+        if match is None:
+            raise IndexError("Text ended before the end of the value.")
+
+        index = match.start()
+        char = text[index]
+
+        if char == '"':
+            index = _scanstring(text, index + 1)[1]
+            continue
+
+        depth += 1 if char in "[{" else -1
+        index += 1
+
+        if depth == 0:
+            return index
@@ -4,10 +4,14 @@ The main export of this module is the ProtocolRunner class. See
 protocol_runner.py for more details.
 """
 from .protocol_runner import ProtocolRunner, ProtocolRunResult
-from .create_simulating_runner import create_simulating_runner
+from .create_simulating_runner import (
+    create_simulating_runner,
+    SimulatingRunnerFactory,
+)
 
 __all__ = [
     "ProtocolRunner",
     "ProtocolRunResult",
     "create_simulating_runner",
+    "SimulatingRunnerFactory",
 ]
@@ -1,11 +1,14 @@
 """Simulating ProtocolRunner factory."""
+from typing import List
 
+from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
 from opentrons.config import feature_flags
 from opentrons.hardware_control import API as HardwareAPI, HardwareControlAPI
 from opentrons.protocol_engine import (
     Config as ProtocolEngineConfig,
     create_protocol_engine,
 )
+from opentrons.protocol_engine.resources import DeckDataProvider, DeckFixedLabware
 
 from .legacy_wrappers import LegacySimulatingContextCreator
 from .protocol_runner import ProtocolRunner
@@ -14,6 +17,9 @@ from .protocol_runner import ProtocolRunner
 async def create_simulating_runner() -> ProtocolRunner:
     """Create a ProtocolRunner wired to a simulating HardwareControlAPI.
 
+    To create many simulating runners, one after another, use a
+    `SimulatingRunnerFactory` instead.
+
     Example:
         ```python
         from pathlib import Path
@@ -34,34 +40,92 @@ async def create_simulating_runner() -> ProtocolRunner:
         commands: List[Command] = await runner.run(protocol)
         ```
     """
-    if feature_flags.enable_ot3_hardware_controller():
-        # Inline import because OT3API is not safe to import on an OT2 system
-        from opentrons.hardware_control.ot3api import OT3API
+    factory = await SimulatingRunnerFactory.build()
+    return await factory.create_runner()
+
+
+class SimulatingRunnerFactory:
+    """Create simulating ProtocolRunners that share a single simulated robot.
+
+    Building a simulating HardwareControlAPI and loading the deck is
+    a large part of the setup time for a short protocol's simulation.
+    A factory does this once, then resets the simulated robot to a clean,
+    homed state for each runner it creates.
+
+    Each runner must finish its run before the next runner is created.
+    The factory, and every runner it creates, must be used in the event
+    loop that built the factory.
+
+    Example:
+        ```python
+        factory = await SimulatingRunnerFactory.build()
+
+        for protocol_source in protocol_sources:
+            runner = await factory.create_runner()
+            result = await runner.run(protocol_source)
+        ```
+    """
+
+    def __init__(
+        self,
+        hardware_api: HardwareControlAPI,
+        deck_definition: DeckDefinitionV3,
+        deck_fixed_labware: List[DeckFixedLabware],
+    ) -> None:
+        """Initialize the factory with its simulated robot.
+
+        Use `SimulatingRunnerFactory.build` rather than calling this directly.
+        """
+        self._hardware_api = hardware_api
+        self._deck_definition = deck_definition
+        self._deck_fixed_labware = deck_fixed_labware
+
+    @classmethod
+    async def build(cls) -> "SimulatingRunnerFactory":
+        """Build a simulating HardwareControlAPI, and load the deck."""
+        if feature_flags.enable_ot3_hardware_controller():
+            # Inline import because OT3API is not safe to import on an OT2 system
+            from opentrons.hardware_control.ot3api import OT3API
+
+            hardware_api: HardwareControlAPI = await OT3API.build_hardware_simulator()
+        else:
+            hardware_api = await HardwareAPI.build_hardware_simulator()
+
+        deck_data = DeckDataProvider()
+        deck_definition = await deck_data.get_deck_definition()
+        deck_fixed_labware = await deck_data.get_deck_fixed_labware(deck_definition)
+
+        return cls(
+            hardware_api=hardware_api,
+            deck_definition=deck_definition,
+            deck_fixed_labware=deck_fixed_labware,
+        )
+
+    async def create_runner(self) -> ProtocolRunner:
+        """Reset the simulated robot, and create a fresh runner for it."""
+        # Forget attached pipettes, tips, and pause state left behind by
+        # a previous run, and home. This is what a freshly built simulator
+        # would do before its first run.
+        # TODO(mc, 2021-08-25): move initial home to protocol engine
+        await self._hardware_api.stop(home_after=True)
+
+        protocol_engine = await create_protocol_engine(
+            hardware_api=self._hardware_api,
+            config=ProtocolEngineConfig(
+                ignore_pause=True,
+                use_virtual_modules=True,
+            ),
+            deck_definition=self._deck_definition,
+            deck_fixed_labware=self._deck_fixed_labware,
+        )
+
+        simulating_legacy_context_creator = LegacySimulatingContextCreator(
+            hardware_api=self._hardware_api,
+            protocol_engine=protocol_engine,
+        )
 
-        simulating_hardware_api: HardwareControlAPI = (
-            await OT3API.build_hardware_simulator()
+        return ProtocolRunner(
+            protocol_engine=protocol_engine,
+            hardware_api=self._hardware_api,
+            legacy_context_creator=simulating_legacy_context_creator,
         )
-    else:
-        simulating_hardware_api = await HardwareAPI.build_hardware_simulator()
-
-    # TODO(mc, 2021-08-25): move initial home to protocol engine
-    await simulating_hardware_api.home()
-
-    protocol_engine = await create_protocol_engine(
-        hardware_api=simulating_hardware_api,
-        config=ProtocolEngineConfig(
-            ignore_pause=True,
-            use_virtual_modules=True,
-        ),
-    )
-
-    simulating_legacy_context_creator = LegacySimulatingContextCreator(
-        hardware_api=simulating_hardware_api,
-        protocol_engine=protocol_engine,
-    )
-
-    return ProtocolRunner(
-        protocol_engine=protocol_engine,
-        hardware_api=simulating_hardware_api,
-        legacy_context_creator=simulating_legacy_context_creator,
-    )
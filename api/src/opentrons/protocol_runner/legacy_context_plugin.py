@@ -129,8 +129,12 @@ class LegacyContextPlugin(AbstractPlugin):
     async def _dispatch_all_actions(self) -> None:
         """Dispatch all actions to the `ProtocolEngine`.
 
+        Actions are dispatched in batches of everything reported since the
+        last dispatch, so a protocol reporting activity faster than the
+        ProtocolEngine can handle it one action at a time doesn't fall behind.
+
         Exits only when `self._actions_to_dispatch` is closed
         (or an unexpected exception is raised).
         """
-        async for action in self._actions_to_dispatch.get_async_until_closed():
-            self.dispatch(action)
+        async for batch in self._actions_to_dispatch.get_batch_async_until_closed():
+            self.dispatch_batch(batch)
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from collections import deque
 from threading import Condition
-from typing import AsyncIterable, Deque, Generic, Iterable, TypeVar
+from typing import AsyncIterable, Deque, Generic, Iterable, List, TypeVar
 
 from anyio.to_thread import run_sync
 
@@ -88,6 +88,44 @@ class ThreadAsyncQueue(Generic[_T]):
             except QueueClosed:
                 break
 
+    def get_batch(self) -> List[_T]:
+        """Remove and return every value currently in the queue, in order.
+
+        If the queue is empty, this blocks until a new value is available,
+        so the returned list always has at least one value.
+        Taking values in batches lets a consumer that's slower than its producer
+        catch up, without paying the cost of a `get()` for every value.
+        If you're calling from an async task, use one of the async methods instead
+        to avoid blocking the event loop.
+
+        Raises:
+            QueueClosed: If all values have been consumed
+                and the queue has been closed with `done_putting()`.
+        """
+        with self._condition:
+            while True:
+                if len(self._deque) > 0:
+                    batch = list(self._deque)
+                    self._deque.clear()
+                    return batch
+                elif self._is_closed:
+                    raise QueueClosed("Queue closed; no more items to get.")
+                else:
+                    self._condition.wait()
+
+    def get_batch_until_closed(self) -> Iterable[List[_T]]:
+        """Remove and return batches of values from the queue until it's closed.
+
+        Example:
+            for batch in queue.get_batch_until_closed():
+                print(len(batch))
+        """
+        while True:
+            try:
+                yield self.get_batch()
+            except QueueClosed:
+                break
+
     async def get_async(self) -> _T:
         """Like `get()`, except yield to the event loop while waiting.
 
@@ -125,6 +163,33 @@ class ThreadAsyncQueue(Generic[_T]):
             except QueueClosed:
                 break
 
+    async def get_batch_async(self) -> List[_T]:
+        """Like `get_batch()`, except yield to the event loop while waiting.
+
+        Warning:
+            Like `get_async()`, a waiting `get_batch_async()`
+            won't be interrupted by an async cancellation.
+        """
+        # See get_async() for why this isn't cancellable.
+        return await run_sync(self.get_batch, cancellable=False)
+
+    async def get_batch_async_until_closed(self) -> AsyncIterable[List[_T]]:
+        """Like `get_batch_until_closed()`, except yield to the event loop while waiting.
+
+        Example:
+            async for batch in queue.get_batch_async_until_closed():
+                print(len(batch))
+
+        Warning:
+            Like `get_async_until_closed()`, this won't be interrupted
+            by an async cancellation while it's waiting for new values.
+        """
+        while True:
+            try:
+                yield await self.get_batch_async()
+            except QueueClosed:
+                break
+
     def done_putting(self) -> None:
         """Close the queue, i.e. signal that no more values will be `put()`.
 
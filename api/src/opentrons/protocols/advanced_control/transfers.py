@@ -424,9 +424,6 @@ class TransferPlan:
 
         total_xfers = max(len(sources), len(dests))
 
-        self._volumes = self._create_volume_list(volume, total_xfers)
-        self._sources = sources
-        self._dests = dests
         self._options = options or TransferOptions()
         self._strategy = self._options.transfer
         self._tip_opts = self._options.pick_up_tip
@@ -435,12 +432,23 @@ class TransferPlan:
         self._mix_before_opts = self._options.mix.mix_before
         self._mix_after_opts = self._options.mix.mix_after
         self._max_volume = max_volume
+        self._volumes = self._create_volume_list(volume, total_xfers)
+        self._sources = sources
+        self._dests = dests
+
+        # The options are fixed for the whole plan, so filter them into
+        # command kwargs once, rather than once per emitted command
+        self._tip_kwargs = self._format_kwargs(self._tip_opts)
+        self._blow_kwargs = self._format_kwargs(self._blow_opts)
+        self._touch_tip_kwargs = self._format_kwargs(self._touch_tip_opts)
+        self._mix_before_kwargs = self._format_kwargs(self._mix_before_opts)
+        self._mix_after_kwargs = self._format_kwargs(self._mix_after_opts)
 
         self._mode = TransferMode[mode.upper()]
 
     def __iter__(self):
         if self._strategy.new_tip == types.TransferTipPolicy.ONCE:
-            yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
+            yield self._format_dict("pick_up_tip", kwargs=self._tip_kwargs)
         yield from {
             TransferMode.CONSOLIDATE: self._plan_consolidate,
             TransferMode.DISTRIBUTE: self._plan_distribute,
@@ -483,6 +491,25 @@ class TransferPlan:
             -> Touch tip -> Dispense air gap -> Dispense -> Mix if empty ->
             -> Blow out -> Touch tip -> Drop tip*
         """
+        for step_vols, src, dest in self._split_transfer_steps():
+            if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
+                yield self._format_dict("pick_up_tip", kwargs=self._tip_kwargs)
+            for vol in step_vols:
+                yield from self._aspirate_actions(vol, src)
+                yield from self._dispense_actions(vol=vol, dest=dest, src=src)
+            yield from self._new_tip_action()
+
+    def _split_transfer_steps(
+        self,
+    ) -> List[
+        Tuple[List[float], Union[Well, types.Location], Union[Well, types.Location]]
+    ]:
+        """Pair up sources and destinations, and split each transfer's volume.
+
+        Returns:
+            For each source and destination pair, the volumes of the
+            aspirate and dispense cycles that move its liquid.
+        """
         # reform source target lists
         sources, dests = self._extend_source_target_lists(self._sources, self._dests)
         plan_iter = self._expand_for_volume_constraints(
@@ -492,23 +519,21 @@ class TransferPlan:
             - self._strategy.disposal_volume
             - self._strategy.air_gap,
         )
+        max_vol = (
+            self._max_volume - self._strategy.disposal_volume - self._strategy.air_gap
+        )
+        steps = []
         for step_vol, (src, dest) in plan_iter:
-            if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
-                yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
-            max_vol = (
-                self._max_volume
-                - self._strategy.disposal_volume
-                - self._strategy.air_gap
-            )
+            step_vols = []
             xferred_vol = 0.0
             while xferred_vol < step_vol:
                 # TODO: account for unequal length sources, dests
                 # TODO: ensure last transfer is > min_vol
                 vol = min(max_vol, step_vol - xferred_vol)
-                yield from self._aspirate_actions(vol, src)
-                yield from self._dispense_actions(vol=vol, dest=dest, src=src)
+                step_vols.append(vol)
                 xferred_vol += vol
-            yield from self._new_tip_action()
+            steps.append((step_vols, src, dest))
+        return steps
 
     @staticmethod
     def _extend_source_target_lists(
@@ -576,51 +601,34 @@ class TransferPlan:
         # recommend users to specify a disposal vol when using distribute.
         # First method keeps distribute consistent with current behavior while
         # the other maintains consistency in default behaviors of all functions
-        plan_iter = self._expand_for_volume_constraints(
-            self._volumes,
-            self._dests,
-            # todo(mm, 2021-03-09): Is it right for this to be
-            # _instr_.max_volume? Does/should this take the tip maximum volume
-            # into account?
-            self._instr.max_volume
-            - self._strategy.disposal_volume
-            - self._strategy.air_gap,
+        plan = list(
+            self._expand_for_volume_constraints(
+                self._volumes,
+                self._dests,
+                # todo(mm, 2021-03-09): Is it right for this to be
+                # _instr_.max_volume? Does/should this take the tip maximum
+                # volume into account?
+                self._instr.max_volume
+                - self._strategy.disposal_volume
+                - self._strategy.air_gap,
+            )
         )
+        groups = self._group_for_max_volume(plan, air_gap_per_step=False)
 
-        done = False
-        current_xfer = next(plan_iter)
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
-            yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
-        while not done:
-            asp_grouped: List[Tuple[float, Well]] = []
-            try:
-                while (
-                    sum(a[0] for a in asp_grouped)
-                    + self._strategy.disposal_volume
-                    + self._strategy.air_gap
-                    + current_xfer[0]
-                ) <= self._max_volume:
-                    append_xfer = self._check_volume_not_zero(
-                        self._api_version, current_xfer[0]
-                    )
-                    if append_xfer:
-                        asp_grouped.append(current_xfer)
-                    current_xfer = next(plan_iter)
-            except StopIteration:
-                done = True
-            if not asp_grouped:
-                break
-
+            yield self._format_dict("pick_up_tip", kwargs=self._tip_kwargs)
+        for asp_grouped, group_volume in groups:
             yield from self._aspirate_actions(
-                sum(a[0] for a in asp_grouped) + self._strategy.disposal_volume,
+                group_volume + self._strategy.disposal_volume,
                 self._sources[0],
             )
-            for step in asp_grouped:
+            last_step = len(asp_grouped) - 1
+            for index, (vol, dest) in enumerate(asp_grouped):
                 yield from self._dispense_actions(
-                    vol=step[0],
+                    vol=vol,
                     src=self._sources[0],
-                    dest=step[1],
-                    is_disp_next=step is not asp_grouped[-1],
+                    dest=dest,
+                    is_disp_next=index != last_step,
                 )
         yield from self._new_tip_action()
 
@@ -643,6 +651,45 @@ class TransferPlan:
                 yield volume, target
             yield volume, target
 
+    def _group_for_max_volume(
+        self, plan: List[Tuple[float, Target]], air_gap_per_step: bool
+    ) -> List[Tuple[List[Tuple[float, Target]], float]]:
+        """Group consecutive steps of a plan to share an aspirate or dispense.
+
+        Each group holds as many steps as fit in the max volume, along with
+        the disposal volume, and either one air gap, or one air gap for each
+        step already in the group. Steps with no volume are skipped, from API
+        version 2.8. Grouping stops at the first step that doesn't fit in an
+        empty group.
+
+        Returns:
+            Each group's steps, along with the total volume of those steps.
+        """
+        groups = []
+        index = 0
+        while index < len(plan):
+            group: List[Tuple[float, Any]] = []
+            group_volume: float = 0
+            while index < len(plan):
+                air_gap = self._strategy.air_gap
+                if air_gap_per_step:
+                    air_gap *= len(group)
+                if (
+                    group_volume
+                    + self._strategy.disposal_volume
+                    + air_gap
+                    + plan[index][0]
+                ) > self._max_volume:
+                    break
+                if self._check_volume_not_zero(self._api_version, plan[index][0]):
+                    group.append(plan[index])
+                    group_volume += plan[index][0]
+                index += 1
+            if not group:
+                break
+            groups.append((group, group_volume))
+        return groups
+
     def _plan_consolidate(self):
         """
         * **Source/ Dest:** Many sources to one destination
@@ -680,37 +727,21 @@ class TransferPlan:
                *.. Aspirate -> Air gap -> Touch tip ->..
                .. Aspirate -> .....*
         """
-        plan_iter = self._expand_for_volume_constraints(
-            # todo(mm, 2021-03-09): Is it right to use _instr.max_volume here?
-            # Why don't we account for tip max volume, disposal volume, or air
-            # gap?
-            self._volumes,
-            self._sources,
-            self._instr.max_volume,
+        plan = list(
+            self._expand_for_volume_constraints(
+                # todo(mm, 2021-03-09): Is it right to use _instr.max_volume
+                # here? Why don't we account for tip max volume, disposal
+                # volume, or air gap?
+                self._volumes,
+                self._sources,
+                self._instr.max_volume,
+            )
         )
-        current_xfer = next(plan_iter)
+        groups = self._group_for_max_volume(plan, air_gap_per_step=True)
+
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
-            yield self._format_dict("pick_up_tip", kwargs=self._tip_opts)
-        done = False
-        while not done:
-            asp_grouped: List[Tuple[float, Well]] = []
-            try:
-                while (
-                    sum([a[0] for a in asp_grouped])
-                    + self._strategy.disposal_volume
-                    + self._strategy.air_gap * len(asp_grouped)
-                    + current_xfer[0]
-                ) <= self._max_volume:
-                    append_xfer = self._check_volume_not_zero(
-                        self._api_version, current_xfer[0]
-                    )
-                    if append_xfer:
-                        asp_grouped.append(current_xfer)
-                    current_xfer = next(plan_iter)
-            except StopIteration:
-                done = True
-            if not asp_grouped:
-                break
+            yield self._format_dict("pick_up_tip", kwargs=self._tip_kwargs)
+        for asp_grouped, _ in groups:
             # Q: What accounts as disposal volume in a consolidate action?
             # yield self._format_dict('aspirate',
             #                         self._strategy.disposal_volume, loc)
@@ -741,15 +772,15 @@ class TransferPlan:
             or self._strategy.mix_strategy == MixStrategy.BOTH
         ):
             if self._instr.current_volume == 0:
-                mix_before_opts = self._mix_before_opts._asdict()
-                mix_before_opts["location"] = loc
-                yield self._format_dict("mix", kwargs=mix_before_opts)
+                yield self._format_dict(
+                    "mix", kwargs=self._with_location(self._mix_before_kwargs, loc)
+                )
 
     def _after_aspirate(self):
         if self._strategy.air_gap:
             yield self._format_dict("air_gap", [self._strategy.air_gap])
         if self._strategy.touch_tip_strategy == TouchTipStrategy.ALWAYS:
-            yield self._format_dict("touch_tip", kwargs=self._touch_tip_opts)
+            yield self._format_dict("touch_tip", kwargs=self._touch_tip_kwargs)
 
     def _after_dispense(self, dest, src, is_disp_next=False):  # noqa: C901
         # This sequence of actions is subject to change
@@ -762,18 +793,19 @@ class TransferPlan:
                     self._strategy.mix_strategy == MixStrategy.AFTER
                     or self._strategy.mix_strategy == MixStrategy.BOTH
                 ):
-                    mix_after_opts = self._mix_after_opts._asdict()
-                    mix_after_opts["location"] = dest
-                    yield self._format_dict("mix", kwargs=mix_after_opts)
+                    yield self._format_dict(
+                        "mix",
+                        kwargs=self._with_location(self._mix_after_kwargs, dest),
+                    )
             if self._strategy.touch_tip_strategy == TouchTipStrategy.ALWAYS:
-                yield self._format_dict("touch_tip", kwargs=self._touch_tip_opts)
+                yield self._format_dict("touch_tip", kwargs=self._touch_tip_kwargs)
 
             if self._strategy.blow_out_strategy == BlowOutStrategy.SOURCE:
                 yield self._format_dict("blow_out", [src])
             elif self._strategy.blow_out_strategy == BlowOutStrategy.DEST:
                 yield self._format_dict("blow_out", [dest])
             elif self._strategy.blow_out_strategy == BlowOutStrategy.CUSTOM_LOCATION:
-                yield self._format_dict("blow_out", kwargs=self._blow_opts)
+                yield self._format_dict("blow_out", kwargs=self._blow_kwargs)
             elif (
                 self._strategy.blow_out_strategy == BlowOutStrategy.TRASH
                 or self._strategy.disposal_volume
@@ -786,7 +818,7 @@ class TransferPlan:
             if self._strategy.air_gap:
                 yield self._format_dict("air_gap", [self._strategy.air_gap])
             if self._strategy.touch_tip_strategy == TouchTipStrategy.ALWAYS:
-                yield self._format_dict("touch_tip", kwargs=self._touch_tip_opts)
+                yield self._format_dict("touch_tip", kwargs=self._touch_tip_kwargs)
 
     def _new_tip_action(self):
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
@@ -799,18 +831,30 @@ class TransferPlan:
         self,
         method: str,
         args: List = None,
-        kwargs: Union["Dictable", Dict[str, Any]] = None,
+        kwargs: Dict[str, Any] = None,
     ):
-        if kwargs:
-            if isinstance(kwargs, Dict):
-                params = {key: val for key, val in kwargs.items() if val}
-            else:
-                params = {key: val for key, val in kwargs._asdict().items() if val}
-        else:
-            params = {}
+        """Build a command dict.
+
+        `kwargs` must already be filtered by `_format_kwargs`.
+        """
+        if not kwargs:
+            kwargs = {}
         if not args:
             args = []
-        return {"method": method, "args": args, "kwargs": params}
+        return {"method": method, "args": args, "kwargs": kwargs}
+
+    @staticmethod
+    def _format_kwargs(kwargs: Union["Dictable", Dict[str, Any]]) -> Dict[str, Any]:
+        """Drop any unset or falsy options from a command's kwargs."""
+        items = kwargs.items() if isinstance(kwargs, dict) else kwargs._asdict().items()
+        return {key: val for key, val in items if val}
+
+    @staticmethod
+    def _with_location(kwargs: Dict[str, Any], location: Any) -> Dict[str, Any]:
+        params = dict(kwargs)
+        if location:
+            params["location"] = location
+        return params
 
     def _create_volume_list(self, volume, total_xfers):
         if isinstance(volume, (float, int)):
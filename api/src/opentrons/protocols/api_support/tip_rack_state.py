@@ -0,0 +1,128 @@
+"""Compact tip presence state for a tip rack."""
+from typing import List, Optional, Sequence, Tuple
+
+
+class TipRackState:
+    """Which wells of a tip rack hold tips, stored as one bitmask per column.
+
+    Bit ``n`` of a column's mask is set if the ``n``-th well of that column,
+    counting from the back of the rack, holds a tip. Wells are addressed by
+    ``(column, row)`` indices, so this state has no dependency on well objects,
+    and queries only need a handful of integer operations per column.
+
+    Args:
+        column_lengths: The number of wells in each column of the rack.
+        has_tip: Whether every well starts out holding a tip.
+    """
+
+    def __init__(self, column_lengths: Sequence[int], has_tip: bool = True) -> None:
+        self._column_lengths = list(column_lengths)
+        self._full_masks = [(1 << length) - 1 for length in self._column_lengths]
+        self._masks: List[int] = []
+        self.reset(has_tip)
+
+    @classmethod
+    def from_bytes(cls, column_lengths: Sequence[int], data: bytes) -> "TipRackState":
+        """Rebuild a tip rack's state from the output of `to_bytes`."""
+        state = cls(column_lengths, has_tip=False)
+        offset = 0
+        for column, length in enumerate(state._column_lengths):
+            size = _byte_size(length)
+            mask = int.from_bytes(data[offset : offset + size], "little")
+            state._masks[column] = mask & state._full_masks[column]
+            offset += size
+        return state
+
+    def to_bytes(self) -> bytes:
+        """Serialize the tip presence of every well, column by column."""
+        return b"".join(
+            mask.to_bytes(_byte_size(length), "little")
+            for mask, length in zip(self._masks, self._column_lengths)
+        )
+
+    def reset(self, has_tip: bool = True) -> None:
+        """Set every well of the rack as holding or not holding a tip."""
+        self._masks = [mask if has_tip else 0 for mask in self._full_masks]
+
+    def has_tip(self, column: int, row: int) -> bool:
+        """Whether a single well holds a tip."""
+        return bool(self._masks[column] >> row & 1)
+
+    def has_tips(self, column: int, row: int, count: int) -> bool:
+        """Whether `count` wells of a column, from `row` down, all hold tips.
+
+        Wells past the end of the column are ignored.
+        """
+        span = self._span(column, row, count)
+        return self._masks[column] & span == span
+
+    def has_no_tips(self, column: int, row: int, count: int) -> bool:
+        """Whether `count` wells of a column, from `row` down, all lack tips.
+
+        Wells past the end of the column are ignored.
+        """
+        return self._masks[column] & self._span(column, row, count) == 0
+
+    def set_tips(self, column: int, row: int, count: int, has_tip: bool) -> None:
+        """Set `count` wells of a column, from `row` down, to have tips or not.
+
+        Wells past the end of the column are ignored.
+        """
+        span = self._span(column, row, count)
+        if has_tip:
+            self._masks[column] |= span
+        else:
+            self._masks[column] &= ~span
+
+    def find_tips(
+        self, num_tips: int, start_column: int = 0, start_row: int = 0
+    ) -> Optional[Tuple[int, int]]:
+        """Find the first column whose first run of tips is long enough.
+
+        In each column, only the first contiguous run of wells with tips
+        is considered. In the start column, wells before `start_row`
+        are skipped.
+
+        Returns:
+            The ``(column, row)`` of the first well of the run,
+            or ``None`` if no column has a long enough run.
+        """
+        for column in range(start_column, len(self._masks)):
+            skip = start_row if column == start_column else 0
+            row = _find_first_run(self._masks[column] >> skip << skip, num_tips)
+            if row is not None:
+                return column, row
+        return None
+
+    def find_empty(self, num_tips: int) -> Optional[Tuple[int, int]]:
+        """Find the first column whose first run of empty wells is long enough.
+
+        Returns:
+            The ``(column, row)`` of the first well of the run,
+            or ``None`` if no column has a long enough run.
+        """
+        for column, mask in enumerate(self._masks):
+            row = _find_first_run(~mask & self._full_masks[column], num_tips)
+            if row is not None:
+                return column, row
+        return None
+
+    def _span(self, column: int, row: int, count: int) -> int:
+        return ((1 << count) - 1) << row & self._full_masks[column]
+
+
+def _byte_size(num_bits: int) -> int:
+    return (num_bits + 7) // 8
+
+
+def _find_first_run(mask: int, length: int) -> Optional[int]:
+    """Get the index of the lowest run of set bits, if it is long enough."""
+    if mask == 0:
+        return None
+
+    start = (mask & -mask).bit_length() - 1
+    run = mask >> start
+    # Setting the lowest clear bit flips the whole run, plus that bit
+    run_length = (run ^ (run + 1)).bit_length() - 1
+
+    return start if run_length >= length else None
@@ -1,16 +1,42 @@
-from itertools import dropwhile, takewhile
-from typing import Optional, Sequence
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple
 
 from opentrons.protocol_api.core.well import AbstractWellCore
 
+from .tip_rack_state import TipRackState
 
-Wells = Sequence[AbstractWellCore]
+if TYPE_CHECKING:
+    from opentrons.protocol_api.core.protocol_api.well import WellImplementation
+
+
+Wells = Sequence["WellImplementation"]
 WellColumns = Sequence[Wells]
 
 
 class TipTracker:
+    """Track which wells of a tip rack hold tips.
+
+    Tip presence is kept in a `TipRackState`, with one bitmask per column.
+    The rack's wells are bound to the same state, so setting a well's
+    tip presence directly is reflected here, and vice versa.
+    """
+
     def __init__(self, columns: WellColumns):
         self._columns = columns
+        self._indices: Dict[str, Tuple[int, int]] = {}
+        self._state = TipRackState(column_lengths=[len(column) for column in columns])
+
+        for column_idx, column in enumerate(columns):
+            for row_idx, well in enumerate(column):
+                self._indices.setdefault(well.get_name(), (column_idx, row_idx))
+                well.bind_tip_state(self._state, column=column_idx, row=row_idx)
+
+    def get_state(self) -> TipRackState:
+        """Get the tip presence state shared by every well in the rack."""
+        return self._state
+
+    def reset(self) -> None:
+        """Set every well in the rack as holding a tip."""
+        self._state.reset(has_tip=True)
 
     def next_tip(
         self, num_tips: int = 1, starting_tip: Optional[AbstractWellCore] = None
@@ -29,36 +55,18 @@ class TipTracker:
         :type starting_tip: :py:class:`.Well`
         :return: the :py:class:`.Well` meeting the target criteria, or None
         """
-        columns: WellColumns = self._columns
+        start_column, start_row = 0, 0
         if starting_tip:
-            # Remove columns preceding the one with the pipette's starting tip
-            drop_undefined_columns = list(
-                dropwhile(lambda x: starting_tip not in x, columns)
-            )
-            # Remove tips preceding the starting tip in the first column
-            drop_undefined_columns[0] = list(
-                dropwhile(lambda w: starting_tip is not w, drop_undefined_columns[0])
-            )
-            columns = drop_undefined_columns
-
-        drop_leading_empties = [
-            list(dropwhile(lambda x: not x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: x.has_tip(), column))
-            for column in drop_leading_empties
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-
-        try:
-            first_long_enough = long_enough[0]
-            result: Optional[AbstractWellCore] = first_long_enough[0]
-        except IndexError:
-            result = None
-
-        return result
+            start_column, start_row = self._get_index(starting_tip)
+            # Like a search through the column's wells, only an identical
+            # well object, rather than an equal one, counts as the start
+            if self._columns[start_column][start_row] is not starting_tip:
+                start_row = len(self._columns[start_column])
+
+        found = self._state.find_tips(
+            num_tips, start_column=start_column, start_row=start_row
+        )
+        return self._get_well(found)
 
     def use_tips(
         self,
@@ -86,17 +94,7 @@ class TipTracker:
         :type num_channels: int
         :param fail_if_full: for backwards compatibility
         """
-        # Select the column of the labware that contains the target well
-        target_column = [col for col in self._columns if start_well in col][0]
-
-        well_idx = target_column.index(start_well)
-        # Number of tips to pick up is the lesser of (1) the number of tips
-        # from the starting well to the end of the column, and (2) the number
-        # of channels of the pipette (so a 4-channel pipette would pick up a
-        # max of 4 tips, and picking up from the 2nd-to-bottom well in a
-        # column would get a maximum of 2 tips)
-        num_tips = min(len(target_column) - well_idx, num_channels)
-        target_wells = target_column[well_idx : well_idx + num_tips]
+        column, row = self._get_index(start_well)
 
         # In API version 2.2, we no longer reset the tip tracker when a tip
         # is dropped back into a tiprack well. This fixes a behavior where
@@ -107,12 +105,17 @@ class TipTracker:
         # dirty tips and non-present tips; but until then, we can avoid the
         # exception.
         if fail_if_full:
-            assert all(
-                well.has_tip() for well in target_wells
+            assert self._state.has_tips(
+                column, row, num_channels
             ), "{} is out of tips".format(str(self))
 
-        for well in target_wells:
-            well.set_has_tip(False)
+        # Number of tips to pick up is the lesser of (1) the number of tips
+        # from the starting well to the end of the column, and (2) the number
+        # of channels of the pipette (so a 4-channel pipette would pick up a
+        # max of 4 tips, and picking up from the 2nd-to-bottom well in a
+        # column would get a maximum of 2 tips). The tip state ignores
+        # wells past the end of the column.
+        self._state.set_tips(column, row, num_channels, has_tip=False)
 
     def previous_tip(self, num_tips: int = 1) -> Optional[AbstractWellCore]:
         """
@@ -126,21 +129,7 @@ class TipTracker:
         :type num_tips: int
         :return: The :py:class:`.Well` meeting the target criteria, or ``None``
         """
-        columns = self._columns
-        drop_leading_filled = [
-            list(dropwhile(lambda x: x.has_tip(), column)) for column in columns
-        ]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: not x.has_tip(), column))
-            for column in drop_leading_filled
-        ]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips
-        ]
-        try:
-            return long_enough[0][0]
-        except IndexError:
-            return None
+        return self._get_well(self._state.find_empty(num_tips))
 
     def return_tips(self, start_well: AbstractWellCore, num_channels: int = 1):
         """
@@ -163,13 +152,21 @@ class TipTracker:
         :param num_channels: The number of channels for the current pipette
         :type num_channels: int
         """
-        # Select the column that contains the target_well
-        target_column = [col for col in self._columns if start_well in col][0]
-        well_idx = target_column.index(start_well)
-        end_idx = min(well_idx + num_channels, len(target_column))
-        drop_targets = target_column[well_idx:end_idx]
-        for well in drop_targets:
-            if well.has_tip():
-                raise AssertionError(f"Well {repr(well)} has a tip")
-        for well in drop_targets:
-            well.set_has_tip(True)
+        column, row = self._get_index(start_well)
+
+        if not self._state.has_no_tips(column, row, num_channels):
+            end_idx = min(row + num_channels, len(self._columns[column]))
+            well = next(w for w in self._columns[column][row:end_idx] if w.has_tip())
+            raise AssertionError(f"Well {repr(well)} has a tip")
+
+        self._state.set_tips(column, row, num_channels, has_tip=True)
+
+    def _get_index(self, well: AbstractWellCore) -> Tuple[int, int]:
+        """Get the column and row indices of the well with the same name."""
+        return self._indices[well.get_name()]
+
+    def _get_well(self, index: Optional[Tuple[int, int]]) -> Optional[AbstractWellCore]:
+        if index is None:
+            return None
+        column, row = index
+        return self._columns[column][row]
@@ -1,25 +1,25 @@
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Sequence
+from typing import Dict, Generic, Sequence
 
-from opentrons.protocol_api.core.well import AbstractWellCore
+from opentrons.protocol_api.core.well import WellCoreType
 
 
-Wells = Sequence[AbstractWellCore]
-HeaderToWells = Dict[str, Wells]
-WellsByDimension = Sequence[Wells]
+Wells = Sequence[WellCoreType]
+HeaderToWells = Dict[str, Wells[WellCoreType]]
+WellsByDimension = Sequence[Wells[WellCoreType]]
 
 
 @dataclass
-class Grid:
-    rows: HeaderToWells
-    columns: HeaderToWells
+class Grid(Generic[WellCoreType]):
+    rows: HeaderToWells[WellCoreType]
+    columns: HeaderToWells[WellCoreType]
 
 
-class WellGrid:
+class WellGrid(Generic[WellCoreType]):
     """A helper class to extract Wells by row or column"""
 
-    def __init__(self, wells: Wells):
+    def __init__(self, wells: Wells[WellCoreType]):
         """
         Construct well grid from a collection of well objects ordered as they
          appear in ordering` field of Labware Definition
@@ -38,32 +38,32 @@ class WellGrid:
         """List of column header names"""
         return self._column_headers
 
-    def get_row_dict(self) -> HeaderToWells:
+    def get_row_dict(self) -> HeaderToWells[WellCoreType]:
         """A mapping of row header to a list"""
         return self._grid.rows
 
-    def get_column_dict(self) -> HeaderToWells:
+    def get_column_dict(self) -> HeaderToWells[WellCoreType]:
         """A mapping of column header to a list"""
         return self._grid.columns
 
-    def get_rows(self) -> WellsByDimension:
+    def get_rows(self) -> WellsByDimension[WellCoreType]:
         """Get all rows as list of lists"""
         return self._rows
 
-    def get_columns(self) -> WellsByDimension:
+    def get_columns(self) -> WellsByDimension[WellCoreType]:
         """Get all columns as list of lists"""
         return self._columns
 
-    def get_row(self, row: str) -> Wells:
+    def get_row(self, row: str) -> Wells[WellCoreType]:
         """Get an individual row"""
         return self._grid.rows.get(row, [])
 
-    def get_column(self, column: str) -> Wells:
+    def get_column(self, column: str) -> Wells[WellCoreType]:
         """Get an individual column"""
         return self._grid.columns.get(column, [])
 
     @staticmethod
-    def _create_row_column(wells: Wells) -> Grid:
+    def _create_row_column(wells: Wells[WellCoreType]) -> Grid[WellCoreType]:
         """
         Creates a dict of lists of Wells. Which way the labware is segmented
         determines whether this is a dict of rows or dict of columns. If group
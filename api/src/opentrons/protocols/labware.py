@@ -3,14 +3,19 @@ from __future__ import annotations
 import logging
 import json
 import os
+import threading
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, AnyStr, List, Dict, Optional, Union
-
-import jsonschema  # type: ignore
+from typing import Any, AnyStr, List, Dict, Optional, Tuple, Union
 
+from opentrons.protocols import schemas
 from opentrons.protocols.api_support.util import ModifiedList
-from opentrons_shared_data import load_shared_data, get_shared_data_root
+from opentrons_shared_data import (
+    load_shared_data,
+    list_shared_data,
+    get_shared_data_root,
+)
 from opentrons.protocols.api_support.constants import (
     OPENTRONS_NAMESPACE,
     CUSTOM_NAMESPACE,
@@ -18,11 +23,71 @@ from opentrons.protocols.api_support.constants import (
     USER_DEFS_PATH,
 )
 from opentrons_shared_data.labware.dev_types import LabwareDefinition
+from opentrons_shared_data.labware.labware_definition import (
+    LabwareDefinition as LabwareDefinitionModel,
+)
 
 
 MODULE_LOG = logging.getLogger(__name__)
 
 
+@dataclass
+class _CachedDefinition:
+    contents: bytes
+    # The definition file's (st_mtime_ns, st_size),
+    # or None for read-only Opentrons definitions.
+    file_stamp: Optional[Tuple[int, int]]
+    model: Optional[LabwareDefinitionModel] = None
+
+
+class _DefinitionCache:
+    """Definitions read from disk, keyed by (namespace, load_name, version).
+
+    Opentrons definitions never change, so they're read once per process.
+    Custom definitions can be changed by the user at any time,
+    so they're re-read when their file's modification time or size changes.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, str, int], _CachedDefinition] = {}
+        self._lock = threading.Lock()
+
+    def get(self, load_name: str, namespace: str, version: int) -> _CachedDefinition:
+        key = (namespace, load_name, version)
+        file_stamp = None
+
+        if namespace != OPENTRONS_NAMESPACE:
+            def_path = _get_path_to_labware(load_name, namespace, version)
+            stat = def_path.stat()
+            file_stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None or entry.file_stamp != file_stamp:
+            if namespace == OPENTRONS_NAMESPACE:
+                # Served from the shared data bundle, if there is one.
+                contents = load_shared_data(
+                    STANDARD_DEFS_PATH / load_name / f"{version}.json"
+                )
+            else:
+                contents = def_path.read_bytes()
+
+            entry = _CachedDefinition(contents=contents, file_stamp=file_stamp)
+
+            with self._lock:
+                self._entries[key] = entry
+
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_definition_cache = _DefinitionCache()
+
+
 def get_labware_definition(
     load_name: str,
     namespace: Optional[str] = None,
@@ -63,6 +128,36 @@ def get_labware_definition(
     return _get_standard_labware_definition(load_name, namespace, version)
 
 
+def get_labware_definition_model(
+    load_name: str, namespace: str, version: int
+) -> LabwareDefinitionModel:
+    """Look up a standard or custom labware definition, parsed into a model.
+
+    Unlike :py:func:`get_labware_definition`, which returns a new dict on
+    every call, this returns the same model instance to every caller until
+    the underlying definition file changes, so it must not be modified.
+
+    :raises FileNotFoundError: If the definition does not exist.
+    """
+    load_name = load_name.lower()
+    namespace = namespace.lower()
+
+    try:
+        entry = _definition_cache.get(load_name, namespace, version)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f'Labware "{load_name}" not found with version {version} '
+            f'in namespace "{namespace}".'
+        )
+
+    model = entry.model
+
+    if model is None:
+        model = entry.model = LabwareDefinitionModel.parse_raw(entry.contents)
+
+    return model
+
+
 def get_all_labware_definitions() -> List[str]:
     """
     Return a list of standard and custom labware definitions with load_name +
@@ -77,7 +172,7 @@ def get_all_labware_definitions() -> List[str]:
                     labware_list.append(sub_dir.name)
 
     # check for standard labware
-    _check_for_subdirectories(get_shared_data_root() / STANDARD_DEFS_PATH)
+    labware_list.extend(list_shared_data(STANDARD_DEFS_PATH))
 
     # check for custom labware
     for namespace in os.scandir(USER_DEFS_PATH):
@@ -140,14 +235,11 @@ def verify_definition(
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = load_shared_data("labware/schemas/2.json").decode("utf-8")
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
     else:
         to_return = json.loads(contents)
-    jsonschema.validate(to_return, labware_schema_v2)
+    schemas.validate(to_return, schemas.LABWARE_SCHEMA_V2)
     # we can type ignore this because if it passes the jsonschema it has
     # the correct structure
     return to_return  # type: ignore
@@ -234,17 +326,17 @@ def _get_standard_labware_definition(
         )
 
     namespace = namespace.lower()
-    def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
     try:
-        with open(def_path, "rb") as f:
-            labware_def = json.loads(f.read().decode("utf-8"))
+        entry = _definition_cache.get(load_name, namespace, checked_version)
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
             f'in namespace "{namespace}".'
         )
 
+    # Decode a new dict on every call, since callers are free to modify it.
+    labware_def: LabwareDefinition = json.loads(entry.contents.decode("utf-8"))
     return labware_def
 
 
@@ -14,7 +14,6 @@ from typing import Any, Dict, Optional, Union, Tuple, TYPE_CHECKING
 
 import jsonschema  # type: ignore
 
-from opentrons_shared_data import load_shared_data, protocol
 from .api_support.types import APIVersion
 from .types import (
     Protocol,
@@ -25,6 +24,7 @@ from .types import (
     ApiDeprecationError,
 )
 from .bundle import extract_bundle
+from . import schemas
 
 if TYPE_CHECKING:
     from opentrons_shared_data.labware.dev_types import LabwareDefinition
@@ -373,8 +373,8 @@ def _get_protocol_schema_version(protocol_json: Dict[Any, Any]) -> int:
     )
 
 
-def _get_schema_for_protocol(version_num: int) -> protocol.Schema:
-    """Retrieve the json schema for a protocol schema version"""
+def _get_schema_path_for_protocol(version_num: int) -> str:
+    """Retrieve the path to the json schema for a protocol schema version"""
     # TODO(IL, 2020/03/05): use $otSharedSchema, but maybe wait until
     # deprecating v1/v2 JSON protocols?
     if version_num > MAX_SUPPORTED_JSON_SCHEMA_VERSION:
@@ -382,28 +382,20 @@ def _get_schema_for_protocol(version_num: int) -> protocol.Schema:
             f"JSON Protocol version {version_num} is not yet "
             + "supported in this version of the API"
         )
+    schema_path = f"protocol/schemas/{version_num}.json"
     try:
-        schema = load_shared_data(f"protocol/schemas/{version_num}.json")
+        schemas.load_schema(schema_path)
     except FileNotFoundError:
-        schema = None  # type: ignore
-    if not schema:
         raise RuntimeError(
             'JSON Protocol schema "{}" does not exist'.format(version_num)
         )
-    return json.loads(schema.decode("utf-8"))
+    return schema_path
 
 
 def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"]:
     """Validates a json protocol and returns its schema version"""
     # Check if this is actually a labware
-    labware_schema_v2 = json.loads(
-        load_shared_data("labware/schemas/2.json").decode("utf-8")
-    )
-    try:
-        jsonschema.validate(protocol_json, labware_schema_v2)
-    except jsonschema.ValidationError:
-        pass
-    else:
+    if schemas.is_valid(protocol_json, schemas.LABWARE_SCHEMA_V2):
         MODULE_LOG.error("labware uploaded instead of protocol")
         raise RuntimeError(
             "The file you are trying to open is a JSON labware definition, "
@@ -428,18 +420,11 @@ def validate_json(protocol_json: Dict[Any, Any]) -> Tuple[int, "JsonProtocolDef"
             "version. Please update your OT-2 App and robot server to the "
             "latest version and try again."
         )
-    protocol_schema = _get_schema_for_protocol(version_num)
-
-    # instruct schema how to resolve all $ref's used in protocol schemas
-    resolver = jsonschema.RefResolver(
-        protocol_schema.get("$id", ""),
-        protocol_schema,
-        store={"opentronsLabwareSchemaV2": labware_schema_v2},
-    )
+    protocol_schema_path = _get_schema_path_for_protocol(version_num)
 
     # do the validation
     try:
-        jsonschema.validate(protocol_json, protocol_schema, resolver=resolver)
+        schemas.validate(protocol_json, protocol_schema_path)
     except jsonschema.ValidationError:
         MODULE_LOG.exception("JSON protocol validation failed")
         raise RuntimeError(
@@ -0,0 +1,98 @@
+"""Reusable validators for the JSON schemas in shared data.
+
+Building a ``jsonschema`` validator means loading and parsing its schema,
+and ``jsonschema.validate()`` also re-checks the schema itself on every call.
+The validators here are built once per schema and reused.
+"""
+import json
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+import jsonschema  # type: ignore
+
+from opentrons_shared_data import load_shared_data
+
+
+LABWARE_SCHEMA_V2 = "labware/schemas/2.json"
+
+# Schemas that other schemas refer to by ID, rather than by location.
+_SCHEMA_PATHS_BY_ID = {"opentronsLabwareSchemaV2": LABWARE_SCHEMA_V2}
+
+# RefResolvers track the scope of the reference being resolved, so a validator,
+# which holds a RefResolver, can't be shared by threads validating concurrently.
+_validators = threading.local()
+
+
+@lru_cache(maxsize=None)
+def load_schema(schema_path: str) -> Dict[str, Any]:
+    """Load a schema from shared data.
+
+    The same dict is returned to every caller, so it must not be modified.
+
+    :param schema_path: The schema's path, relative to the shared data root.
+    :raises FileNotFoundError: If the schema does not exist.
+    """
+    schema: Dict[str, Any] = json.loads(load_shared_data(schema_path))
+    return schema
+
+
+def get_validator(schema_path: str) -> Any:
+    """Get a validator for a schema from shared data.
+
+    Validators are created once per schema per thread, and reused after that.
+
+    :param schema_path: The schema's path, relative to the shared data root.
+    :returns: A ``jsonschema`` validator object.
+    :raises FileNotFoundError: If the schema does not exist.
+    """
+    validators: Dict[str, Any] = _validators.__dict__.setdefault("by_path", {})
+    validator = validators.get(schema_path)
+
+    if validator is None:
+        schema = load_schema(schema_path)
+        resolver = jsonschema.RefResolver(
+            schema.get("$id", ""),
+            schema,
+            store={
+                schema_id: load_schema(path)
+                for schema_id, path in _SCHEMA_PATHS_BY_ID.items()
+            },
+        )
+        validator_cls = jsonschema.validators.validator_for(schema)
+        validator = validators[schema_path] = validator_cls(schema, resolver=resolver)
+
+    return validator
+
+
+def validate(instance: object, schema_path: str) -> None:
+    """Validate an object against a schema from shared data.
+
+    :raises jsonschema.ValidationError: If the object is not valid.
+        This is the same error that ``jsonschema.validate()`` would raise.
+    """
+    error = _get_error(get_validator(schema_path), instance)
+
+    if error is not None:
+        raise error
+
+
+def is_valid(instance: object, schema_path: str) -> bool:
+    """Return whether an object is valid against a schema from shared data."""
+    return bool(get_validator(schema_path).is_valid(instance))
+
+
+def validate_many(
+    instances: Iterable[object], schema_path: str
+) -> List[Optional[jsonschema.ValidationError]]:
+    """Validate several objects against the same schema from shared data.
+
+    :returns: For each object, in order, the error that :py:func:`validate`
+        would raise for it, or ``None`` if it's valid.
+    """
+    validator = get_validator(schema_path)
+    return [_get_error(validator, instance) for instance in instances]
+
+
+def _get_error(validator: Any, instance: object) -> Optional[Any]:
+    return jsonschema.exceptions.best_match(validator.iter_errors(instance))
@@ -1,14 +1,13 @@
 """ opentrons.util.entrypoint_util: functions common to entrypoints
 """
 
+import json
 import logging
 from json import JSONDecodeError
 import pathlib
-from typing import Dict, Sequence, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Sequence, Tuple, Union, TYPE_CHECKING
 
-from jsonschema import ValidationError  # type: ignore
-
-from opentrons.protocol_api import labware
+from opentrons.protocols import schemas
 from opentrons.calibration_storage import helpers
 
 if TYPE_CHECKING:
@@ -20,6 +19,7 @@ def labware_from_paths(
     paths: Sequence[Union[str, pathlib.Path]]
 ) -> Dict[str, "LabwareDefinition"]:
     labware_defs: Dict[str, "LabwareDefinition"] = {}
+    candidates: List[Tuple[pathlib.Path, Any]] = []
 
     for strpath in paths:
         log.info(f"local labware: checking path {strpath}")
@@ -30,22 +30,41 @@ def labware_from_paths(
             path = pathlib.Path.cwd() / purepath
         if not path.is_dir():
             raise RuntimeError(f"{path} is not a directory")
-        for child in path.iterdir():
-            if child.is_file() and child.suffix.endswith("json"):
-                try:
-                    defn = labware.verify_definition(child.read_bytes())
-                except (ValidationError, JSONDecodeError) as e:
-                    log.info(f"{child}: invalid labware, ignoring")
-                    log.debug(f"{child}: labware invalid because: {str(e)}")
-                else:
-                    uri = helpers.uri_from_definition(defn)
-                    labware_defs[uri] = defn
-                    log.info(f"loaded labware {uri} from {child}")
-            else:
-                log.info(f"ignoring {child} in labware path")
+        candidates.extend(_read_labware_candidates(path))
+
+    # Validate every candidate at once, so the schema is only compiled once.
+    errors = schemas.validate_many(
+        (defn for _, defn in candidates), schemas.LABWARE_SCHEMA_V2
+    )
+
+    for (child, defn), error in zip(candidates, errors):
+        if error is not None:
+            log.info(f"{child}: invalid labware, ignoring")
+            log.debug(f"{child}: labware invalid because: {str(error)}")
+        else:
+            uri = helpers.uri_from_definition(defn)
+            labware_defs[uri] = defn
+            log.info(f"loaded labware {uri} from {child}")
+
     return labware_defs
 
 
+def _read_labware_candidates(path: pathlib.Path) -> List[Tuple[pathlib.Path, Any]]:
+    candidates: List[Tuple[pathlib.Path, Any]] = []
+
+    for child in path.iterdir():
+        if child.is_file() and child.suffix.endswith("json"):
+            try:
+                candidates.append((child, json.loads(child.read_bytes())))
+            except JSONDecodeError as e:
+                log.info(f"{child}: invalid labware, ignoring")
+                log.debug(f"{child}: labware invalid because: {str(e)}")
+        else:
+            log.info(f"ignoring {child} in labware path")
+
+    return candidates
+
+
 def datafiles_from_paths(paths: Sequence[Union[str, pathlib.Path]]) -> Dict[str, bytes]:
     datafiles: Dict[str, bytes] = {}
     for strpath in paths:
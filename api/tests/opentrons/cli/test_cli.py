@@ -36,3 +36,79 @@ def test_analyze(fixture_path: Path, tmp_path: Path) -> None:
     assert "labware" in analysis_output_json
     assert "liquids" in analysis_output_json
     assert "modules" in analysis_output_json
+
+
+@pytest.mark.parametrize("fixture_path", _list_fixtures(6))
+def test_analyze_summary(fixture_path: Path, tmp_path: Path) -> None:
+    """Should return the protocol's files, config, and metadata, without commands."""
+    summary_output_path = tmp_path / "summary_output.json"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        analyze,
+        [
+            str(fixture_path.resolve()),
+            "--summary",
+            "--json-output",
+            str(summary_output_path),
+        ],
+    )
+
+    summary_output_json = json.loads(summary_output_path.read_bytes())
+
+    assert result.exit_code == 0
+
+    assert summary_output_json["files"] == [{"name": fixture_path.name, "role": "main"}]
+    assert summary_output_json["config"] == {
+        "protocolType": "json",
+        "schemaVersion": 6,
+    }
+    assert "metadata" in summary_output_json
+    assert "commands" not in summary_output_json
+
+
+def test_analyze_batch(tmp_path: Path) -> None:
+    """Should write one result per protocol, per line, with timing stats."""
+    protocols_dir = tmp_path / "protocols"
+    bundle_dir = protocols_dir / "python_bundle"
+    bundle_dir.mkdir(parents=True)
+    (bundle_dir / "protocol.py").write_text(
+        'metadata = {"apiLevel": "2.12"}\n\ndef run(ctx):\n    ctx.comment("hi")\n'
+    )
+    (protocols_dir / "json_protocol.json").write_bytes(
+        next(_list_fixtures(6)).read_bytes()
+    )
+    (protocols_dir / "broken.json").write_text("not json")
+    batch_output_path = tmp_path / "batch_output.ndjson"
+
+    runner = CliRunner()
+    result = runner.invoke(
+        analyze,
+        [
+            str(protocols_dir),
+            "--batch",
+            "--workers",
+            "2",
+            "--json-output",
+            str(batch_output_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+
+    results = {
+        line["protocol"]: line
+        for line in map(json.loads, batch_output_path.read_text().splitlines())
+    }
+
+    assert set(results) == {"python_bundle", "json_protocol.json", "broken.json"}
+
+    for name in ("python_bundle", "json_protocol.json"):
+        assert "commands" in results[name]["analysis"]
+        assert "error" not in results[name]
+        assert results[name]["timing"]["simulateSeconds"] > 0
+        assert results[name]["timing"]["totalSeconds"] > 0
+
+    assert "analysis" not in results["broken.json"]
+    assert "broken.json is not valid JSON" in results["broken.json"]["error"]
+    assert "simulateSeconds" not in results["broken.json"]["timing"]
@@ -1,6 +1,7 @@
 """Tests for opentrons.commands.publisher."""
 from __future__ import annotations
 
+import logging
 import pytest
 from decoy import Decoy, matchers
 from typing import Any, Dict, cast
@@ -11,8 +12,10 @@ from opentrons.commands.publisher import CommandPublisher, publish, publish_cont
 
 @pytest.fixture
 def broker(decoy: Decoy) -> Broker:
-    """Return a mocked out Broker."""
-    return decoy.mock(cls=Broker)
+    """Return a mocked out Broker, with a subscriber."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(True)
+    return broker
 
 
 def test_publish_decorator(decoy: Decoy, broker: Broker) -> None:
@@ -317,3 +320,71 @@ def test_publish_context_with_error(decoy: Decoy, broker: Broker) -> None:
     )
 
     assert before_message_id.value == after_message_id.value
+
+
+def test_publish_decorator_without_subscribers(decoy: Decoy, broker: Broker) -> None:
+    """It should skip building and publishing messages if nothing would get them."""
+    _act = decoy.mock()
+    _get_command_payload = decoy.mock()
+
+    class _Subject(CommandPublisher):
+        @publish(command=_get_command_payload)
+        def act(self, foo: str) -> str:
+            _act(foo)
+            return "result"
+
+    decoy.when(broker.has_subscribers("command")).then_return(False)
+    decoy.when(broker.logger.isEnabledFor(logging.INFO)).then_return(False)
+
+    subject = _Subject(broker=broker)
+
+    assert subject.act("hello") == "result"
+
+    decoy.verify(_act("hello"))
+    decoy.verify(_get_command_payload(), ignore_extra_args=True, times=0)
+    decoy.verify(
+        broker.publish(topic=matchers.Anything(), message=matchers.Anything()),
+        times=0,
+    )
+
+
+def test_publish_context_logs_lazily(decoy: Decoy, broker: Broker) -> None:
+    """It should only format a log message if the broker's logger would use it."""
+    command = cast(
+        CommandDict,
+        {"name": "some_command", "payload": {"foo": "hello", "text": "hi"}},
+    )
+
+    decoy.when(broker.logger.isEnabledFor(logging.INFO)).then_return(False)
+
+    with publish_context(broker=broker, command=command):
+        pass
+
+    decoy.verify(broker.logger.info(matchers.Anything()), times=0)
+
+    decoy.when(broker.logger.isEnabledFor(logging.INFO)).then_return(True)
+
+    with publish_context(broker=broker, command=command):
+        pass
+
+    decoy.verify(broker.logger.info("some_command: foo: hello"))
+
+
+def test_publish_context_message_ids(decoy: Decoy, broker: Broker) -> None:
+    """It should give each command's messages an ID that no other command has."""
+    command = cast(CommandDict, {"name": "some_command", "payload": {}})
+    message_captor = matchers.Captor()
+
+    with publish_context(broker=broker, command=command):
+        with publish_context(broker=broker, command=command):
+            pass
+
+    decoy.verify(broker.publish(topic="command", message=message_captor), times=4)
+
+    outer_before, inner_before, inner_after, outer_after = [
+        message["id"] for message in message_captor.values
+    ]
+
+    assert outer_before == outer_after
+    assert inner_before == inner_after
+    assert outer_before != inner_before
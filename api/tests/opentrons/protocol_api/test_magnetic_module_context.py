@@ -24,8 +24,10 @@ def mock_protocol_core(decoy: Decoy) -> ProtocolCore:
 
 @pytest.fixture
 def mock_broker(decoy: Decoy) -> Broker:
-    """Get a mock command message broker."""
-    return decoy.mock(cls=Broker)
+    """Get a mock command message broker, with a subscriber."""
+    broker = decoy.mock(cls=Broker)
+    decoy.when(broker.has_subscribers("command")).then_return(True)
+    return broker
 
 
 @pytest.fixture
@@ -1,9 +1,11 @@
 """Tests for the protocol engine's ActionDispatcher."""
+from datetime import datetime
 from decoy import Decoy
 
 from opentrons.protocol_engine.actions import (
     ActionDispatcher,
     ActionHandler,
+    PlayAction,
     StopAction,
 )
 
@@ -38,3 +40,22 @@ def test_add_handler(decoy: Decoy) -> None:
         handler_2.handle_action(action),
         sink.handle_action(action),
     )
+
+
+def test_dispatch_batch(decoy: Decoy) -> None:
+    """It should send each action to handlers, then the whole batch to the sink."""
+    action_1 = PlayAction(requested_at=datetime(year=2021, month=1, day=1))
+    action_2 = StopAction()
+
+    handler = decoy.mock(cls=ActionHandler)
+    sink = decoy.mock(cls=ActionHandler)
+
+    subject = ActionDispatcher(sink=sink)
+    subject.add_handler(handler)
+    subject.dispatch_batch([action_1, action_2])
+
+    decoy.verify(
+        handler.handle_action(action_1),
+        handler.handle_action(action_2),
+        sink.handle_actions([action_1, action_2]),
+    )
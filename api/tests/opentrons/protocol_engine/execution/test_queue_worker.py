@@ -36,7 +36,10 @@ def subject(
 async def queue_commands(decoy: Decoy, state_store: StateStore) -> None:
     """Load the command queue with 2 queued commands, then stop."""
     decoy.when(
-        await state_store.wait_for(condition=state_store.commands.get_next_queued)
+        await state_store.wait_for_topics(
+            topics=matchers.Anything(),
+            condition=state_store.commands.get_next_queued,
+        )
     ).then_return("command-id-1", "command-id-2")
 
     decoy.when(state_store.commands.get_stop_requested()).then_return(
@@ -52,7 +55,10 @@ async def test_start_processes_commands(
 ) -> None:
     """It should pull commands off the queue and execute them."""
     decoy.when(
-        await state_store.wait_for(condition=state_store.commands.get_next_queued)
+        await state_store.wait_for_topics(
+            topics=matchers.Anything(),
+            condition=state_store.commands.get_next_queued,
+        )
     ).then_return("command-id-1", "command-id-2")
 
     decoy.when(state_store.commands.get_stop_requested()).then_return(
@@ -129,7 +135,10 @@ async def test_engine_stopped_exception_breaks_loop_gracefully(
 ) -> None:
     """It should `join` gracefully if a RunStoppedError is raised."""
     decoy.when(
-        await state_store.wait_for(condition=state_store.commands.get_next_queued)
+        await state_store.wait_for_topics(
+            topics=matchers.Anything(),
+            condition=state_store.commands.get_next_queued,
+        )
     ).then_raise(RunStoppedError("oh no"))
 
     subject.start()
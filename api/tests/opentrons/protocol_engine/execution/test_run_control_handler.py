@@ -5,7 +5,16 @@ import pytest
 from decoy import Decoy, matchers
 
 from opentrons.protocol_engine.state import StateStore
-from opentrons.protocol_engine.actions import ActionDispatcher, PauseAction, PauseSource
+from opentrons.protocol_engine.actions import (
+    ActionDispatcher,
+    PlayAction,
+    PauseAction,
+    PauseSource,
+    StopAction,
+    FinishAction,
+    HardwareStoppedAction,
+    DoorChangeAction,
+)
 from opentrons.protocol_engine.execution.run_control import RunControlHandler
 from opentrons.protocol_engine.state import Config
 
@@ -45,8 +54,16 @@ async def test_pause(
     await subject.wait_for_resume()
     decoy.verify(
         mock_action_dispatcher.dispatch(PauseAction(source=PauseSource.PROTOCOL)),
-        await mock_state_store.wait_for(
-            condition=mock_state_store.commands.get_is_running
+        await mock_state_store.wait_for_topics(
+            topics=(
+                PlayAction,
+                PauseAction,
+                StopAction,
+                FinishAction,
+                HardwareStoppedAction,
+                DoorChangeAction,
+            ),
+            condition=mock_state_store.commands.get_is_running,
         ),
     )
 
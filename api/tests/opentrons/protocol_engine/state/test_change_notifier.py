@@ -54,3 +54,48 @@ async def test_multiple_subscribers(count: int) -> None:
     await asyncio.gather(task_1, task_2, task_3)
 
     assert results == [1, 2, 3]
+
+
+async def test_topic_subscribers() -> None:
+    """It should only wake subscribers waiting on a notified topic."""
+    subject = ChangeNotifier()
+
+    task_foo = asyncio.create_task(subject.wait(topics=["foo"]))
+    task_bar = asyncio.create_task(subject.wait(topics=["bar", "baz"]))
+    task_any = asyncio.create_task(subject.wait())
+    await asyncio.sleep(0)
+
+    subject.notify(topics=["baz"])
+    await asyncio.sleep(0)
+
+    assert task_foo.done() is False
+    assert task_bar.done() is True
+    assert task_any.done() is True
+
+    subject.notify()
+    await task_foo
+
+
+async def test_topic_subscribers_removed() -> None:
+    """It should forget topic subscribers once they're woken or cancelled."""
+    subject = ChangeNotifier()
+
+    task_foo = asyncio.create_task(subject.wait(topics=["foo", "shared"]))
+    task_bar = asyncio.create_task(subject.wait(topics=["bar", "shared"]))
+    await asyncio.sleep(0)
+
+    subject.notify(topics=["foo"])
+    await task_foo
+    task_bar.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task_bar
+
+    task_baz = asyncio.create_task(subject.wait(topics=["shared"]))
+    await asyncio.sleep(0)
+
+    assert subject._events_by_topic.keys() == {"shared"}
+
+    subject.notify(topics=["shared"])
+    await task_baz
+
+    assert subject._events_by_topic == {}
@@ -71,6 +71,9 @@ def test_initial_state(
         all_command_ids=[],
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
     )
 
 
@@ -585,6 +588,67 @@ def test_command_store_preserves_handle_order() -> None:
     }
 
 
+def test_command_store_tracks_latest_completed_command() -> None:
+    """It should keep track of the completed command with the highest index."""
+    subject = CommandStore(is_door_open=False, config=Config())
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="id-1"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="id-2"))
+    )
+    assert subject.state.latest_completed_command_id == "id-1"
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="id-3"))
+    )
+    assert subject.state.latest_completed_command_id == "id-3"
+
+    # completing an earlier command should not move the index backwards
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="id-2"))
+    )
+    assert subject.state.latest_completed_command_id == "id-3"
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_running_command(command_id="id-3"))
+    )
+    assert subject.state.latest_completed_command_id == "id-2"
+
+
+def test_command_store_tracks_command_counts_by_status() -> None:
+    """It should keep a running count of commands by status."""
+    subject = CommandStore(is_door_open=False, config=Config())
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_queued_command(command_id="id-1"))
+    )
+    subject.handle_action(
+        UpdateCommandAction(command=create_queued_command(command_id="id-2"))
+    )
+    assert subject.state.command_counts_by_status == {
+        commands.CommandStatus.QUEUED: 2,
+    }
+
+    subject.handle_action(
+        UpdateCommandAction(command=create_succeeded_command(command_id="id-1"))
+    )
+    subject.handle_action(
+        FailCommandAction(
+            command_id="id-2",
+            error_id="error-id",
+            failed_at=datetime(year=2022, month=2, day=2),
+            error=errors.ProtocolEngineError("oh no"),
+        )
+    )
+    assert subject.state.command_counts_by_status == {
+        commands.CommandStatus.SUCCEEDED: 1,
+        commands.CommandStatus.FAILED: 1,
+    }
+    assert subject.state.failed_command_id == "id-2"
+
+
 @pytest.mark.parametrize("pause_source", PauseSource)
 def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
     """It should clear the running flag on pause."""
@@ -603,6 +667,9 @@ def test_command_store_handles_pause_action(pause_source: PauseSource) -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
     )
 
 
@@ -623,6 +690,9 @@ def test_command_store_handles_play_action(pause_source: PauseSource) -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
         run_started_at=datetime(year=2021, month=1, day=1),
     )
 
@@ -645,6 +715,9 @@ def test_command_store_handles_finish_action() -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
         run_started_at=datetime(year=2021, month=1, day=1),
     )
 
@@ -677,6 +750,9 @@ def test_command_store_handles_stop_action() -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
         run_started_at=datetime(year=2021, month=1, day=1),
     )
 
@@ -698,6 +774,9 @@ def test_command_store_cannot_restart_after_should_stop() -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
         run_started_at=None,
     )
 
@@ -763,6 +842,9 @@ def test_command_store_saves_unknown_finish_error() -> None:
                 detail="oh no",
             )
         },
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
         run_started_at=None,
     )
 
@@ -786,6 +868,9 @@ def test_command_store_ignores_stop_after_graceful_finish() -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
         run_started_at=datetime(year=2021, month=1, day=1),
     )
 
@@ -809,6 +894,9 @@ def test_command_store_ignores_finish_after_non_graceful_stop() -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
         run_started_at=datetime(year=2021, month=1, day=1),
     )
 
@@ -854,6 +942,9 @@ def test_command_store_handles_command_failed() -> None:
             "command-id": CommandEntry(index=0, command=expected_failed_command),
         },
         errors_by_id={},
+        latest_completed_command_id="command-id",
+        failed_command_id="command-id",
+        command_counts_by_status={commands.CommandStatus.FAILED: 1},
         run_started_at=None,
     )
 
@@ -875,6 +966,9 @@ def test_handles_hardware_stopped() -> None:
         queued_setup_command_ids=OrderedSet(),
         commands_by_id=OrderedDict(),
         errors_by_id={},
+        latest_completed_command_id=None,
+        failed_command_id=None,
+        command_counts_by_status={},
         run_started_at=None,
     )
 
@@ -51,6 +51,22 @@ def get_command_view(
         command.id: CommandEntry(index=index, command=command)
         for index, command in enumerate(commands)
     }
+    completed_command_ids = [
+        command.id
+        for command in commands
+        if command.status in (cmd.CommandStatus.SUCCEEDED, cmd.CommandStatus.FAILED)
+    ]
+    failed_command_ids = [
+        command.id
+        for command in commands
+        if command.error and command.intent != cmd.CommandIntent.SETUP
+    ]
+    command_counts_by_status: Dict[cmd.CommandStatus, int] = {}
+
+    for command in commands:
+        command_counts_by_status[command.status] = (
+            command_counts_by_status.get(command.status, 0) + 1
+        )
 
     state = CommandState(
         queue_status=queue_status,
@@ -64,6 +80,11 @@ def get_command_view(
         all_command_ids=all_command_ids,
         commands_by_id=commands_by_id,
         run_started_at=run_started_at,
+        latest_completed_command_id=(
+            completed_command_ids[-1] if completed_command_ids else None
+        ),
+        failed_command_id=failed_command_ids[0] if failed_command_ids else None,
+        command_counts_by_status=command_counts_by_status,
     )
 
     return CommandView(state=state)
@@ -234,6 +255,21 @@ def test_get_all_complete_fatal_command_failure() -> None:
         subject.get_all_complete()
 
 
+def test_get_count_by_status() -> None:
+    """It should return the number of commands with a given status."""
+    subject = get_command_view(
+        commands=[
+            create_succeeded_command(command_id="command-id-1"),
+            create_succeeded_command(command_id="command-id-2"),
+            create_running_command(command_id="command-id-3"),
+        ]
+    )
+
+    assert subject.get_count_by_status(cmd.CommandStatus.SUCCEEDED) == 2
+    assert subject.get_count_by_status(cmd.CommandStatus.RUNNING) == 1
+    assert subject.get_count_by_status(cmd.CommandStatus.FAILED) == 0
+
+
 def test_get_all_complete_setup_not_fatal() -> None:
     """It should not call setup command fatal."""
     completed_command = create_succeeded_command(command_id="command-id-1")
@@ -16,6 +16,7 @@ from opentrons.protocol_engine.types import (
     LabwareOffsetLocation,
     DeckSlotLocation,
     LoadedLabware,
+    ModuleModel,
     OFF_DECK_LOCATION,
 )
 from opentrons.protocol_engine.actions import (
@@ -24,6 +25,7 @@ from opentrons.protocol_engine.actions import (
     UpdateCommandAction,
 )
 from opentrons.protocol_engine.state.labware import LabwareStore, LabwareState
+from opentrons.protocol_engine.state.well_layout import create_well_layout
 
 from .command_fixtures import (
     create_load_labware_command,
@@ -74,7 +76,9 @@ def test_initial_state(
             )
         },
         labware_offsets_by_id={},
+        labware_offset_ids_by_key={},
         definitions_by_uri={expected_trash_uri: fixed_trash_def},
+        well_layout_by_uri={},
     )
 
 
@@ -105,6 +109,37 @@ def test_handles_add_labware_offset(
     )
 
     assert subject.state.labware_offsets_by_id == {"offset-id": resolved_offset}
+    assert subject.state.labware_offset_ids_by_key == {
+        ("offset-definition-uri", DeckSlotName.SLOT_1, None): "offset-id"
+    }
+
+
+def test_handles_add_labware_offset_replaces_index(subject: LabwareStore) -> None:
+    """It should index the most recently added offset for a URI and location."""
+    for offset_id in ["offset-id-1", "offset-id-2"]:
+        subject.handle_action(
+            AddLabwareOffsetAction(
+                labware_offset_id=offset_id,
+                created_at=datetime(year=2021, month=1, day=2),
+                request=LabwareOffsetCreate(
+                    definitionUri="offset-definition-uri",
+                    location=LabwareOffsetLocation(
+                        slotName=DeckSlotName.SLOT_1,
+                        moduleModel=ModuleModel.MAGNETIC_MODULE_V2,
+                    ),
+                    vector=LabwareOffsetVector(x=1, y=2, z=3),
+                ),
+            )
+        )
+
+    assert list(subject.state.labware_offsets_by_id) == ["offset-id-1", "offset-id-2"]
+    assert subject.state.labware_offset_ids_by_key == {
+        (
+            "offset-definition-uri",
+            DeckSlotName.SLOT_1,
+            ModuleModel.MAGNETIC_MODULE_V2,
+        ): "offset-id-2"
+    }
 
 
 def test_handles_load_labware(
@@ -171,6 +206,32 @@ def test_handles_add_labware_definition(
     assert subject.state.definitions_by_uri[expected_uri] == well_plate_def
 
 
+def test_add_labware_definition_builds_well_layout(
+    subject: LabwareStore,
+    well_plate_def: LabwareDefinition,
+    fixed_trash_def: LabwareDefinition,
+) -> None:
+    """It should build the well layout of every definition it adds."""
+    uri = uri_from_details(
+        load_name=well_plate_def.parameters.loadName,
+        namespace=well_plate_def.namespace,
+        version=well_plate_def.version,
+    )
+    trash_uri = uri_from_details(
+        load_name=fixed_trash_def.parameters.loadName,
+        namespace=fixed_trash_def.namespace,
+        version=fixed_trash_def.version,
+    )
+
+    subject.handle_action(AddLabwareDefinitionAction(definition=well_plate_def))
+
+    assert subject.state.well_layout_by_uri.keys() == {trash_uri, uri}
+    assert (
+        subject.state.well_layout_by_uri[uri].names
+        == create_well_layout(well_plate_def).names
+    )
+
+
 def test_handles_move_labware(
     subject: LabwareStore,
     well_plate_def: LabwareDefinition,
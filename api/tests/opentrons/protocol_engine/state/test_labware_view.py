@@ -19,7 +19,12 @@ from opentrons.protocol_engine.types import (
     ModuleModel,
 )
 
-from opentrons.protocol_engine.state.labware import LabwareState, LabwareView
+from opentrons.protocol_engine.state.labware import (
+    LabwareState,
+    LabwareView,
+    get_labware_offset_key,
+)
+from opentrons.protocol_engine.state.well_layout import create_well_layout
 
 
 plate = LoadedLabware(
@@ -63,10 +68,20 @@ def get_labware_view(
     deck_definition: Optional[DeckDefinitionV3] = None,
 ) -> LabwareView:
     """Get a labware view test subject."""
+    labware_offsets_by_id = labware_offsets_by_id or {}
+    definitions_by_uri = definitions_by_uri or {}
     state = LabwareState(
         labware_by_id=labware_by_id or {},
-        labware_offsets_by_id=labware_offsets_by_id or {},
-        definitions_by_uri=definitions_by_uri or {},
+        labware_offsets_by_id=labware_offsets_by_id,
+        labware_offset_ids_by_key={
+            get_labware_offset_key(offset.definitionUri, offset.location): offset.id
+            for offset in labware_offsets_by_id.values()
+        },
+        definitions_by_uri=definitions_by_uri,
+        well_layout_by_uri={
+            uri: create_well_layout(definition)
+            for uri, definition in definitions_by_uri.items()
+        },
         deck_definition=deck_definition or cast(DeckDefinitionV3, {"fake": True}),
     )
 
@@ -285,6 +300,21 @@ def test_get_well_rows(falcon_tuberack_def: LabwareDefinition) -> None:
     assert result == expected_rows
 
 
+def test_get_well_layout(falcon_tuberack_def: LabwareDefinition) -> None:
+    """It should get a labware's precomputed well layout."""
+    subject = get_labware_view(
+        labware_by_id={"tube-rack-id": tube_rack},
+        definitions_by_uri={"some-tube-rack-uri": falcon_tuberack_def},
+    )
+
+    result = subject.get_well_layout(labware_id="tube-rack-id")
+
+    assert result.names == ["A1", "B1", "A2", "B2", "A3", "B3"]
+    assert result.rows == {"A": ["A1", "A2", "A3"], "B": ["B1", "B2", "B3"]}
+    assert result.columns == {"1": ["A1", "B1"], "2": ["A2", "B2"], "3": ["A3", "B3"]}
+    assert subject.get_well_layout(labware_id="tube-rack-id") is result
+
+
 def test_get_tip_length_raises_with_non_tip_rack(
     well_plate_def: LabwareDefinition,
 ) -> None:
@@ -8,7 +8,7 @@ from opentrons_shared_data.pipette.dev_types import PipetteNameType
 from opentrons.types import DeckSlotName, MountType
 from opentrons.protocol_engine import commands as cmd
 from opentrons.protocol_engine.types import DeckPoint, DeckSlotLocation, LoadedPipette
-from opentrons.protocol_engine.actions import UpdateCommandAction
+from opentrons.protocol_engine.actions import PlayAction, UpdateCommandAction
 from opentrons.protocol_engine.state.pipettes import (
     PipetteStore,
     PipetteState,
@@ -16,6 +16,7 @@ from opentrons.protocol_engine.state.pipettes import (
 )
 
 from .command_fixtures import (
+    create_running_command,
     create_load_pipette_command,
     create_aspirate_command,
     create_dispense_command,
@@ -47,6 +48,20 @@ def test_sets_initial_state(subject: PipetteStore) -> None:
     )
 
 
+def test_is_affected_by_completed_commands(subject: PipetteStore) -> None:
+    """It should only be affected by commands with results."""
+    running_command = create_running_command()
+    completed_command = create_load_pipette_command(
+        pipette_id="pipette-id",
+        pipette_name=PipetteNameType.P300_SINGLE,
+        mount=MountType.LEFT,
+    )
+
+    assert subject.is_affected_by(UpdateCommandAction(command=running_command)) is False
+    assert subject.is_affected_by(UpdateCommandAction(command=completed_command))
+    assert subject.is_affected_by(PlayAction(requested_at=datetime.now())) is False
+
+
 def test_handles_load_pipette(subject: PipetteStore) -> None:
     """It should add the pipette data to the state."""
     command = create_load_pipette_command(
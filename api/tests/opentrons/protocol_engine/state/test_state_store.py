@@ -6,10 +6,18 @@ import pytest
 from decoy import Decoy
 
 from opentrons_shared_data.deck.dev_types import DeckDefinitionV3
+from opentrons.protocol_engine.types import EngineStatus
 from opentrons.protocol_engine.state import State, StateStore, Config
-from opentrons.protocol_engine.actions import PlayAction
+from opentrons.protocol_engine.actions import (
+    PlayAction,
+    PauseAction,
+    PauseSource,
+    UpdateCommandAction,
+)
 from opentrons.protocol_engine.state.change_notifier import ChangeNotifier
 
+from .command_fixtures import create_running_command
+
 
 @pytest.fixture
 def change_notifier(decoy: Decoy) -> ChangeNotifier:
@@ -60,10 +68,10 @@ def test_notify_on_state_change(
     change_notifier: ChangeNotifier,
     subject: StateStore,
 ) -> None:
-    """It should notify state changes when actions are handled."""
-    decoy.verify(change_notifier.notify(), times=0)
+    """It should notify state changes, by action type, when actions are handled."""
+    decoy.verify(change_notifier.notify(topics=(PlayAction,)), times=0)
     subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
-    decoy.verify(change_notifier.notify(), times=1)
+    decoy.verify(change_notifier.notify(topics=(PlayAction,)), times=1)
 
 
 async def test_wait_for_state(
@@ -83,7 +91,7 @@ async def test_wait_for_state(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=2)
+    decoy.verify(await change_notifier.wait(topics=None), times=2)
 
 
 async def test_wait_for_state_short_circuit(
@@ -99,7 +107,7 @@ async def test_wait_for_state_short_circuit(
     result = await subject.wait_for(check_condition, "foo", bar="baz")
     assert result == "hello world"
 
-    decoy.verify(await change_notifier.wait(), times=0)
+    decoy.verify(await change_notifier.wait(topics=None), times=0)
 
 
 async def test_wait_for_already_true(decoy: Decoy, subject: StateStore) -> None:
@@ -117,3 +125,82 @@ async def test_wait_for_raises(decoy: Decoy, subject: StateStore) -> None:
 
     with pytest.raises(ValueError, match="oh no"):
         await subject.wait_for(check_condition)
+
+
+def test_version_increments_on_state_change(subject: StateStore) -> None:
+    """It should increment the state version when an action changes state."""
+    assert subject.version == 0
+
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
+    assert subject.version == 1
+
+    subject.handle_action(PauseAction(source=PauseSource.CLIENT))
+    assert subject.version == 2
+
+
+def test_summary_cached_until_state_change(subject: StateStore) -> None:
+    """It should only rebuild the state summary after state has changed."""
+    result_1 = subject.get_summary()
+    result_2 = subject.get_summary()
+
+    assert result_1 is result_2
+
+    subject.handle_action(PlayAction(requested_at=datetime(year=2021, month=1, day=1)))
+    result_3 = subject.get_summary()
+
+    assert result_3 is not result_1
+    assert result_3.status == EngineStatus.RUNNING
+
+
+async def test_wait_for_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should wait for notifications of the given topics."""
+    check_condition: Callable[..., Optional[str]] = decoy.mock()
+
+    decoy.when(check_condition("foo", bar="baz")).then_return(None, "hello world")
+
+    result = await subject.wait_for_topics(
+        [PlayAction, "command-id"], check_condition, "foo", bar="baz"
+    )
+    assert result == "hello world"
+
+    decoy.verify(
+        await change_notifier.wait(topics=[PlayAction, "command-id"]),
+        times=1,
+    )
+
+
+def test_notify_command_topics(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should include the command ID in command update notifications."""
+    command = create_running_command(command_id="command-id")
+    subject.handle_action(UpdateCommandAction(command=command))
+
+    decoy.verify(
+        change_notifier.notify(topics=(UpdateCommandAction, "command-id")),
+        times=1,
+    )
+
+
+def test_handle_actions_batch(
+    decoy: Decoy,
+    change_notifier: ChangeNotifier,
+    subject: StateStore,
+) -> None:
+    """It should apply a batch of actions, then update and notify only once."""
+    subject.handle_actions(
+        [
+            PlayAction(requested_at=datetime(year=2021, month=1, day=1)),
+            PauseAction(source=PauseSource.CLIENT),
+        ]
+    )
+
+    assert subject.version == 1
+    assert subject.commands.get_status() == EngineStatus.PAUSED
+    decoy.verify(change_notifier.notify(topics={PlayAction, PauseAction}), times=1)
@@ -55,3 +55,20 @@ async def test_create_engine_initializes_state_with_door_state(
     )
     state = engine.state_view
     assert state.commands.get_is_door_blocking() is True
+
+
+async def test_create_engine_with_loaded_deck(
+    hardware_api: HardwareAPI,
+    standard_deck_def: DeckDefinitionV3,
+) -> None:
+    """It should use a deck definition and fixed labware that are already loaded."""
+    engine = await create_protocol_engine(
+        hardware_api=hardware_api,
+        config=EngineConfig(),
+        deck_definition=standard_deck_def,
+        deck_fixed_labware=[],
+    )
+    state = engine.state_view
+
+    assert state.labware.get_deck_definition() is standard_deck_def
+    assert state.labware.get_all() == []
@@ -45,6 +45,7 @@ from opentrons.protocol_engine.actions import (
     FinishAction,
     FinishErrorDetails,
     QueueCommandAction,
+    FailCommandAction,
     HardwareStoppedAction,
 )
 
@@ -260,8 +261,9 @@ async def test_add_and_execute_command(
     ).then_do(_stub_queued)
 
     decoy.when(
-        await state_store.wait_for(
-            condition=state_store.commands.get_is_complete,
+        await state_store.wait_for_topics(
+            ["command-id", FailCommandAction],
+            state_store.commands.get_is_complete,
             command_id="command-id",
         ),
     ).then_do(_stub_completed)
@@ -12,6 +12,7 @@ from opentrons.protocols.models import LabwareDefinition
 from opentrons.protocol_reader import (
     ProtocolReader,
     ProtocolSource,
+    ProtocolSourceSummary,
     ProtocolSourceFile,
     ProtocolFileRole,
     PythonProtocolConfig,
@@ -36,6 +37,7 @@ from opentrons.protocol_reader.config_analyzer import (
     ConfigAnalysis,
     ConfigAnalysisError,
 )
+from opentrons.protocol_reader.summary_reader import SummaryReader
 
 
 @dataclass(frozen=True)
@@ -64,17 +66,25 @@ def config_analyzer(decoy: Decoy) -> ConfigAnalyzer:
     return decoy.mock(cls=ConfigAnalyzer)
 
 
+@pytest.fixture
+def summary_reader(decoy: Decoy) -> SummaryReader:
+    """Get a mocked out SummaryReader."""
+    return decoy.mock(cls=SummaryReader)
+
+
 @pytest.fixture
 def subject(
     file_reader_writer: FileReaderWriter,
     role_analyzer: RoleAnalyzer,
     config_analyzer: ConfigAnalyzer,
+    summary_reader: SummaryReader,
 ) -> ProtocolReader:
     """Create a ProtocolReader test subject."""
     return ProtocolReader(
         file_reader_writer=file_reader_writer,
         role_analyzer=role_analyzer,
         config_analyzer=config_analyzer,
+        summary_reader=summary_reader,
     )
 
 
@@ -295,3 +305,60 @@ async def test_read_files_no_copy(
         ),
         times=0,
     )
+
+
+async def test_read_saved_summary(
+    decoy: Decoy,
+    summary_reader: SummaryReader,
+    subject: ProtocolReader,
+) -> None:
+    """It should read a summary of saved files."""
+    summary = ProtocolSourceSummary(
+        directory=Path("/dev/null"),
+        main_file=Path("/dev/null/protocol.py"),
+        files=[
+            ProtocolSourceFile(
+                path=Path("/dev/null/protocol.py"),
+                role=ProtocolFileRole.MAIN,
+            ),
+        ],
+        metadata={"hey": "there"},
+        config=PythonProtocolConfig(api_version=APIVersion(123, 456)),
+    )
+
+    decoy.when(
+        await summary_reader.read(
+            files=[Path("/dev/null/protocol.py")], directory=Path("/dev/null")
+        )
+    ).then_return(summary)
+
+    result = await subject.read_saved_summary(
+        files=[Path("/dev/null/protocol.py")], directory=Path("/dev/null")
+    )
+
+    assert result == summary
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        FileReadError("oh no"),
+        RoleAnalysisError("oh no"),
+        ConfigAnalysisError("oh no"),
+    ],
+)
+async def test_read_saved_summary_error(
+    decoy: Decoy,
+    summary_reader: SummaryReader,
+    subject: ProtocolReader,
+    error: Exception,
+) -> None:
+    """It should raise a ProtocolFilesInvalidError if the summary can't be read."""
+    decoy.when(
+        await summary_reader.read(files=[Path("/dev/null/protocol.py")], directory=None)
+    ).then_raise(error)
+
+    with pytest.raises(ProtocolFilesInvalidError, match="oh no"):
+        await subject.read_saved_summary(
+            files=[Path("/dev/null/protocol.py")], directory=None
+        )
@@ -0,0 +1,150 @@
+"""Tests for opentrons.protocol_reader.summary_reader.SummaryReader."""
+import json
+import pytest
+from pathlib import Path
+
+from opentrons_shared_data import load_shared_data
+
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocol_reader import (
+    ProtocolReader,
+    ProtocolSourceSummary,
+    ProtocolSourceFile,
+    ProtocolFileRole,
+    JsonProtocolConfig,
+    PythonProtocolConfig,
+)
+from opentrons.protocol_reader.file_reader_writer import FileReadError
+from opentrons.protocol_reader.role_analyzer import RoleAnalysisError
+from opentrons.protocol_reader.summary_reader import SummaryReader, PEEK_SIZE
+
+
+PYTHON_PROTOCOL = b"""
+metadata = {"apiLevel": "2.12", "protocolName": "Hello"}
+
+def run(ctx):
+    pass
+"""
+
+LABWARE = load_shared_data("labware/definitions/2/opentrons_96_tiprack_300ul/1.json")
+
+
+@pytest.fixture
+def subject() -> SummaryReader:
+    """Get a SummaryReader test subject."""
+    return SummaryReader()
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    [
+        "3/simple.json",
+        "5/simpleV5.json",
+        "5/multipleTipracksWithTC.json",
+        "6/simpleV6.json",
+        "6/multipleTipracksWithTC.json",
+    ],
+)
+async def test_read_json_protocol(
+    fixture_name: str, tmp_path: Path, subject: SummaryReader
+) -> None:
+    """It should summarize JSON protocols like a full read would."""
+    protocol_path = tmp_path / "protocol.json"
+    labware_path = tmp_path / "labware.json"
+    protocol_path.write_bytes(load_shared_data(f"protocol/fixtures/{fixture_name}"))
+    labware_path.write_bytes(LABWARE)
+
+    result = await subject.read(files=[protocol_path, labware_path], directory=tmp_path)
+    full_result = await ProtocolReader().read_saved(
+        files=[protocol_path, labware_path], directory=tmp_path
+    )
+
+    assert result == ProtocolSourceSummary(
+        directory=full_result.directory,
+        main_file=full_result.main_file,
+        files=full_result.files,
+        metadata=full_result.metadata,
+        config=full_result.config,
+    )
+
+
+async def test_read_json_protocol_prefix(
+    tmp_path: Path, subject: SummaryReader
+) -> None:
+    """It should only read as much of a JSON protocol as it needs to."""
+    header = {
+        "$otSharedSchema": "#/protocol/schemas/6",
+        "schemaVersion": 6,
+        "metadata": {"protocolName": "Big protocol", "author": None},
+        "labwareDefinitions": {"some-uri": {"padding": "x" * PEEK_SIZE}},
+    }
+    # Invalid past the prefix, so a full parse would fail
+    contents = json.dumps(header).encode()[:PEEK_SIZE] + b"not json"
+    protocol_path = tmp_path / "protocol.json"
+    protocol_path.write_bytes(contents)
+
+    result = await subject.read(files=[protocol_path], directory=None)
+
+    assert result == ProtocolSourceSummary(
+        directory=None,
+        main_file=protocol_path,
+        files=[ProtocolSourceFile(path=protocol_path, role=ProtocolFileRole.MAIN)],
+        metadata={"protocolName": "Big protocol"},
+        config=JsonProtocolConfig(schema_version=6),
+    )
+
+
+async def test_read_python_protocol(tmp_path: Path, subject: SummaryReader) -> None:
+    """It should summarize a Python protocol and its labware files."""
+    protocol_path = tmp_path / "protocol.py"
+    labware_path = tmp_path / "labware.json"
+    readme_path = tmp_path / "README.md"
+    protocol_path.write_bytes(PYTHON_PROTOCOL)
+    labware_path.write_bytes(LABWARE)
+    readme_path.write_text("# hello")
+
+    result = await subject.read(
+        files=[readme_path, labware_path, protocol_path], directory=tmp_path
+    )
+
+    assert result == ProtocolSourceSummary(
+        directory=tmp_path,
+        main_file=protocol_path,
+        files=[
+            ProtocolSourceFile(path=protocol_path, role=ProtocolFileRole.MAIN),
+            ProtocolSourceFile(path=labware_path, role=ProtocolFileRole.LABWARE),
+        ],
+        metadata={"apiLevel": "2.12", "protocolName": "Hello"},
+        config=PythonProtocolConfig(api_version=APIVersion(2, 12)),
+    )
+
+
+async def test_read_invalid_json(tmp_path: Path, subject: SummaryReader) -> None:
+    """It should raise if a JSON file can't be identified."""
+    protocol_path = tmp_path / "protocol.json"
+    protocol_path.write_text('{"hello": ')
+
+    with pytest.raises(FileReadError, match="protocol.json is not valid JSON"):
+        await subject.read(files=[protocol_path], directory=None)
+
+
+async def test_read_multiple_main_files(tmp_path: Path, subject: SummaryReader) -> None:
+    """It should raise if there's more than one main file candidate."""
+    protocol_path = tmp_path / "protocol.py"
+    json_protocol_path = tmp_path / "protocol.json"
+    protocol_path.write_bytes(PYTHON_PROTOCOL)
+    json_protocol_path.write_bytes(
+        load_shared_data("protocol/fixtures/6/simpleV6.json")
+    )
+
+    with pytest.raises(RoleAnalysisError, match="Could not pick single main file"):
+        await subject.read(files=[protocol_path, json_protocol_path], directory=None)
+
+
+async def test_read_no_main_file(tmp_path: Path, subject: SummaryReader) -> None:
+    """It should raise if there's no main file."""
+    labware_path = tmp_path / "labware.json"
+    labware_path.write_bytes(LABWARE)
+
+    with pytest.raises(RoleAnalysisError, match="not a valid protocol file"):
+        await subject.read(files=[labware_path], directory=None)
@@ -27,7 +27,11 @@ from opentrons.protocol_engine import (
     commands,
 )
 from opentrons.protocol_reader import ProtocolReader
-from opentrons.protocol_runner import create_simulating_runner
+from opentrons.protocol_engine import EngineStatus
+from opentrons.protocol_runner import (
+    SimulatingRunnerFactory,
+    create_simulating_runner,
+)
 
 
 # TODO (tz, 6-17-22): API version 3.x in-development.
@@ -262,3 +266,35 @@ async def test_runner_with_legacy_json(legacy_json_protocol_file: Path) -> None:
     )
 
     assert expected_command in commands_result
+
+
+async def test_runners_from_factory(
+    json_protocol_file: Path, legacy_python_protocol_file: Path
+) -> None:
+    """It should run protocols one after another on reused simulated hardware."""
+    protocol_reader = ProtocolReader()
+    json_source = await protocol_reader.read_saved(
+        files=[json_protocol_file],
+        directory=None,
+    )
+    legacy_python_source = await protocol_reader.read_saved(
+        files=[legacy_python_protocol_file],
+        directory=None,
+    )
+
+    expected_result = await (await create_simulating_runner()).run(json_source)
+    factory = await SimulatingRunnerFactory.build()
+
+    # Each of these protocols picks up a tip and leaves it on the pipette,
+    # which must not leak into the next run
+    for source in [json_source, legacy_python_source, json_source]:
+        result = await (await factory.create_runner()).run(source)
+
+        assert result.state_summary.status == EngineStatus.SUCCEEDED
+        assert result.state_summary.errors == []
+
+    assert result.state_summary.pipettes == expected_result.state_summary.pipettes
+    assert result.state_summary.labware == expected_result.state_summary.labware
+    assert [c.params for c in result.commands] == [
+        c.params for c in expected_result.commands
+    ]
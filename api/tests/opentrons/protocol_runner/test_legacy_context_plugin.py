@@ -149,7 +149,9 @@ async def test_command_broker_messages(
     await subject.teardown()
 
     decoy.verify(
-        mock_action_dispatcher.dispatch(pe_actions.UpdateCommandAction(engine_command))
+        mock_action_dispatcher.dispatch_batch(
+            [pe_actions.UpdateCommandAction(engine_command)]
+        )
     )
 
 
@@ -206,5 +208,7 @@ async def test_equipment_broker_messages(
     await subject.teardown()
 
     decoy.verify(
-        mock_action_dispatcher.dispatch(pe_actions.UpdateCommandAction(engine_command))
+        mock_action_dispatcher.dispatch_batch(
+            [pe_actions.UpdateCommandAction(engine_command)]
+        )
     )
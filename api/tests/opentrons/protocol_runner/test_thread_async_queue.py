@@ -47,6 +47,23 @@ def test_basic_single_threaded_behavior() -> None:
         subject.get()
 
 
+def test_get_batch_single_threaded_behavior() -> None:
+    """Test retrieving values in batches in a single thread."""
+    subject = ThreadAsyncQueue[int]()
+
+    subject.put(1)
+    subject.put(2)
+    assert subject.get_batch() == [1, 2]
+
+    subject.put(3)
+    subject.done_putting()
+    assert list(subject.get_batch_until_closed()) == [[3]]
+
+    # After retrieving all values, further retrievals raise.
+    with pytest.raises(QueueClosed):
+        subject.get_batch()
+
+
 def test_multi_thread_producer_consumer() -> None:
     """Stochastically smoke-test thread safety.
 
@@ -153,6 +170,28 @@ async def test_async() -> None:
     assert consumed == [_ProducedValue(producer_id=0, value=v) for v in expected_values]
 
 
+async def test_async_batches() -> None:
+    """Smoke-test async batch support.
+
+    Like `test_async()`, but the consumer takes values in batches.
+    """
+    expected_values = list(range(1000))
+
+    subject = ThreadAsyncQueue[_ProducedValue]()
+
+    consumer = asyncio.create_task(_consume_batches_async(queue=subject))
+    try:
+        with subject:
+            await _produce_async(queue=subject, values=expected_values, producer_id=0)
+    finally:
+        consumed = await consumer
+
+    assert all(len(batch) > 0 for batch in consumed)
+    assert list(chain(*consumed)) == [
+        _ProducedValue(producer_id=0, value=v) for v in expected_values
+    ]
+
+
 class _ProducedValue(NamedTuple):
     producer_id: int
     value: int
@@ -198,3 +237,13 @@ async def _consume_async(
     async for value in queue.get_async_until_closed():
         result.append(value)
     return result
+
+
+async def _consume_batches_async(
+    queue: ThreadAsyncQueue[_ProducedValue],
+) -> List[List[_ProducedValue]]:
+    """Like `_consume_async()`, except take values in batches."""
+    result = []
+    async for batch in queue.get_batch_async_until_closed():
+        result.append(batch)
+    return result
@@ -1545,3 +1545,81 @@ def test_blowout_to_dest(_instr_labware):
     ]
     for step, expected in zip(consd_plan, exp):
         assert step == expected
+
+
+def test_gradient_volumes_regression(_instr_labware):
+    # Regression test: a (start, end) volume tuple used to raise an
+    # AttributeError, because the volume list was built before the
+    # transfer options that hold the gradient function were set
+    _instr_labware["ctx"].home()
+    lw1 = _instr_labware["lw1"]
+    lw2 = _instr_labware["lw2"]
+
+    options = tx.TransferOptions()
+    options = options._replace(
+        transfer=options.transfer._replace(
+            new_tip=TransferTipPolicy.NEVER,
+            gradient_function=lambda x: x * x,
+        )
+    )
+
+    xfer_plan = tx.TransferPlan(
+        (10, 100),
+        lw1.columns()[0][:3],
+        lw2.columns()[0][:3],
+        _instr_labware["instr"],
+        max_volume=_instr_labware["instr"].hw_pipette["working_volume"],
+        api_version=_instr_labware["ctx"].api_version,
+        mode="transfer",
+        options=options,
+    )
+
+    exp = [
+        {"method": "aspirate", "args": [10, lw1["A1"], 1.0], "kwargs": {}},
+        {"method": "dispense", "args": [10, lw2["A1"], 1.0], "kwargs": {}},
+        {"method": "aspirate", "args": [32.5, lw1["B1"], 1.0], "kwargs": {}},
+        {"method": "dispense", "args": [32.5, lw2["B1"], 1.0], "kwargs": {}},
+        {"method": "aspirate", "args": [100, lw1["C1"], 1.0], "kwargs": {}},
+        {"method": "dispense", "args": [100, lw2["C1"], 1.0], "kwargs": {}},
+    ]
+    assert list(xfer_plan) == exp
+
+
+def test_distribute_groups_for_max_volume(_instr_labware):
+    _instr_labware["ctx"].home()
+    lw1 = _instr_labware["lw1"]
+    lw2 = _instr_labware["lw2"]
+
+    options = tx.TransferOptions()
+    options = options._replace(
+        transfer=options.transfer._replace(
+            new_tip=TransferTipPolicy.NEVER, disposal_volume=20, air_gap=10
+        )
+    )
+
+    # Each aspirate fits the dispenses, the disposal volume, and one air gap
+    dist_plan = tx.TransferPlan(
+        [120, 0, 150, 200],
+        lw1["A1"],
+        lw2.columns()[0][:4],
+        _instr_labware["instr"],
+        max_volume=300,
+        api_version=_instr_labware["ctx"].api_version,
+        mode="distribute",
+        options=options,
+    )
+
+    trash = _instr_labware["instr"].trash_container.wells()[0]
+    exp = [
+        {"method": "aspirate", "args": [290, lw1["A1"], 1.0], "kwargs": {}},
+        {"method": "air_gap", "args": [10], "kwargs": {}},
+        {"method": "dispense", "args": [130, lw2["A1"], 1.0], "kwargs": {}},
+        {"method": "air_gap", "args": [10], "kwargs": {}},
+        {"method": "dispense", "args": [160, lw2["C1"], 1.0], "kwargs": {}},
+        {"method": "blow_out", "args": [trash], "kwargs": {}},
+        {"method": "aspirate", "args": [220, lw1["A1"], 1.0], "kwargs": {}},
+        {"method": "air_gap", "args": [10], "kwargs": {}},
+        {"method": "dispense", "args": [210, lw2["D1"], 1.0], "kwargs": {}},
+        {"method": "blow_out", "args": [trash], "kwargs": {}},
+    ]
+    assert list(dist_plan) == exp
@@ -0,0 +1,106 @@
+"""Tests for opentrons.protocols.api_support.tip_rack_state."""
+import pytest
+
+from opentrons.protocols.api_support.tip_rack_state import TipRackState
+
+
+@pytest.fixture
+def subject() -> TipRackState:
+    """Get a full 12-column, 8-row tip rack state."""
+    return TipRackState(column_lengths=[8] * 12)
+
+
+def test_initial_state() -> None:
+    """It should start out either full or empty."""
+    full = TipRackState(column_lengths=[8, 8])
+    empty = TipRackState(column_lengths=[8, 8], has_tip=False)
+
+    assert full.has_tips(0, 0, 8) and full.has_tips(1, 0, 8)
+    assert empty.has_no_tips(0, 0, 8) and empty.has_no_tips(1, 0, 8)
+
+
+def test_set_tips(subject: TipRackState) -> None:
+    """It should set a span of a column, stopping at the end of the column."""
+    subject.set_tips(1, 6, 4, has_tip=False)
+
+    assert subject.has_tips(1, 0, 6)
+    assert not subject.has_tip(1, 6)
+    assert not subject.has_tip(1, 7)
+    assert subject.has_no_tips(1, 6, 8)
+    assert subject.has_tips(2, 0, 8)
+
+    subject.set_tips(1, 7, 1, has_tip=True)
+
+    assert not subject.has_tip(1, 6)
+    assert subject.has_tip(1, 7)
+
+
+def test_find_tips(subject: TipRackState) -> None:
+    """It should only consider the first run of tips in each column."""
+    assert subject.find_tips(8) == (0, 0)
+    assert subject.find_tips(9) is None
+
+    subject.set_tips(0, 0, 1, has_tip=False)
+    subject.set_tips(0, 3, 1, has_tip=False)
+
+    assert subject.find_tips(1) == (0, 1)
+    assert subject.find_tips(2) == (0, 1)
+    # B1 to C1 is too short, and D1 to H1 isn't the first run in the column
+    assert subject.find_tips(3) == (1, 0)
+    assert subject.find_tips(4, start_column=0, start_row=4) == (0, 4)
+    assert subject.find_tips(1, start_column=11, start_row=7) == (11, 7)
+    assert subject.find_tips(2, start_column=11, start_row=7) is None
+
+
+def test_find_empty(subject: TipRackState) -> None:
+    """It should only consider the first run of empty wells in each column."""
+    assert subject.find_empty(1) is None
+
+    subject.set_tips(2, 5, 1, has_tip=False)
+    subject.set_tips(2, 7, 1, has_tip=False)
+    subject.set_tips(3, 2, 2, has_tip=False)
+
+    assert subject.find_empty(1) == (2, 5)
+    assert subject.find_empty(2) == (3, 2)
+    assert subject.find_empty(3) is None
+
+
+def test_reset(subject: TipRackState) -> None:
+    """It should reset every well at once."""
+    subject.set_tips(4, 0, 8, has_tip=False)
+    subject.reset()
+    assert subject.find_tips(8) == (0, 0)
+
+    subject.reset(has_tip=False)
+    assert subject.find_tips(1) is None
+    assert subject.find_empty(8) == (0, 0)
+
+
+def test_serialization(subject: TipRackState) -> None:
+    """It should round-trip through bytes, one byte per column of 8 wells."""
+    subject.set_tips(0, 0, 3, has_tip=False)
+    subject.set_tips(11, 7, 1, has_tip=False)
+
+    data = subject.to_bytes()
+    result = TipRackState.from_bytes(column_lengths=[8] * 12, data=data)
+
+    assert len(data) == 12
+    assert result.to_bytes() == data
+    assert result.find_tips(1) == (0, 3)
+    assert not result.has_tip(11, 7)
+    assert result.has_tips(11, 0, 7)
+
+
+def test_serialization_uneven_columns() -> None:
+    """It should serialize columns of any length."""
+    subject = TipRackState(column_lengths=[16, 3, 9])
+    subject.set_tips(0, 15, 1, has_tip=False)
+    subject.set_tips(2, 8, 1, has_tip=False)
+
+    result = TipRackState.from_bytes(column_lengths=[16, 3, 9], data=subject.to_bytes())
+
+    assert result.has_tips(0, 0, 15)
+    assert not result.has_tip(0, 15)
+    assert result.has_tips(1, 0, 3)
+    assert result.has_tips(2, 0, 8)
+    assert not result.has_tip(2, 8)
@@ -157,3 +157,54 @@ def test_return_tips(wells, tiptracker):
     assert wells[7].has_tip()
     # But we won't wrap around
     assert not wells[8].has_tip()
+
+
+def test_wells_share_tip_state(wells, tiptracker):
+    # Tips used through the tracker are visible on the wells
+    tiptracker.use_tips(wells[8], num_channels=8)
+    assert not any(well.has_tip() for well in wells[8:16])
+    assert tiptracker.get_state().has_no_tips(1, 0, 8)
+
+    # Tips set on the wells are visible to the tracker
+    wells[0].set_has_tip(False)
+    assert tiptracker.next_tip(8) is wells[16]
+    assert not tiptracker.get_state().has_tip(0, 0)
+
+
+def test_reset(wells, tiptracker):
+    tiptracker.use_tips(wells[0], num_channels=8)
+    wells[95].set_has_tip(False)
+
+    tiptracker.reset()
+
+    assert all(well.has_tip() for well in wells)
+    assert tiptracker.next_tip(8) is wells[0]
+
+
+def test_bind_keeps_tip_presence(names_96_well):
+    wells = [
+        WellImplementation(
+            well_geometry=None, display_name=n, has_tip=(n != "B1"), name=n
+        )
+        for n in names_96_well
+    ]
+    tiptracker = TipTracker(WellGrid(wells).get_columns())
+
+    assert not wells[1].has_tip()
+    assert tiptracker.next_tip() is wells[0]
+    assert tiptracker.next_tip(2) is wells[8]
+
+
+def test_next_tip_starting_tip(wells, tiptracker):
+    # Only the first run of tips after the starting tip counts
+    wells[4].set_has_tip(False)
+    assert tiptracker.next_tip(3, starting_tip=wells[1]) is wells[1]
+    assert tiptracker.next_tip(4, starting_tip=wells[1]) is wells[8]
+    assert tiptracker.next_tip(1, starting_tip=wells[95]) is wells[95]
+    assert tiptracker.next_tip(2, starting_tip=wells[95]) is None
+
+
+def test_return_tips_error(wells, tiptracker):
+    wells[0].set_has_tip(False)
+    with pytest.raises(AssertionError, match="Well B1 has a tip"):
+        tiptracker.return_tips(wells[0], 2)
@@ -0,0 +1,87 @@
+"""Tests for opentrons.protocols.labware definition lookup."""
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from opentrons_shared_data.labware import load_definition
+from opentrons.protocols import labware
+
+
+@pytest.fixture
+def user_defs_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point custom labware lookups at a temporary directory."""
+    monkeypatch.setattr(labware, "USER_DEFS_PATH", tmp_path)
+    return tmp_path
+
+
+def _write_custom_definition(user_defs_path: Path, display_name: str) -> Path:
+    definition = load_definition("opentrons_96_tiprack_300ul", 1)
+    definition["namespace"] = "custom_beta"
+    definition["metadata"]["displayName"] = display_name
+    def_path = user_defs_path / "custom_beta" / "opentrons_96_tiprack_300ul" / "1.json"
+    def_path.parent.mkdir(parents=True, exist_ok=True)
+    def_path.write_text(json.dumps(definition))
+    return def_path
+
+
+def test_get_labware_definition_returns_new_dicts() -> None:
+    """Callers should each get a dict that they're free to modify."""
+    result_1 = labware.get_labware_definition("opentrons_96_tiprack_300ul")
+    result_1["ordering"] = []
+    result_2 = labware.get_labware_definition("opentrons_96_tiprack_300ul")
+
+    assert result_2 == load_definition("opentrons_96_tiprack_300ul", 1)
+
+
+def test_get_labware_definition_model_reused() -> None:
+    """It should parse each definition only once."""
+    result_1 = labware.get_labware_definition_model(
+        "opentrons_96_tiprack_300ul", "opentrons", 1
+    )
+    result_2 = labware.get_labware_definition_model(
+        "OPENTRONS_96_TIPRACK_300UL", "opentrons", 1
+    )
+
+    assert result_1 is result_2
+    assert result_1.dict(exclude_none=True) == load_definition(
+        "opentrons_96_tiprack_300ul", 1
+    )
+
+
+def test_get_labware_definition_model_not_found() -> None:
+    """It should raise if the definition doesn't exist."""
+    with pytest.raises(FileNotFoundError):
+        labware.get_labware_definition_model("not_a_labware", "opentrons", 1)
+
+
+def test_custom_definition_reloaded_when_changed(user_defs_path: Path) -> None:
+    """It should pick up changes to custom definition files."""
+    def_path = _write_custom_definition(user_defs_path, "Before")
+    before = labware.get_labware_definition_model(
+        "opentrons_96_tiprack_300ul", "custom_beta", 1
+    )
+
+    assert before.metadata.displayName == "Before"
+    assert (
+        labware.get_labware_definition_model(
+            "opentrons_96_tiprack_300ul", "custom_beta", 1
+        )
+        is before
+    )
+
+    _write_custom_definition(user_defs_path, "After (changed)")
+    stat = def_path.stat()
+    os.utime(def_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    after = labware.get_labware_definition_model(
+        "opentrons_96_tiprack_300ul", "custom_beta", 1
+    )
+    assert after.metadata.displayName == "After (changed)"
+    assert (
+        labware.get_labware_definition("opentrons_96_tiprack_300ul", "custom_beta", 1)[
+            "metadata"
+        ]["displayName"]
+        == "After (changed)"
+    )
@@ -0,0 +1,85 @@
+"""Tests for opentrons.protocols.schemas."""
+import threading
+from typing import Any, Dict, List
+
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons_shared_data.labware import load_definition
+from opentrons.protocols import schemas
+
+
+def test_get_validator_reused() -> None:
+    """It should build each validator only once per thread."""
+    result = schemas.get_validator(schemas.LABWARE_SCHEMA_V2)
+
+    assert schemas.get_validator(schemas.LABWARE_SCHEMA_V2) is result
+
+    other_thread_result: List[Any] = []
+    thread = threading.Thread(
+        target=lambda: other_thread_result.append(
+            schemas.get_validator(schemas.LABWARE_SCHEMA_V2)
+        )
+    )
+    thread.start()
+    thread.join()
+
+    assert other_thread_result[0] is not result
+
+
+def test_validate_matches_jsonschema() -> None:
+    """It should raise the same errors as jsonschema.validate()."""
+    schema = schemas.load_schema(schemas.LABWARE_SCHEMA_V2)
+    definition: Dict[str, Any] = dict(load_definition("opentrons_96_tiprack_300ul", 1))
+    del definition["ordering"]
+
+    schemas.validate(
+        load_definition("opentrons_96_tiprack_300ul", 1), schemas.LABWARE_SCHEMA_V2
+    )
+
+    with pytest.raises(jsonschema.ValidationError) as expected:
+        jsonschema.validate(definition, schema)
+
+    with pytest.raises(jsonschema.ValidationError) as result:
+        schemas.validate(definition, schemas.LABWARE_SCHEMA_V2)
+
+    assert result.value.message == expected.value.message
+
+
+def test_validate_resolves_labware_schema_refs() -> None:
+    """It should resolve protocol schemas' references to the labware schema."""
+    definition: Dict[str, Any] = dict(load_definition("opentrons_96_tiprack_300ul", 1))
+    del definition["ordering"]
+    protocol: Any = {
+        "schemaVersion": 3,
+        "metadata": {},
+        "robot": {"model": "OT-2 Standard"},
+        "pipettes": {},
+        "labware": {},
+        "labwareDefinitions": {"tiprack": definition},
+        "commands": [],
+    }
+
+    with pytest.raises(jsonschema.ValidationError):
+        schemas.validate(protocol, "protocol/schemas/3.json")
+
+    protocol["labwareDefinitions"]["tiprack"] = load_definition(
+        "opentrons_96_tiprack_300ul", 1
+    )
+    schemas.validate(protocol, "protocol/schemas/3.json")
+
+
+def test_validate_many() -> None:
+    """It should return an error, or None, for each object."""
+    invalid: Dict[str, Any] = dict(load_definition("opentrons_96_tiprack_300ul", 1))
+    del invalid["ordering"]
+
+    result = schemas.validate_many(
+        [load_definition("opentrons_96_tiprack_300ul", 1), invalid, {}],
+        schemas.LABWARE_SCHEMA_V2,
+    )
+
+    assert result[0] is None
+    assert isinstance(result[1], jsonschema.ValidationError)
+    assert isinstance(result[2], jsonschema.ValidationError)
+    assert not schemas.is_valid(invalid, schemas.LABWARE_SCHEMA_V2)
@@ -0,0 +1,182 @@
+"""Benchmark robot-server persistence against a database with many runs.
+
+Fills a fresh database with 300 archived runs and 50 analyzed protocols,
+then measures the latency of listing runs, fetching a page of a run's
+commands, fetching an analysis, and archiving a run,
+once for each database profile.
+"""
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+from opentrons.protocol_engine import EngineStatus, StateSummary, commands
+from opentrons.protocol_reader import JsonProtocolConfig, ProtocolSource
+
+from robot_server.persistence.database import (
+    DATABASE_PROFILES,
+    DatabaseProfileName,
+    create_sql_engine,
+)
+from robot_server.protocols import ProtocolResource
+from robot_server.protocols.analysis_store import AnalysisStore
+from robot_server.protocols.protocol_store import ProtocolStore
+from robot_server.runs.run_store import RunStore
+
+RUN_COUNT = 300
+PROTOCOL_COUNT = 50
+COMMANDS_PER_RUN = 200
+PAGE_LENGTH = 20
+REPETITIONS = 100
+
+
+def _create_commands(prefix: str) -> List[commands.Command]:
+    return [
+        commands.Home(
+            id=f"{prefix}-command-{i}",
+            key=f"{prefix}-command-{i}",
+            status=commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime.now(timezone.utc),
+            startedAt=datetime.now(timezone.utc),
+            completedAt=datetime.now(timezone.utc),
+            params=commands.HomeParams(),
+            result=commands.HomeResult(),
+        )
+        for i in range(COMMANDS_PER_RUN)
+    ]
+
+
+def _create_summary() -> StateSummary:
+    return StateSummary(
+        status=EngineStatus.SUCCEEDED,
+        errors=[],
+        labware=[],
+        pipettes=[],
+        modules=[],
+        labwareOffsets=[],
+        liquids=[],
+    )
+
+
+async def _fill(
+    directory: Path,
+    run_store: RunStore,
+    protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
+) -> None:
+    for i in range(PROTOCOL_COUNT):
+        protocol_id = f"protocol-{i}"
+        protocol_store.insert(
+            ProtocolResource(
+                protocol_id=protocol_id,
+                created_at=datetime.now(timezone.utc),
+                source=ProtocolSource(
+                    directory=directory,
+                    main_file=directory / "protocol.json",
+                    config=JsonProtocolConfig(schema_version=6),
+                    files=[],
+                    metadata={},
+                    labware_definitions=[],
+                ),
+                protocol_key=None,
+            )
+        )
+        analysis_store.add_pending(protocol_id=protocol_id, analysis_id=f"analysis-{i}")
+        await analysis_store.update(
+            analysis_id=f"analysis-{i}",
+            commands=_create_commands(protocol_id),
+            labware=[],
+            pipettes=[],
+            errors=[],
+            liquids=[],
+        )
+
+    for i in range(RUN_COUNT):
+        run_id = f"run-{i}"
+        run_store.insert(
+            run_id=run_id, created_at=datetime.now(timezone.utc), protocol_id=None
+        )
+        run_store.update_run_state(
+            run_id=run_id, summary=_create_summary(), commands=_create_commands(run_id)
+        )
+
+
+def _measure_ms(func: Callable[[int], object]) -> float:
+    durations = []
+
+    for i in range(REPETITIONS):
+        start = time.perf_counter()
+        func(i)
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations) * 1000
+
+
+async def _measure_async_ms(func: Callable[[int], Awaitable[object]]) -> float:
+    durations = []
+
+    for i in range(REPETITIONS):
+        start = time.perf_counter()
+        await func(i)
+        durations.append(time.perf_counter() - start)
+
+    return statistics.median(durations) * 1000
+
+
+async def _run(profile_name: DatabaseProfileName) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as directory:
+        sql_engine = create_sql_engine(
+            path=Path(directory) / "robot_server.db",
+            profile=DATABASE_PROFILES[profile_name],
+        )
+        # Disable the read cache so reads measure the database.
+        run_store = RunStore(sql_engine=sql_engine, cache_size_bytes=0)
+        protocol_store = ProtocolStore.create_empty(sql_engine=sql_engine)
+        analysis_store = AnalysisStore(sql_engine=sql_engine)
+        await _fill(Path(directory), run_store, protocol_store, analysis_store)
+
+        def list_runs(i: int) -> object:
+            return run_store.get_all()
+
+        def get_command_page(i: int) -> object:
+            return run_store.get_commands_slice(
+                run_id=f"run-{i % RUN_COUNT}", cursor=100, length=PAGE_LENGTH
+            )
+
+        def archive_run(i: int) -> object:
+            return run_store.update_run_state(
+                run_id=f"run-{i % RUN_COUNT}",
+                summary=_create_summary(),
+                commands=_create_commands(f"run-{i}"),
+            )
+
+        async def get_analysis(i: int) -> object:
+            return await analysis_store.get(f"analysis-{i % PROTOCOL_COUNT}")
+
+        results = {
+            "list runs": _measure_ms(list_runs),
+            "command page": _measure_ms(get_command_page),
+            "get analysis": await _measure_async_ms(get_analysis),
+            "archive run": _measure_ms(archive_run),
+        }
+
+        sql_engine.dispose()
+
+    return results
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    for profile_name in DATABASE_PROFILES:
+        results = await _run(profile_name)
+        print(
+            f"{profile_name}: {RUN_COUNT} runs, {COMMANDS_PER_RUN} commands each:",
+            ", ".join(f"{name} {ms:.2f}ms" for name, ms in results.items()),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,6 +8,7 @@ from opentrons import __version__
 
 from .errors import exception_handlers
 from .hardware import initialize_hardware, cleanup_hardware
+from .protocols.dependencies import clean_up_analysis_executor
 from .router import router
 from .service import initialize_logging
 from .service.task_runner import (
@@ -63,6 +64,7 @@ async def on_shutdown() -> None:
     shutdown_results = await asyncio.gather(
         cleanup_hardware(app.state),
         clean_up_task_runner(app.state),
+        clean_up_analysis_executor(app.state),
         return_exceptions=True,
     )
 
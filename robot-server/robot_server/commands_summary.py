@@ -0,0 +1,179 @@
+"""Summarize a list of commands for clients that don't need every command.
+
+Clients like dashboards and protocol lists often only need to know how many
+commands there are, what kinds they are, when they ran, and what went wrong.
+Runs and analyses can have thousands of commands, so a summary is computed
+once, when the run or analysis is stored, and stored alongside it.
+The current run's summary is kept up to date as its commands progress.
+"""
+from collections import Counter
+from datetime import datetime
+from typing import Counter as CounterType, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel, Field
+
+from opentrons.protocol_engine import Command, CommandStatus, ErrorOccurrence
+from opentrons.protocol_engine.state import StateView
+
+
+class CommandsSummary(BaseModel):
+    """Statistics about a run's or an analysis's commands."""
+
+    totalLength: int = Field(..., description="Total number of commands.")
+    countsByStatus: Dict[CommandStatus, int] = Field(
+        ...,
+        description="Number of commands with each status, omitting zero counts.",
+    )
+    countsByType: Dict[str, int] = Field(
+        ...,
+        description="Number of commands of each `commandType`, omitting zero counts.",
+    )
+    startedAt: Optional[datetime] = Field(
+        None,
+        description="When the earliest-started command started, if any started.",
+    )
+    completedAt: Optional[datetime] = Field(
+        None,
+        description="When the latest-completed command completed, if any completed.",
+    )
+    errors: List[ErrorOccurrence] = Field(
+        ...,
+        description="The errors of any failed commands, in command order.",
+    )
+
+
+def summarize_commands(commands: Sequence[Command]) -> CommandsSummary:
+    """Compute the summary of a list of commands."""
+    started_at = [c.startedAt for c in commands if c.startedAt is not None]
+    completed_at = [c.completedAt for c in commands if c.completedAt is not None]
+
+    return CommandsSummary(
+        totalLength=len(commands),
+        countsByStatus=Counter(c.status for c in commands),
+        countsByType=Counter(c.commandType for c in commands),
+        startedAt=min(started_at, default=None),
+        completedAt=max(completed_at, default=None),
+        errors=[c.error for c in commands if c.error is not None],
+    )
+
+
+class CommandsSummaryTracker:
+    """Summarize an in-progress run's commands without reading all of them.
+
+    Status counts come from the engine, which keeps them up to date itself.
+    Everything else is accumulated from each command once: its type when it
+    is added, and its timing and error when it completes, since completed
+    commands don't change anymore. Until the engine's state changes again,
+    the last summary is reused as-is.
+
+    Args:
+        state_view: The run's ProtocolEngine state.
+    """
+
+    def __init__(self, state_view: StateView) -> None:
+        self._state_view = state_view
+        self._command_view = state_view.commands
+        self._summary: Optional[CommandsSummary] = None
+        self._summary_version: Optional[int] = None
+        self._counts_by_type: CounterType[str] = Counter()
+        # Indices of the commands that had not completed when last checked,
+        # by command ID, in command order.
+        self._incomplete_indices: Dict[str, int] = {}
+        self._added_count = 0
+        self._completed_count = 0
+        self._started_at: Optional[datetime] = None
+        self._completed_at: Optional[datetime] = None
+        self._errors_by_index: Dict[int, ErrorOccurrence] = {}
+
+    def get_summary(self) -> CommandsSummary:
+        """Get the summary of the run's commands as they are now."""
+        state_version = self._state_view.version
+
+        if self._summary is not None and state_version == self._summary_version:
+            return self._summary
+
+        counts_by_status: Dict[CommandStatus, int] = {}
+
+        for status in CommandStatus:
+            count = self._command_view.get_count_by_status(status)
+            if count > 0:
+                counts_by_status[status] = count
+
+        total_length = sum(counts_by_status.values())
+        completed_count = counts_by_status.get(
+            CommandStatus.SUCCEEDED, 0
+        ) + counts_by_status.get(CommandStatus.FAILED, 0)
+
+        self._add_new_commands(total_length)
+        self._complete_commands(completed_count)
+
+        started_at = self._started_at
+        current = self._command_view.get_current()
+
+        if current is not None:
+            current_started_at = self._command_view.get(current.command_id).startedAt
+            if current_started_at is not None and (
+                started_at is None or current_started_at < started_at
+            ):
+                started_at = current_started_at
+
+        self._summary = CommandsSummary(
+            totalLength=total_length,
+            countsByStatus=counts_by_status,
+            countsByType=dict(self._counts_by_type),
+            startedAt=started_at,
+            completedAt=self._completed_at,
+            errors=[
+                self._errors_by_index[index] for index in sorted(self._errors_by_index)
+            ],
+        )
+        self._summary_version = state_version
+
+        return self._summary
+
+    def _add_new_commands(self, total_length: int) -> None:
+        if total_length <= self._added_count:
+            return
+
+        new_commands = self._command_view.get_slice(
+            cursor=self._added_count,
+            length=total_length - self._added_count,
+        ).commands
+
+        for index, command in enumerate(new_commands, start=self._added_count):
+            self._counts_by_type[command.commandType] += 1
+            self._incomplete_indices[command.id] = index
+
+        self._added_count = total_length
+
+    def _complete_commands(self, completed_count: int) -> None:
+        # Commands mostly complete in order, so the newly completed ones
+        # are usually found at the start of the incomplete commands
+        newly_completed_ids = []
+
+        for command_id, index in self._incomplete_indices.items():
+            if self._completed_count == completed_count:
+                break
+
+            command = self._command_view.get(command_id)
+
+            if command.status in (CommandStatus.SUCCEEDED, CommandStatus.FAILED):
+                newly_completed_ids.append(command_id)
+                self._completed_count += 1
+
+                if command.startedAt is not None and (
+                    self._started_at is None or command.startedAt < self._started_at
+                ):
+                    self._started_at = command.startedAt
+
+                if command.completedAt is not None and (
+                    self._completed_at is None
+                    or command.completedAt > self._completed_at
+                ):
+                    self._completed_at = command.completedAt
+
+                if command.error is not None:
+                    self._errors_by_index[index] = command.error
+
+        for command_id in newly_completed_ids:
+            del self._incomplete_indices[command_id]
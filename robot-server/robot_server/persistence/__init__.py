@@ -12,8 +12,14 @@ from typing_extensions import Final
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.settings import get_settings
 
-from .database import create_sql_engine, sqlite_rowid
-from .tables import protocol_table, analysis_table, run_table, action_table
+from .database import create_sql_engine, sqlite_rowid, DATABASE_PROFILES
+from .tables import (
+    protocol_table,
+    analysis_table,
+    run_table,
+    action_table,
+    run_command_table,
+)
 
 _sql_engine_accessor = AppStateAccessor[sqlalchemy.engine.Engine]("sql_engine")
 _persistence_directory_accessor = AppStateAccessor[Path]("persistence_directory")
@@ -66,7 +72,10 @@ def get_sql_engine(
     sql_engine = _sql_engine_accessor.get_from(app_state)
 
     if sql_engine is None:
-        sql_engine = create_sql_engine(persistence_directory / _DATABASE_FILE)
+        sql_engine = create_sql_engine(
+            path=persistence_directory / _DATABASE_FILE,
+            profile=DATABASE_PROFILES[get_settings().database_profile],
+        )
         _sql_engine_accessor.set_on(app_state, sql_engine)
 
     return sql_engine
@@ -117,6 +126,7 @@ __all__ = [
     "analysis_table",
     "run_table",
     "action_table",
+    "run_command_table",
     # database utilities and helpers
     "sqlite_rowid",
 ]
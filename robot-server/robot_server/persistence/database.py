@@ -1,8 +1,12 @@
 """SQLite database initialization and utilities."""
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Dict, Optional
 
 import sqlalchemy
 
+from robot_server.settings import DatabaseProfileName
+
 from .tables import add_tables_to_db
 from .migrations import migrate
 
@@ -22,9 +26,50 @@ from .migrations import migrate
 sqlite_rowid = sqlalchemy.column("_ROWID_")
 
 
-def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
+@dataclass(frozen=True)
+class DatabaseProfile:
+    """SQLite connection settings, trading durability for speed.
+
+    Fields left as None keep SQLite's or SQLAlchemy's defaults.
+    See https://www.sqlite.org/pragma.html for the meaning of each pragma.
+
+    Attributes:
+        journal_mode: `PRAGMA journal_mode`. "WAL" lets readers proceed
+            while a write is in progress, and writes need fewer fsyncs.
+        synchronous: `PRAGMA synchronous`. In WAL mode, "NORMAL" is safe from
+            corruption, but the last transactions before a power loss may be lost.
+        mmap_size: `PRAGMA mmap_size`, in bytes.
+        cache_size: `PRAGMA cache_size`. Negative values are in KiB,
+            positive values are in pages.
+        pool_size: If set, keep this many connections open for reuse.
+            Otherwise, open a new connection for every transaction.
+    """
+
+    journal_mode: Optional[str] = None
+    synchronous: Optional[str] = None
+    mmap_size: Optional[int] = None
+    cache_size: Optional[int] = None
+    pool_size: Optional[int] = None
+
+
+DATABASE_PROFILES: Dict[DatabaseProfileName, DatabaseProfile] = {
+    "default": DatabaseProfile(),
+    "performance": DatabaseProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        mmap_size=32 * 1024 * 1024,
+        cache_size=-8 * 1024,
+        pool_size=5,
+    ),
+}
+
+
+def create_sql_engine(
+    path: Path,
+    profile: DatabaseProfile = DATABASE_PROFILES["default"],
+) -> sqlalchemy.engine.Engine:
     """Create a SQL engine with tables and migrations."""
-    sql_engine = _open_db_no_cleanup(db_file_path=path)
+    sql_engine = _open_db_no_cleanup(db_file_path=path, profile=profile)
 
     try:
         add_tables_to_db(sql_engine)
@@ -36,13 +81,37 @@ def create_sql_engine(path: Path) -> sqlalchemy.engine.Engine:
     return sql_engine
 
 
-def _open_db_no_cleanup(db_file_path: Path) -> sqlalchemy.engine.Engine:
+def _open_db_no_cleanup(
+    db_file_path: Path,
+    profile: DatabaseProfile,
+) -> sqlalchemy.engine.Engine:
     """Create a database engine for performing transactions."""
-    engine = sqlalchemy.create_engine(
-        # sqlite://<hostname>/<path>
-        # where <hostname> is empty.
-        f"sqlite:///{db_file_path}",
-    )
+    pragmas = [
+        f"PRAGMA {name}={value};"
+        for name, value in (
+            ("journal_mode", profile.journal_mode),
+            ("synchronous", profile.synchronous),
+            ("mmap_size", profile.mmap_size),
+            ("cache_size", profile.cache_size),
+        )
+        if value is not None
+    ]
+
+    # sqlite://<hostname>/<path>
+    # where <hostname> is empty.
+    url = f"sqlite:///{db_file_path}"
+
+    if profile.pool_size is not None:
+        engine = sqlalchemy.create_engine(
+            url,
+            poolclass=sqlalchemy.pool.QueuePool,
+            pool_size=profile.pool_size,
+            # Pooled connections may be checked out by a different thread
+            # than the one that opened them.
+            connect_args={"check_same_thread": False},
+        )
+    else:
+        engine = sqlalchemy.create_engine(url)
 
     # Enable foreign key support in sqlite
     # https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#foreign-key-support
@@ -53,6 +122,8 @@ def _open_db_no_cleanup(db_file_path: Path) -> sqlalchemy.engine.Engine:
     ) -> None:
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON;")
+        for pragma in pragmas:
+            cursor.execute(pragma)
         cursor.close()
 
     return engine
@@ -23,17 +23,32 @@ Database schema versions:
     - `run_table.commands` column added
     - `run_table.engine_status` column added
     - `run_table._updated_at` column added
+- Version 2
+    - `run_command_table` added
+    - `run_table.commands` moved into `run_command_table`, one row per command
+- Version 3
+    - `analysis_table.completed_analysis` changed from a pickled dict
+      to a zlib-compressed JSON document, without `null` fields
+- Version 4
+    - `analysis_table.command_summary` column added
+    - `run_table.command_summary` column added
+- Version 5
+    - `analysis_table.cache_key` column added, with an index
 """
+import json
 import logging
+import zlib
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from typing_extensions import Final
 
 import sqlalchemy
+from pydantic.json import pydantic_encoder
 
-from .tables import migration_table, run_table
+from . import legacy_pickle
+from .tables import migration_table, run_table, run_command_table, analysis_table
 
-_LATEST_SCHEMA_VERSION: Final = 1
+_LATEST_SCHEMA_VERSION: Final = 5
 
 _log = logging.getLogger(__name__)
 
@@ -53,6 +68,14 @@ def migrate(sql_engine: sqlalchemy.engine.Engine) -> None:
         if version is not None:
             if version < 1:
                 _migrate_0_to_1(transaction)
+            if version < 2:
+                _migrate_1_to_2(transaction)
+            if version < 3:
+                _migrate_2_to_3(transaction)
+            if version < 4:
+                _migrate_3_to_4(transaction)
+            if version < 5:
+                _migrate_4_to_5(transaction)
 
             _log.info(
                 f"Migrated database from schema {version}"
@@ -130,3 +153,118 @@ def _migrate_0_to_1(transaction: sqlalchemy.engine.Connection) -> None:
     transaction.execute(add_commands_column)
     transaction.execute(add_status_column)
     transaction.execute(add_updated_at_column)
+
+
+def _migrate_1_to_2(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 2.
+
+    This migration moves each run's commands out of the pickled
+    `run.commands` column and into the `run_command` table, with one
+    row per command. The `run_command` table itself is created by
+    SQLAlchemy. The `run.commands` column is left in place, but emptied.
+    """
+    select_run_ids = sqlalchemy.select(run_table.c.id).where(
+        run_table.c.commands.is_not(None)
+    )
+    run_ids = transaction.execute(select_run_ids).scalars().all()
+
+    # Load one run's commands at a time to keep memory usage bounded
+    for run_id in run_ids:
+        select_commands = sqlalchemy.select(run_table.c.commands).where(
+            run_table.c.id == run_id
+        )
+        commands: Optional[List[Dict[str, Any]]] = transaction.execute(
+            select_commands
+        ).scalar()
+
+        if commands:
+            transaction.execute(
+                sqlalchemy.insert(run_command_table),
+                [
+                    {
+                        "run_id": run_id,
+                        "index_in_run": index,
+                        "command_id": command["id"],
+                        "command": json.dumps(command, default=pydantic_encoder),
+                    }
+                    for index, command in enumerate(commands)
+                ],
+            )
+
+    transaction.execute(sqlalchemy.update(run_table).values(commands=None))
+
+
+def _migrate_2_to_3(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 3.
+
+    This migration re-encodes each completed analysis from a pickled dict
+    into a zlib-compressed JSON document, leaving out `null` fields
+    the same way HTTP responses do.
+    """
+    select_analysis_ids = sqlalchemy.select(analysis_table.c.id)
+    analysis_ids = transaction.execute(select_analysis_ids).scalars().all()
+
+    # Load one analysis at a time to keep memory usage bounded
+    for analysis_id in analysis_ids:
+        select_analysis = sqlalchemy.select(analysis_table.c.completed_analysis).where(
+            analysis_table.c.id == analysis_id
+        )
+        completed_analysis = legacy_pickle.loads(
+            transaction.execute(select_analysis).scalar_one()
+        )
+        document = json.dumps(
+            _exclude_none(completed_analysis), default=pydantic_encoder
+        )
+
+        transaction.execute(
+            sqlalchemy.update(analysis_table)
+            .where(analysis_table.c.id == analysis_id)
+            .values(completed_analysis=zlib.compress(document.encode("utf-8")))
+        )
+
+
+def _migrate_3_to_4(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 4.
+
+    This migration adds the following nullable columns:
+
+    - Column("command_summary", sqlalchemy.String, nullable=True) to the analysis table
+    - Column("command_summary", sqlalchemy.String, nullable=True) to the run table
+
+    Existing rows are left without a summary. Stores compute it on demand instead.
+    """
+    add_analysis_column = sqlalchemy.text(
+        "ALTER TABLE analysis ADD command_summary VARCHAR"
+    )
+    add_run_column = sqlalchemy.text("ALTER TABLE run ADD command_summary VARCHAR")
+
+    transaction.execute(add_analysis_column)
+    transaction.execute(add_run_column)
+
+
+def _migrate_4_to_5(transaction: sqlalchemy.engine.Connection) -> None:
+    """Migrate to schema version 5.
+
+    This migration adds the following nullable, indexed column:
+
+    - Column("cache_key", sqlalchemy.String, index=True, nullable=True)
+      to the analysis table
+
+    Existing analyses are left without a cache key, so they're never reused.
+    """
+    add_column = sqlalchemy.text("ALTER TABLE analysis ADD cache_key VARCHAR")
+    add_index = sqlalchemy.text(
+        "CREATE INDEX ix_analysis_cache_key ON analysis (cache_key)"
+    )
+
+    transaction.execute(add_column)
+    transaction.execute(add_index)
+
+
+def _exclude_none(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _exclude_none(v) for k, v in value.items() if v is not None}
+    elif isinstance(value, list):
+        return [_exclude_none(v) for v in value]
+    else:
+        return value
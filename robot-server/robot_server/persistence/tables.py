@@ -60,6 +60,13 @@ analysis_table = sqlalchemy.Table(
         sqlalchemy.LargeBinary,
         nullable=False,
     ),
+    # column added in schema v4
+    # a summary of the analysis's commands, serialized as JSON
+    sqlalchemy.Column("command_summary", sqlalchemy.String, nullable=True),
+    # column added in schema v5
+    # a hash of everything that determines the analysis's result,
+    # so identical protocols can reuse it
+    sqlalchemy.Column("cache_key", sqlalchemy.String, index=True, nullable=True),
 )
 
 
@@ -89,6 +96,7 @@ run_table = sqlalchemy.Table(
         nullable=True,
     ),
     # column added in schema v1
+    # NOTE: emptied in schema v2, where commands moved to `run_command_table`
     sqlalchemy.Column(
         "commands",
         sqlalchemy.PickleType(pickler=legacy_pickle),
@@ -98,6 +106,9 @@ run_table = sqlalchemy.Table(
     sqlalchemy.Column("engine_status", sqlalchemy.String, nullable=True),
     # column added in schema v1
     sqlalchemy.Column("_updated_at", UTCDateTime, nullable=True),
+    # column added in schema v4
+    # a summary of the run's commands, serialized as JSON
+    sqlalchemy.Column("command_summary", sqlalchemy.String, nullable=True),
 )
 
 action_table = sqlalchemy.Table(
@@ -118,6 +129,23 @@ action_table = sqlalchemy.Table(
     ),
 )
 
+# table added in schema v2
+run_command_table = sqlalchemy.Table(
+    "run_command",
+    _metadata,
+    sqlalchemy.Column(
+        "run_id",
+        sqlalchemy.String,
+        sqlalchemy.ForeignKey("run.id"),
+        primary_key=True,
+    ),
+    sqlalchemy.Column("index_in_run", sqlalchemy.Integer, primary_key=True),
+    sqlalchemy.Column("command_id", sqlalchemy.String, nullable=False),
+    # the command, serialized as JSON
+    sqlalchemy.Column("command", sqlalchemy.String, nullable=False),
+    sqlalchemy.Index("ix_run_command_run_id_command_id", "run_id", "command_id"),
+)
+
 
 def add_tables_to_db(sql_engine: sqlalchemy.engine.Engine) -> None:
     """Create the necessary database tables to back all data stores.
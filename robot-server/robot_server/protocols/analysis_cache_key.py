@@ -0,0 +1,66 @@
+"""Identify protocol analyses that would produce the same result."""
+import hashlib
+import json
+
+import anyio
+
+from opentrons import __version__ as software_version
+from opentrons.config import feature_flags
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolSource,
+    PythonProtocolConfig,
+)
+
+from .protocol_source_cache import hash_files
+
+
+async def compute_analysis_cache_key(source: ProtocolSource) -> str:
+    """Compute a hash of everything that determines a protocol's analysis.
+
+    Two protocols with the same cache key analyze to the same result,
+    barring protocols that are themselves non-deterministic. The key covers:
+
+    - The names and contents of the protocol's files.
+    - The custom labware definitions the protocol provides.
+    - The protocol's API or schema version.
+    - The robot software version, which determines the standard labware
+      definitions and how commands are simulated.
+    - The robot type, and the feature flags that change how protocols run.
+    """
+    config = source.config
+    files_hash = await anyio.to_thread.run_sync(
+        hash_files, [f.path for f in source.files]
+    )
+    inputs = {
+        "filesHash": files_hash,
+        "labwareDefinitions": sorted(
+            hashlib.sha256(d.json(sort_keys=True).encode("utf-8")).hexdigest()
+            for d in source.labware_definitions
+        ),
+        "protocolType": config.protocol_type,
+        "apiVersion": (
+            str(config.api_version)
+            if isinstance(config, PythonProtocolConfig)
+            else None
+        ),
+        "schemaVersion": (
+            config.schema_version if isinstance(config, JsonProtocolConfig) else None
+        ),
+        "softwareVersion": software_version,
+        "robotType": (
+            "OT-3 Standard"
+            if feature_flags.enable_ot3_hardware_controller()
+            else "OT-2 Standard"
+        ),
+        "featureFlags": {
+            "shortFixedTrash": feature_flags.short_fixed_trash(),
+            "useOldAspirationFunctions": feature_flags.use_old_aspiration_functions(),
+            "disableFastProtocolUpload": feature_flags.disable_fast_protocol_upload(),
+            "enableProtocolEnginePAPICore": (
+                feature_flags.enable_protocol_engine_papi_core()
+            ),
+        },
+    }
+
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
@@ -0,0 +1,245 @@
+"""Run protocol analyses in a pool of worker processes."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import traceback
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Dict, List, Optional, Set
+
+import anyio
+
+from opentrons.protocol_reader import ProtocolSource
+from opentrons.protocol_runner import ProtocolRunResult, SimulatingRunnerFactory
+
+
+_log = logging.getLogger(__name__)
+
+# Start workers from scratch, rather than forking the server process,
+# which has a running event loop, threads, and hardware connections.
+_mp_context = multiprocessing.get_context("spawn")
+
+
+class AnalysisExecutorError(Exception):
+    """Base class for errors raised by an AnalysisExecutor."""
+
+
+class AnalysisTimeoutError(AnalysisExecutorError):
+    """Raised when an analysis takes longer than the executor's timeout."""
+
+    def __init__(self, timeout: float) -> None:
+        """Initialize the error's message."""
+        super().__init__(f"Analysis did not complete within {timeout} seconds.")
+
+
+class AnalysisCancelledError(AnalysisExecutorError):
+    """Raised when an analysis is cancelled with `AnalysisExecutor.cancel()`."""
+
+    def __init__(self, protocol_id: str) -> None:
+        """Initialize the error's message."""
+        super().__init__(f'Analysis of protocol "{protocol_id}" was cancelled.')
+
+
+class AnalysisWorkerError(AnalysisExecutorError):
+    """Raised when a worker process fails unexpectedly while analyzing."""
+
+
+@dataclass(frozen=True)
+class _WorkerReady:
+    pass
+
+
+@dataclass(frozen=True)
+class _WorkerFailure:
+    traceback: str
+
+
+def _run_worker(connection: Connection) -> None:
+    """Analyze each protocol source received from the server, until it hangs up."""
+    asyncio.run(_serve(connection))
+
+
+async def _serve(connection: Connection) -> None:
+    # Every analysis in this worker shares one simulated robot,
+    # reset between analyses, rather than building its own.
+    runner_factory = await SimulatingRunnerFactory.build()
+    loop = asyncio.get_running_loop()
+    connection.send(_WorkerReady())
+
+    while True:
+        try:
+            source: ProtocolSource = await loop.run_in_executor(None, connection.recv)
+        except EOFError:
+            return
+
+        try:
+            protocol_runner = await runner_factory.create_runner()
+            connection.send(await protocol_runner.run(source))
+        except Exception:
+            connection.send(_WorkerFailure(traceback=traceback.format_exc()))
+
+
+class _Worker:
+    """A worker process, which analyzes one protocol at a time."""
+
+    def __init__(self) -> None:
+        self._connection, worker_connection = _mp_context.Pipe()
+        self._process = _mp_context.Process(
+            target=_run_worker,
+            args=(worker_connection,),
+            name="ProtocolAnalysisWorker",
+            daemon=True,
+        )
+        self._process.start()
+        worker_connection.close()
+
+    async def wait_until_ready(self) -> None:
+        """Wait for the worker to finish starting up and be ready to analyze."""
+        response = await anyio.to_thread.run_sync(self._receive, cancellable=True)
+        assert isinstance(response, _WorkerReady)
+
+    async def analyze(self, source: ProtocolSource) -> ProtocolRunResult:
+        self._connection.send(source)
+
+        # If this is cancelled, the receiving thread is left behind,
+        # until stop() kills the process and hangs up the connection.
+        response = await anyio.to_thread.run_sync(self._receive, cancellable=True)
+
+        if isinstance(response, _WorkerFailure):
+            raise AnalysisWorkerError(
+                f"Analysis failed unexpectedly:\n{response.traceback}"
+            )
+
+        assert isinstance(response, ProtocolRunResult)
+        return response
+
+    def _receive(self) -> object:
+        try:
+            return self._connection.recv()
+        except EOFError as e:
+            raise AnalysisWorkerError(
+                f"Analysis worker exited with code {self._process.exitcode}."
+            ) from e
+
+    async def stop(self) -> None:
+        # Shielded so a worker is always reaped, even by a cancelled analysis.
+        with anyio.CancelScope(shield=True):
+            self._process.kill()
+            await anyio.to_thread.run_sync(self._process.join)
+
+
+class AnalysisExecutor:
+    """Analyzes protocols in worker processes, outside the server's event loop.
+
+    Analyses wait in first-come-first-served order for one of a bounded
+    number of worker processes. Workers are started as they're needed,
+    and reused for later analyses. A worker whose analysis fails, times out,
+    or is cancelled is stopped, and replaced by a fresh one when needed.
+    """
+
+    def __init__(self, max_workers: int, timeout: Optional[float]) -> None:
+        """Initialize the executor, without starting any workers.
+
+        Args:
+            max_workers: The most analyses to run concurrently.
+            timeout: How many seconds an analysis may run before it's stopped.
+                Time spent waiting for a worker, or for a new worker
+                to start up, does not count.
+                If None, analyses may run indefinitely.
+        """
+        self._limiter = anyio.CapacityLimiter(max_workers)
+        self._timeout = timeout
+        self._idle_workers: List[_Worker] = []
+        self._cancel_scopes_by_protocol: Dict[str, Set[anyio.CancelScope]] = {}
+
+    async def analyze(
+        self, protocol_id: str, source: ProtocolSource
+    ) -> ProtocolRunResult:
+        """Analyze a protocol in a worker process.
+
+        If this task is cancelled, the analysis is stopped.
+
+        Args:
+            protocol_id: The ID of the protocol being analyzed.
+            source: The protocol to analyze.
+
+        Raises:
+            AnalysisTimeoutError: The analysis took longer than the timeout.
+            AnalysisCancelledError: The analysis was cancelled with `cancel()`.
+            AnalysisWorkerError: The worker process failed unexpectedly.
+        """
+        cancel_scope = anyio.CancelScope()
+        cancel_scopes = self._cancel_scopes_by_protocol.setdefault(protocol_id, set())
+        cancel_scopes.add(cancel_scope)
+
+        try:
+            with cancel_scope:
+                async with self._limiter:
+                    return await self._analyze_in_worker(source)
+        finally:
+            cancel_scopes.discard(cancel_scope)
+
+            if not cancel_scopes:
+                self._cancel_scopes_by_protocol.pop(protocol_id, None)
+
+        # Only reachable if `cancel_scope` was cancelled by `cancel()`.
+        raise AnalysisCancelledError(protocol_id)
+
+    def cancel(self, protocol_id: str) -> None:
+        """Cancel every queued or running analysis of a protocol.
+
+        The cancelled `analyze()` calls raise `AnalysisCancelledError`.
+        """
+        for cancel_scope in self._cancel_scopes_by_protocol.get(protocol_id, set()):
+            cancel_scope.cancel()
+
+    async def close(self) -> None:
+        """Stop every idle worker process.
+
+        Workers that are still analyzing are stopped when their
+        analyses are cancelled.
+        """
+        idle_workers = self._idle_workers
+        self._idle_workers = []
+
+        for worker in idle_workers:
+            await worker.stop()
+
+    async def _analyze_in_worker(self, source: ProtocolSource) -> ProtocolRunResult:
+        worker = (
+            self._idle_workers.pop()
+            if self._idle_workers
+            else await self._start_worker()
+        )
+
+        try:
+            with anyio.fail_after(self._timeout):
+                result = await worker.analyze(source)
+
+        except TimeoutError as e:
+            await worker.stop()
+            assert self._timeout is not None
+            raise AnalysisTimeoutError(self._timeout) from e
+
+        except BaseException:
+            await worker.stop()
+            raise
+
+        self._idle_workers.append(worker)
+        return result
+
+    @staticmethod
+    async def _start_worker() -> _Worker:
+        # Starting a worker spawns a process and imports opentrons into it,
+        # which can take a while on a robot, so it's outside of the timeout.
+        worker = _Worker()
+
+        try:
+            await worker.wait_until_ready()
+        except BaseException:
+            await worker.stop()
+            raise
+
+        return worker
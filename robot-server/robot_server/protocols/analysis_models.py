@@ -2,7 +2,7 @@
 # TODO(mc, 2021-08-25): add modules to simulation result
 from enum import Enum
 from pydantic import BaseModel, Field
-from typing import List, Union
+from typing import List, Optional, Union
 from typing_extensions import Literal
 
 from opentrons.protocol_engine import (
@@ -13,6 +13,8 @@ from opentrons.protocol_engine import (
     Liquid,
 )
 
+from robot_server.commands_summary import CommandsSummary
+
 
 class AnalysisStatus(str, Enum):
     """Status of a protocol analysis."""
@@ -41,6 +43,13 @@ class AnalysisSummary(BaseModel):
 
     id: str = Field(..., description="Unique identifier of this analysis resource")
     status: AnalysisStatus = Field(..., description="Status of the analysis")
+    commandsSummary: Optional[CommandsSummary] = Field(
+        None,
+        description=(
+            "Statistics about the analysis's commands, if it's completed."
+            " Omitted for analyses stored by older robot software versions."
+        ),
+    )
 
 
 class PendingAnalysis(BaseModel):
@@ -114,3 +123,23 @@ class CompletedAnalysis(BaseModel):
 
 
 ProtocolAnalysis = Union[PendingAnalysis, CompletedAnalysis]
+
+
+class AnalysisCacheStats(BaseModel):
+    """How often uploaded protocols have reused a previous analysis.
+
+    Counts start over when the server restarts.
+    """
+
+    hits: int = Field(
+        ...,
+        description="How many analyses reused an identical protocol's analysis.",
+    )
+    misses: int = Field(
+        ...,
+        description="How many analyses had to simulate the protocol.",
+    )
+    hitRate: float = Field(
+        ...,
+        description="The fraction of analyses that were hits, or 0 if none ran yet.",
+    )
@@ -1,9 +1,11 @@
 """Protocol analysis storage."""
 from __future__ import annotations
 
+import json
+import zlib
 from dataclasses import dataclass
 from logging import getLogger
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import anyio
 import sqlalchemy
@@ -16,8 +18,8 @@ from opentrons.protocol_engine import (
     Liquid,
 )
 
+from robot_server.commands_summary import CommandsSummary, summarize_commands
 from robot_server.persistence import analysis_table, sqlite_rowid
-from robot_server.persistence import legacy_pickle
 
 from .analysis_models import (
     AnalysisSummary,
@@ -26,6 +28,7 @@ from .analysis_models import (
     CompletedAnalysis,
     AnalysisResult,
     AnalysisStatus,
+    AnalysisCacheStats,
 )
 
 _log = getLogger(__name__)
@@ -84,6 +87,17 @@ class AnalysisStore:
         """Initialize the `AnalysisStore`."""
         self._pending_store = _PendingAnalysisStore()
         self._completed_store = _CompletedAnalysisStore(sql_engine=sql_engine)
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def get_cache_stats(self) -> AnalysisCacheStats:
+        """Get how often `complete_from_cache()` found a reusable analysis."""
+        total = self._cache_hits + self._cache_misses
+        return AnalysisCacheStats(
+            hits=self._cache_hits,
+            misses=self._cache_misses,
+            hitRate=self._cache_hits / total if total > 0 else 0,
+        )
 
     def add_pending(self, protocol_id: str, analysis_id: str) -> AnalysisSummary:
         """Add a new pending analysis to the store.
@@ -111,6 +125,7 @@ class AnalysisStore:
         pipettes: List[LoadedPipette],
         errors: List[ErrorOccurrence],
         liquids: List[Liquid],
+        cache_key: Optional[str] = None,
     ) -> None:
         """Promote a pending analysis to completed, adding details of its results.
 
@@ -123,6 +138,8 @@ class AnalysisStore:
             errors: See `CompletedAnalysis.errors`. Also used to infer whether
                 the completed analysis result is `OK` or `NOT_OK`.
             liquids: See `CompletedAnalysis.liquids
+            cache_key: If the analysis can be reused by protocols with the
+                same key, the key to find it by. See `complete_from_cache()`.
         """
         protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
 
@@ -150,6 +167,7 @@ class AnalysisStore:
             protocol_id=protocol_id,
             analyzer_version=_CURRENT_ANALYZER_VERSION,
             completed_analysis=completed_analysis,
+            cache_key=cache_key,
         )
         await self._completed_store.add(
             completed_analysis_resource=completed_analysis_resource
@@ -157,6 +175,55 @@ class AnalysisStore:
 
         self._pending_store.remove(analysis_id=analysis_id)
 
+    async def complete_from_cache(self, analysis_id: str, cache_key: str) -> bool:
+        """Promote a pending analysis to completed by copying a stored one.
+
+        The most recently stored analysis with the same cache key, if any,
+        is copied as-is, under the pending analysis's ID.
+
+        Args:
+            analysis_id: The ID of the analysis to promote.
+                Must point to a valid pending analysis.
+            cache_key: The key of the analysis to reuse.
+
+        Returns:
+            Whether a stored analysis was found and reused. If not,
+            the analysis is left pending, to be completed by `update()`.
+        """
+        protocol_id = self._pending_store.get_protocol_id(analysis_id=analysis_id)
+        assert (
+            protocol_id is not None
+        ), "Analysis ID to complete must be for a valid pending analysis."
+
+        cached = self._completed_store.get_by_cache_key(cache_key=cache_key)
+
+        if cached is None:
+            self._cache_misses += 1
+            return False
+
+        compressed_document, command_summary = cached
+
+        def reidentify_document() -> bytes:
+            document = json.loads(_decompress_document(compressed_document))
+            document["id"] = analysis_id
+            return _compress_document(json.dumps(document).encode("utf-8"))
+
+        self._completed_store.add_values(
+            {
+                "id": analysis_id,
+                "protocol_id": protocol_id,
+                "analyzer_version": _CURRENT_ANALYZER_VERSION,
+                "completed_analysis": await anyio.to_thread.run_sync(
+                    reidentify_document, cancellable=True
+                ),
+                "command_summary": command_summary,
+                "cache_key": cache_key,
+            }
+        )
+        self._pending_store.remove(analysis_id=analysis_id)
+        self._cache_hits += 1
+        return True
+
     async def get(self, analysis_id: str) -> ProtocolAnalysis:
         """Get a single protocol analysis by its ID.
 
@@ -180,12 +247,20 @@ class AnalysisStore:
 
         If `protocol_id` doesn't point to a valid protocol, returns an empty list.
         """
-        completed_analysis_ids = self._completed_store.get_ids_by_protocol(
-            protocol_id=protocol_id
+        completed_analysis_ids_and_commands_summaries = (
+            self._completed_store.get_ids_and_commands_summaries_by_protocol(
+                protocol_id=protocol_id
+            )
         )
         completed_analysis_summaries = [
-            AnalysisSummary.construct(id=analysis_id, status=AnalysisStatus.COMPLETED)
-            for analysis_id in completed_analysis_ids
+            AnalysisSummary.construct(
+                id=analysis_id,
+                status=AnalysisStatus.COMPLETED,
+                commandsSummary=commands_summary,
+            )
+            for analysis_id, commands_summary in (
+                completed_analysis_ids_and_commands_summaries
+            )
         ]
 
         pending_analysis = self._pending_store.get_by_protocol(protocol_id=protocol_id)
@@ -194,6 +269,28 @@ class AnalysisStore:
         else:
             return completed_analysis_summaries + [_summarize_pending(pending_analysis)]
 
+    async def get_as_document(self, analysis_id: str) -> bytes:
+        """Get a single protocol analysis by its ID, as a JSON document.
+
+        The document is what serializing `get()`'s return value for an HTTP
+        response would produce, but completed analyses are read as-is from
+        storage, instead of being parsed and re-serialized.
+
+        Raises:
+            AnalysisNotFoundError
+        """
+        pending_analysis = self._pending_store.get(analysis_id=analysis_id)
+        completed_analysis_document = await self._completed_store.get_document_by_id(
+            analysis_id=analysis_id
+        )
+
+        if pending_analysis is not None:
+            return _serialize_pending(pending_analysis)
+        elif completed_analysis_document is not None:
+            return completed_analysis_document
+        else:
+            raise AnalysisNotFoundError(analysis_id=analysis_id)
+
     async def get_by_protocol(self, protocol_id: str) -> List[ProtocolAnalysis]:
         """Get all analyses for a protocol, in order from oldest first.
 
@@ -213,6 +310,24 @@ class AnalysisStore:
         else:
             return completed_analyses + [pending_analysis]
 
+    async def get_by_protocol_as_documents(self, protocol_id: str) -> List[bytes]:
+        """Like `get_by_protocol()`, but return each analysis as a JSON document.
+
+        See `get_as_document()`.
+        """
+        completed_analysis_documents = (
+            await self._completed_store.get_documents_by_protocol(
+                protocol_id=protocol_id
+            )
+        )
+
+        pending_analysis = self._pending_store.get_by_protocol(protocol_id=protocol_id)
+
+        if pending_analysis is None:
+            return completed_analysis_documents
+        else:
+            return completed_analysis_documents + [_serialize_pending(pending_analysis)]
+
 
 class _PendingAnalysisStore:
     """An in-memory store of protocol analyses that are pending.
@@ -281,6 +396,7 @@ class _CompletedAnalysisResource:
     protocol_id: str
     analyzer_version: str
     completed_analysis: CompletedAnalysis
+    cache_key: Optional[str] = None
 
     async def to_sql_values(self) -> Dict[str, object]:
         """Return this data as a dict that can be passed to a SQLALchemy insert.
@@ -293,10 +409,18 @@ class _CompletedAnalysisResource:
         Avoid calling this from inside a SQL transaction, since it might be slow.
         """
 
-        def serialize_completed_analysis() -> bytes:
-            return legacy_pickle.dumps(self.completed_analysis.dict())
+        def serialize_completed_analysis() -> Tuple[bytes, str]:
+            document = self.completed_analysis.json(exclude_none=True)
+            commands_summary = summarize_commands(self.completed_analysis.commands)
+            return (
+                _compress_document(document.encode("utf-8")),
+                commands_summary.json(),
+            )
 
-        serialized_completed_analysis = await anyio.to_thread.run_sync(
+        (
+            serialized_completed_analysis,
+            serialized_commands_summary,
+        ) = await anyio.to_thread.run_sync(
             serialize_completed_analysis,
             # Cancellation may orphan the worker thread,
             # but that should be harmless in this case.
@@ -308,6 +432,8 @@ class _CompletedAnalysisResource:
             "protocol_id": self.protocol_id,
             "analyzer_version": self.analyzer_version,
             "completed_analysis": serialized_completed_analysis,
+            "command_summary": serialized_commands_summary,
+            "cache_key": self.cache_key,
         }
 
     @classmethod
@@ -336,8 +462,8 @@ class _CompletedAnalysisResource:
         assert isinstance(protocol_id, str)
 
         def parse_completed_analysis() -> CompletedAnalysis:
-            return CompletedAnalysis.parse_obj(
-                legacy_pickle.loads(sql_row.completed_analysis)
+            return CompletedAnalysis.parse_raw(
+                _decompress_document(sql_row.completed_analysis)
             )
 
         completed_analysis = await anyio.to_thread.run_sync(
@@ -352,6 +478,7 @@ class _CompletedAnalysisResource:
             protocol_id=protocol_id,
             analyzer_version=analyzer_version,
             completed_analysis=completed_analysis,
+            cache_key=sql_row.cache_key,
         )
 
 
@@ -390,32 +517,123 @@ class _CompletedAnalysisStore:
             results = transaction.execute(statement).all()
         return [await _CompletedAnalysisResource.from_sql_row(r) for r in results]
 
-    def get_ids_by_protocol(self, protocol_id: str) -> List[str]:
-        """Like `get_by_protocol()`, but return only the ID of each analysis."""
+    async def get_document_by_id(self, analysis_id: str) -> Optional[bytes]:
+        """Like `get_by_id()`, but return only the analysis as a JSON document."""
+        statement = sqlalchemy.select(analysis_table.c.completed_analysis).where(
+            analysis_table.c.id == analysis_id
+        )
+        with self._sql_engine.begin() as transaction:
+            compressed_document = transaction.execute(statement).scalar()
+
+        if compressed_document is None:
+            return None
+
+        return await anyio.to_thread.run_sync(
+            _decompress_document, compressed_document, cancellable=True
+        )
+
+    async def get_documents_by_protocol(self, protocol_id: str) -> List[bytes]:
+        """Like `get_by_protocol()`, but return only each analysis as a JSON document."""
         statement = (
-            sqlalchemy.select(analysis_table.c.id)
+            sqlalchemy.select(analysis_table.c.completed_analysis)
+            .where(analysis_table.c.protocol_id == protocol_id)
+            .order_by(sqlite_rowid)
+        )
+        with self._sql_engine.begin() as transaction:
+            compressed_documents = transaction.execute(statement).scalars().all()
+
+        return [
+            await anyio.to_thread.run_sync(
+                _decompress_document, compressed_document, cancellable=True
+            )
+            for compressed_document in compressed_documents
+        ]
+
+    def get_ids_and_commands_summaries_by_protocol(
+        self, protocol_id: str
+    ) -> List[Tuple[str, Optional[CommandsSummary]]]:
+        """Like `get_by_protocol()`, but return only each analysis's ID and summary.
+
+        The commands summary is None for analyses stored before summaries were.
+        """
+        statement = (
+            sqlalchemy.select(analysis_table.c.id, analysis_table.c.command_summary)
             .where(analysis_table.c.protocol_id == protocol_id)
             .order_by(sqlite_rowid)
         )
         with self._sql_engine.begin() as transaction:
             results = transaction.execute(statement).all()
 
-        result_ids: List[str] = []
+        ids_and_summaries: List[Tuple[str, Optional[CommandsSummary]]] = []
         for row in results:
             assert isinstance(row.id, str)
-            result_ids.append(row.id)
+            ids_and_summaries.append(
+                (
+                    row.id,
+                    CommandsSummary.parse_raw(row.command_summary)
+                    if row.command_summary is not None
+                    else None,
+                )
+            )
 
-        return result_ids
+        return ids_and_summaries
+
+    def get_by_cache_key(self, cache_key: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Get the most recent analysis with a cache key, if any.
+
+        Analyses stored by other analyzer versions are never returned.
+
+        Returns:
+            The analysis's compressed JSON document, and its serialized
+            commands summary.
+        """
+        statement = (
+            sqlalchemy.select(
+                analysis_table.c.completed_analysis,
+                analysis_table.c.command_summary,
+            )
+            .where(
+                analysis_table.c.cache_key == cache_key,
+                analysis_table.c.analyzer_version == _CURRENT_ANALYZER_VERSION,
+            )
+            .order_by(sqlite_rowid.desc())
+            .limit(1)
+        )
+        with self._sql_engine.begin() as transaction:
+            row = transaction.execute(statement).first()
+
+        if row is None:
+            return None
+
+        return row.completed_analysis, row.command_summary
 
     async def add(
         self, completed_analysis_resource: _CompletedAnalysisResource
     ) -> None:
-        statement = analysis_table.insert().values(
-            await completed_analysis_resource.to_sql_values()
-        )
+        self.add_values(await completed_analysis_resource.to_sql_values())
+
+    def add_values(self, values: Dict[str, object]) -> None:
+        """Insert an already-serialized analysis row."""
+        statement = analysis_table.insert().values(values)
         with self._sql_engine.begin() as transaction:
             transaction.execute(statement)
 
 
 def _summarize_pending(pending_analysis: PendingAnalysis) -> AnalysisSummary:
     return AnalysisSummary(id=pending_analysis.id, status=pending_analysis.status)
+
+
+def _serialize_pending(pending_analysis: PendingAnalysis) -> bytes:
+    return pending_analysis.json(exclude_none=True).encode("utf-8")
+
+
+# Completed analyses are stored as zlib-compressed JSON documents,
+# serialized the same way as in HTTP responses (i.e. without `null` fields),
+# so they can be served without being parsed.
+# See schema version 3 in `robot_server.persistence.migrations`.
+def _compress_document(document: bytes) -> bytes:
+    return zlib.compress(document)
+
+
+def _decompress_document(compressed_document: bytes) -> bytes:
+    return zlib.decompress(compressed_document)
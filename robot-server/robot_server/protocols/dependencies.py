@@ -10,17 +10,17 @@ from pathlib import Path
 from anyio import Path as AsyncPath
 
 from opentrons.protocol_reader import ProtocolReader
-from opentrons.protocol_runner import create_simulating_runner
-
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.deletion_planner import ProtocolDeletionPlanner
 from robot_server.persistence import get_sql_engine, get_persistence_directory
+from robot_server.settings import get_settings
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
 from .protocol_store import (
     ProtocolStore,
 )
 from .protocol_analyzer import ProtocolAnalyzer
+from .analysis_executor import AnalysisExecutor
 from .analysis_store import AnalysisStore
 
 
@@ -31,6 +31,7 @@ _log = logging.getLogger(__name__)
 _protocol_store_accessor = AppStateAccessor[ProtocolStore]("protocol_store")
 _analysis_store_accessor = AppStateAccessor[AnalysisStore]("analysis_store")
 _protocol_directory_accessor = AppStateAccessor[Path]("protocol_directory")
+_analysis_executor_accessor = AppStateAccessor[AnalysisExecutor]("analysis_executor")
 
 
 def get_protocol_reader() -> ProtocolReader:
@@ -87,14 +88,41 @@ def get_analysis_store(
     return analysis_store
 
 
+async def get_analysis_executor(
+    app_state: AppState = Depends(get_app_state),
+) -> AnalysisExecutor:
+    """Get the singleton AnalysisExecutor that runs protocol analyses."""
+    analysis_executor = _analysis_executor_accessor.get_from(app_state)
+
+    if analysis_executor is None:
+        settings = get_settings()
+        analysis_executor = AnalysisExecutor(
+            max_workers=settings.analysis_worker_count,
+            timeout=settings.analysis_timeout,
+        )
+        _analysis_executor_accessor.set_on(app_state, analysis_executor)
+
+    return analysis_executor
+
+
+async def clean_up_analysis_executor(app_state: AppState) -> None:
+    """Stop the AnalysisExecutor's idle workers, if it was ever created.
+
+    Intended to be called just once, when the server shuts down.
+    """
+    analysis_executor = _analysis_executor_accessor.get_from(app_state)
+
+    if analysis_executor is not None:
+        await analysis_executor.close()
+
+
 async def get_protocol_analyzer(
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
 ) -> ProtocolAnalyzer:
     """Construct a ProtocolAnalyzer for a single request."""
-    protocol_runner = await create_simulating_runner()
-
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_executor=analysis_executor,
         analysis_store=analysis_store,
     )
 
@@ -1,9 +1,17 @@
 """Protocol analysis module."""
 import logging
+from datetime import datetime, timezone
+from uuid import uuid4
 
-from opentrons.protocol_runner import ProtocolRunner
+from opentrons.protocol_engine import ErrorOccurrence
 
 from .protocol_store import ProtocolResource
+from .analysis_cache_key import compute_analysis_cache_key
+from .analysis_executor import (
+    AnalysisExecutor,
+    AnalysisCancelledError,
+    AnalysisExecutorError,
+)
 from .analysis_store import AnalysisStore
 
 
@@ -15,11 +23,11 @@ class ProtocolAnalyzer:
 
     def __init__(
         self,
-        protocol_runner: ProtocolRunner,
+        analysis_executor: AnalysisExecutor,
         analysis_store: AnalysisStore,
     ) -> None:
         """Initialize the analyzer and its dependencies."""
-        self._protocol_runner = protocol_runner
+        self._analysis_executor = analysis_executor
         self._analysis_store = analysis_store
 
     async def analyze(
@@ -27,8 +35,50 @@ class ProtocolAnalyzer:
         protocol_resource: ProtocolResource,
         analysis_id: str,
     ) -> None:
-        """Analyze a given protocol, storing the analysis when complete."""
-        result = await self._protocol_runner.run(protocol_resource.source)
+        """Analyze a given protocol, storing the analysis when complete.
+
+        If an identical protocol has already been analyzed under the same
+        robot configuration, its analysis is reused instead.
+        If the analysis times out or its worker fails,
+        the stored analysis has a single error describing what went wrong.
+        If the analysis is cancelled, nothing is stored.
+        """
+        cache_key = await compute_analysis_cache_key(protocol_resource.source)
+
+        if await self._analysis_store.complete_from_cache(
+            analysis_id=analysis_id, cache_key=cache_key
+        ):
+            log.info(f'Completed analysis "{analysis_id}" from cache.')
+            return
+
+        try:
+            result = await self._analysis_executor.analyze(
+                protocol_id=protocol_resource.protocol_id,
+                source=protocol_resource.source,
+            )
+
+        except AnalysisCancelledError:
+            log.info(f'Cancelled analysis "{analysis_id}".')
+            return
+
+        except AnalysisExecutorError as e:
+            log.warning(f'Analysis "{analysis_id}" failed.', exc_info=e)
+            await self._analysis_store.update(
+                analysis_id=analysis_id,
+                commands=[],
+                labware=[],
+                pipettes=[],
+                errors=[
+                    ErrorOccurrence.construct(
+                        id=str(uuid4()),
+                        createdAt=datetime.now(tz=timezone.utc),
+                        errorType=type(e).__name__,
+                        detail=str(e),
+                    )
+                ],
+                liquids=[],
+            )
+            return
 
         log.info(f'Completed analysis "{analysis_id}".')
 
@@ -39,4 +89,5 @@ class ProtocolAnalyzer:
             pipettes=result.state_summary.pipettes,
             errors=result.state_summary.errors,
             liquids=result.state_summary.liquids,
+            cache_key=cache_key,
         )
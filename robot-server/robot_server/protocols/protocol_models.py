@@ -8,8 +8,12 @@ from opentrons.protocol_reader import (
     ProtocolFileRole as ProtocolFileRole,
 )
 
-from robot_server.service.json_api import ResourceModel
-from .analysis_models import AnalysisSummary
+from robot_server.service.json_api import (
+    BaseResponseBody,
+    MultiBodyMeta,
+    ResourceModel,
+)
+from .analysis_models import AnalysisCacheStats, AnalysisSummary
 
 
 class ProtocolFile(BaseModel):
@@ -94,3 +98,26 @@ class Protocol(ResourceModel):
     )
 
     key: Optional[str] = None
+
+
+class ProtocolListMeta(MultiBodyMeta):
+    """Metadata about the collection of all protocols."""
+
+    analysisCache: AnalysisCacheStats = Field(
+        ...,
+        description=(
+            "How often uploaded protocols reused the analysis of an identical"
+            " protocol, analyzed under the same robot configuration, instead"
+            " of being simulated again."
+        ),
+    )
+
+
+class ProtocolList(BaseResponseBody):
+    """A response containing every protocol."""
+
+    data: List[Protocol] = Field(..., description="Every protocol.")
+    meta: ProtocolListMeta = Field(
+        ...,
+        description="Metadata about the collection of all protocols.",
+    )
@@ -0,0 +1,163 @@
+"""Persist computed ProtocolSources alongside stored protocol files."""
+import hashlib
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from pydantic import BaseModel
+
+from opentrons import __version__ as software_version
+from opentrons.protocol_reader import (
+    JsonProtocolConfig,
+    ProtocolFileRole,
+    ProtocolSource,
+    ProtocolSourceFile,
+    ProtocolType,
+    PythonProtocolConfig,
+)
+from opentrons.protocols.api_support.types import APIVersion
+from opentrons.protocols.models import LabwareDefinition
+
+
+_log = getLogger(__name__)
+
+_CACHE_FILE_SUFFIX = ".source.json"
+
+
+class _CachedFile(BaseModel):
+    name: str
+    role: ProtocolFileRole
+
+
+class _CachedSource(BaseModel):
+    """The serialized form of a ProtocolSource, relative to its directory."""
+
+    files_hash: str
+    software_version: str
+    main_file: str
+    files: List[_CachedFile]
+    metadata: Dict[str, Any]
+    protocol_type: ProtocolType
+    schema_version: Optional[int]
+    api_version: Optional[str]
+    labware_definitions: List[LabwareDefinition]
+
+
+def is_cache_file(name: str) -> bool:
+    """Whether a protocol storage directory member is a cached ProtocolSource."""
+    return name.endswith(_CACHE_FILE_SUFFIX)
+
+
+def get_cache_file(protocol_directory: Path) -> Path:
+    """Get where the ProtocolSource for a protocol's directory is cached.
+
+    The cache is stored next to, rather than inside, the protocol's directory,
+    so it's never mistaken for one of the protocol's files.
+    """
+    return protocol_directory.with_name(protocol_directory.name + _CACHE_FILE_SUFFIX)
+
+
+def hash_files(files: Sequence[Path]) -> str:
+    """Compute a hash of the names and contents of a protocol's files."""
+    files_hash = hashlib.sha256()
+
+    for path in sorted(files, key=lambda f: f.name):
+        contents = path.read_bytes()
+        files_hash.update(path.name.encode())
+        files_hash.update(len(contents).to_bytes(8, "big"))
+        files_hash.update(contents)
+
+    return files_hash.hexdigest()
+
+
+def read_cached_source(
+    protocol_directory: Path,
+    files_hash: str,
+) -> Optional[ProtocolSource]:
+    """Read a protocol's cached ProtocolSource.
+
+    Params:
+        protocol_directory: The directory containing the protocol's files.
+        files_hash: The current hash of the protocol's files.
+            See `hash_files()`.
+
+    Returns:
+        The cached ProtocolSource, or None if there is no cache,
+        or the cache is unreadable, out of date, or was written by
+        another software version.
+    """
+    cache_file = get_cache_file(protocol_directory)
+
+    try:
+        cached = _CachedSource.parse_raw(cache_file.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception:
+        _log.warning(f"Ignoring unreadable protocol cache {cache_file}", exc_info=True)
+        return None
+
+    if cached.files_hash != files_hash or cached.software_version != software_version:
+        return None
+
+    config: Union[JsonProtocolConfig, PythonProtocolConfig]
+
+    if cached.protocol_type == ProtocolType.JSON:
+        assert cached.schema_version is not None
+        config = JsonProtocolConfig(schema_version=cached.schema_version)
+    else:
+        assert cached.api_version is not None
+        config = PythonProtocolConfig(
+            api_version=APIVersion.from_string(cached.api_version)
+        )
+
+    return ProtocolSource(
+        directory=protocol_directory,
+        main_file=protocol_directory / cached.main_file,
+        files=[
+            ProtocolSourceFile(path=protocol_directory / f.name, role=f.role)
+            for f in cached.files
+        ],
+        metadata=cached.metadata,
+        config=config,
+        labware_definitions=cached.labware_definitions,
+    )
+
+
+def write_cached_source(
+    protocol_directory: Path,
+    files_hash: str,
+    source: ProtocolSource,
+) -> None:
+    """Cache a protocol's ProtocolSource, for `read_cached_source()` to find.
+
+    Failures are logged rather than raised,
+    since the ProtocolSource can always be recomputed.
+    """
+    config = source.config
+    cached = _CachedSource(
+        files_hash=files_hash,
+        software_version=software_version,
+        main_file=source.main_file.name,
+        files=[_CachedFile(name=f.path.name, role=f.role) for f in source.files],
+        metadata=source.metadata,
+        protocol_type=config.protocol_type,
+        schema_version=(
+            config.schema_version if isinstance(config, JsonProtocolConfig) else None
+        ),
+        api_version=(
+            str(config.api_version)
+            if isinstance(config, PythonProtocolConfig)
+            else None
+        ),
+        labware_definitions=source.labware_definitions,
+    )
+    cache_file = get_cache_file(protocol_directory)
+    temporary_file = cache_file.with_name(cache_file.name + ".tmp")
+
+    try:
+        # Write to a temporary file and rename it into place,
+        # so an interrupted write can't leave a truncated cache behind.
+        temporary_file.write_text(cached.json())
+        temporary_file.rename(cache_file)
+    except OSError:
+        _log.warning(f"Unable to write protocol cache {cache_file}", exc_info=True)
@@ -19,6 +19,14 @@ from robot_server.persistence import (
     sqlite_rowid,
 )
 
+from .protocol_source_cache import (
+    get_cache_file,
+    hash_files,
+    is_cache_file,
+    read_cached_source,
+    write_cached_source,
+)
+
 
 _CACHE_ENTRIES = 32
 
@@ -158,7 +166,8 @@ class ProtocolStore:
     def insert(self, resource: ProtocolResource) -> None:
         """Insert a protocol resource into the store.
 
-        The resource must have a unique ID.
+        The resource must have a unique ID. Its `ProtocolSource` is cached
+        next to its files, so `rehydrate()` doesn't have to recompute it.
         """
         self._sql_insert(
             resource=_DBProtocolResource(
@@ -169,6 +178,7 @@ class ProtocolStore:
         )
         self._sources_by_id[resource.protocol_id] = resource.source
         self._clear_caches()
+        _cache_protocol_source(resource.source)
 
     @lru_cache(maxsize=_CACHE_ENTRIES)
     def get(self, protocol_id: str) -> ProtocolResource:
@@ -236,6 +246,10 @@ class ProtocolStore:
         if protocol_dir:
             protocol_dir.rmdir()
 
+            cache_file = get_cache_file(protocol_dir)
+            if cache_file.exists():
+                cache_file.unlink()
+
         self._clear_caches()
 
     # Note that this is NOT cached like the other getters because we would need
@@ -358,6 +372,11 @@ async def _compute_protocol_sources(
     would be painful. Instead, we compute them based on the stored files,
     and keep them in memory.
 
+    Computing a `ProtocolSource` means analyzing the protocol's files, which is
+    slow. So each computed `ProtocolSource` is also cached in a file next to
+    its protocol's subdirectory, and reused on later boots as long as the
+    protocol's files and the software version haven't changed.
+
     Params:
         expected_protocol_ids: The ID of every protocol for which to compute a
             `ProtocolSource`.
@@ -376,7 +395,9 @@ async def _compute_protocol_sources(
     sources_by_id: Dict[str, ProtocolSource] = {}
 
     directory_members = [m async for m in protocols_directory.iterdir()]
-    directory_member_names = set(m.name for m in directory_members)
+    directory_member_names = set(
+        m.name for m in directory_members if not is_cache_file(m.name)
+    )
     extra_members = directory_member_names - expected_protocol_ids
     missing_members = expected_protocol_ids - directory_member_names
 
@@ -406,9 +427,21 @@ async def _compute_protocol_sources(
         #  * We don't try to compute the source of any protocol whose insertion
         #    failed halfway through and left files behind.
         protocol_files = [Path(f) async for f in protocol_subdirectory.iterdir()]
-        protocol_source = await protocol_reader.read_saved(
-            files=protocol_files, directory=Path(protocol_subdirectory)
+        files_hash = hash_files(protocol_files)
+        protocol_source = read_cached_source(
+            protocol_directory=Path(protocol_subdirectory), files_hash=files_hash
         )
+
+        if protocol_source is None:
+            protocol_source = await protocol_reader.read_saved(
+                files=protocol_files, directory=Path(protocol_subdirectory)
+            )
+            write_cached_source(
+                protocol_directory=Path(protocol_subdirectory),
+                files_hash=files_hash,
+                source=protocol_source,
+            )
+
         sources_by_id[protocol_id] = protocol_source
 
     async with create_task_group() as task_group:
@@ -425,6 +458,25 @@ async def _compute_protocol_sources(
     return sources_by_id
 
 
+def _cache_protocol_source(source: ProtocolSource) -> None:
+    if source.directory is None:
+        return
+
+    try:
+        files_hash = hash_files([f.path for f in source.files])
+    except OSError:
+        _log.warning(
+            f"Unable to read protocol files in {source.directory} to cache them",
+            exc_info=True,
+        )
+    else:
+        write_cached_source(
+            protocol_directory=source.directory,
+            files_hash=files_hash,
+            source=source,
+        )
+
+
 @dataclass(frozen=True)
 class _DBProtocolResource:
     """The subset of a ProtocolResource that's stored in the SQL database."""
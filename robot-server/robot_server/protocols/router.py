@@ -19,11 +19,19 @@ from robot_server.service.json_api import (
     SimpleEmptyBody,
     MultiBodyMeta,
     PydanticResponse,
+    DocumentResponse,
 )
 
 from .protocol_auto_deleter import ProtocolAutoDeleter
-from .protocol_models import Protocol, ProtocolFile, Metadata
+from .protocol_models import (
+    Protocol,
+    ProtocolFile,
+    ProtocolList,
+    ProtocolListMeta,
+    Metadata,
+)
 from .protocol_analyzer import ProtocolAnalyzer
+from .analysis_executor import AnalysisExecutor
 from .analysis_store import AnalysisStore, AnalysisNotFoundError
 from .analysis_models import ProtocolAnalysis
 from .protocol_store import (
@@ -39,6 +47,7 @@ from .dependencies import (
     get_analysis_store,
     get_protocol_analyzer,
     get_protocol_directory,
+    get_analysis_executor,
 )
 
 
@@ -184,12 +193,12 @@ async def create_protocol(
 @protocols_router.get(
     path="/protocols",
     summary="Get uploaded protocols",
-    responses={status.HTTP_200_OK: {"model": SimpleMultiBody[Protocol]}},
+    responses={status.HTTP_200_OK: {"model": ProtocolList}},
 )
 async def get_protocols(
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleMultiBody[Protocol]]:
+) -> PydanticResponse[ProtocolList]:
     """Get a list of all currently uploaded protocols.
 
     Args:
@@ -209,10 +218,14 @@ async def get_protocols(
         )
         for r in protocol_resources
     ]
-    meta = MultiBodyMeta(cursor=0, totalLength=len(data))
+    meta = ProtocolListMeta(
+        cursor=0,
+        totalLength=len(data),
+        analysisCache=analysis_store.get_cache_stats(),
+    )
 
     return await PydanticResponse.create(
-        content=SimpleMultiBody.construct(data=data, meta=meta),
+        content=ProtocolList.construct(data=data, meta=meta),
         status_code=status.HTTP_200_OK,
     )
 
@@ -274,15 +287,19 @@ async def get_protocol_by_id(
 async def delete_protocol_by_id(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
+    analysis_executor: AnalysisExecutor = Depends(get_analysis_executor),
 ) -> PydanticResponse[SimpleEmptyBody]:
     """Delete an uploaded protocol by ID.
 
     Arguments:
         protocolId: Protocol identifier to delete, pulled from URL.
         protocol_store: In-memory database of protocol resources.
+        analysis_executor: Runner of protocol analyses, to cancel any
+            that are still in progress for the deleted protocol.
     """
     try:
         protocol_store.remove(protocol_id=protocolId)
+        analysis_executor.cancel(protocol_id=protocolId)
 
     except ProtocolNotFoundError as e:
         raise ProtocolNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
@@ -308,7 +325,7 @@ async def get_protocol_analyses(
     protocolId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleMultiBody[ProtocolAnalysis]]:
+) -> DocumentResponse:
     """Get a protocol's full analyses list.
 
     Analyses are returned in order from least-recently started to most-recently started.
@@ -323,13 +340,11 @@ async def get_protocol_analyses(
             status.HTTP_404_NOT_FOUND
         )
 
-    analyses = await analysis_store.get_by_protocol(protocolId)
+    analyses = await analysis_store.get_by_protocol_as_documents(protocolId)
 
-    return await PydanticResponse.create(
-        content=SimpleMultiBody.construct(
-            data=analyses,
-            meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
-        )
+    return DocumentResponse.simple_multi_body(
+        data=analyses,
+        meta=MultiBodyMeta(cursor=0, totalLength=len(analyses)),
     )
 
 
@@ -348,7 +363,7 @@ async def get_protocol_analysis_by_id(
     analysisId: str,
     protocol_store: ProtocolStore = Depends(get_protocol_store),
     analysis_store: AnalysisStore = Depends(get_analysis_store),
-) -> PydanticResponse[SimpleBody[ProtocolAnalysis]]:
+) -> DocumentResponse:
     """Get a protocol analysis by analysis ID.
 
     Arguments:
@@ -365,10 +380,10 @@ async def get_protocol_analysis_by_id(
     try:
         # TODO(mm, 2022-04-28): This will erroneously return an analysis even if
         # this analysis isn't owned by this protocol. This should be an error.
-        analysis = await analysis_store.get(analysisId)
+        analysis = await analysis_store.get_as_document(analysisId)
     except AnalysisNotFoundError as error:
         raise AnalysisNotFound(detail=str(error)).as_error(
             status.HTTP_404_NOT_FOUND
         ) from error
 
-    return await PydanticResponse.create(content=SimpleBody.construct(data=analysis))
+    return DocumentResponse.simple_body(data=analysis)
@@ -7,6 +7,7 @@ from opentrons.hardware_control import HardwareControlAPI
 from robot_server.app_state import AppState, AppStateAccessor, get_app_state
 from robot_server.hardware import get_hardware
 from robot_server.persistence import get_sql_engine
+from robot_server.settings import get_settings
 from robot_server.service.task_runner import get_task_runner, TaskRunner
 from robot_server.deletion_planner import RunDeletionPlanner
 
@@ -27,7 +28,10 @@ async def get_run_store(
     run_store = _run_store_accessor.get_from(app_state)
 
     if run_store is None:
-        run_store = RunStore(sql_engine=sql_engine)
+        run_store = RunStore(
+            sql_engine=sql_engine,
+            cache_size_bytes=get_settings().run_cache_size,
+        )
         _run_store_accessor.set_on(app_state, run_store)
 
     return run_store
@@ -57,6 +61,7 @@ async def get_run_data_manager(
         task_runner=task_runner,
         engine_store=engine_store,
         run_store=run_store,
+        command_flush_interval=get_settings().run_command_flush_interval,
     )
 
 
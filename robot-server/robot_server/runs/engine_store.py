@@ -12,7 +12,7 @@ from opentrons.protocol_engine import (
     create_protocol_engine,
 )
 
-
+from robot_server.commands_summary import CommandsSummaryTracker
 from robot_server.protocols import ProtocolResource
 
 
@@ -30,6 +30,7 @@ class RunnerEnginePair(NamedTuple):
     run_id: str
     runner: ProtocolRunner
     engine: ProtocolEngine
+    commands_summary_tracker: CommandsSummaryTracker
 
 
 class EngineStore:
@@ -58,6 +59,12 @@ class EngineStore:
         assert self._runner_engine_pair is not None, "Runner not yet created."
         return self._runner_engine_pair.runner
 
+    @property
+    def commands_summary_tracker(self) -> CommandsSummaryTracker:
+        """Get the "current" run's commands summary tracker."""
+        assert self._runner_engine_pair is not None, "Engine not yet created."
+        return self._runner_engine_pair.commands_summary_tracker
+
     @property
     def current_run_id(self) -> Optional[str]:
         """Get the run identifier associated with the current engine/runner pair."""
@@ -135,6 +142,9 @@ class EngineStore:
             run_id=run_id,
             runner=runner,
             engine=engine,
+            commands_summary_tracker=CommandsSummaryTracker(
+                state_view=engine.state_view
+            ),
         )
 
         return engine.state_view.get_summary()
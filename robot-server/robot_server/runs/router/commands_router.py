@@ -14,6 +14,7 @@ from opentrons.protocol_engine import (
     errors as pe_errors,
 )
 
+from robot_server.commands_summary import CommandsSummary
 from robot_server.errors import ErrorDetails, ErrorBody
 from robot_server.service.json_api import (
     RequestModel,
@@ -305,6 +306,39 @@ async def get_run_commands(
     )
 
 
+@commands_router.get(
+    path="/runs/{runId}/commandsSummary",
+    summary="Get a summary of a run's commands",
+    description=(
+        "Get statistics about a run's commands, like how many there are"
+        " of each type and status, without listing the commands themselves."
+    ),
+    responses={
+        status.HTTP_200_OK: {"model": SimpleBody[CommandsSummary]},
+        status.HTTP_404_NOT_FOUND: {"model": ErrorBody[RunNotFound]},
+    },
+)
+async def get_run_commands_summary(
+    runId: str,
+    run_data_manager: RunDataManager = Depends(get_run_data_manager),
+) -> PydanticResponse[SimpleBody[CommandsSummary]]:
+    """Get a summary of a run's commands.
+
+    Arguments:
+        runId: Run identifier, pulled from route parameter.
+        run_data_manager: Run data retrieval interface.
+    """
+    try:
+        commands_summary = run_data_manager.get_commands_summary(run_id=runId)
+    except RunNotFoundError as e:
+        raise RunNotFound(detail=str(e)).as_error(status.HTTP_404_NOT_FOUND) from e
+
+    return await PydanticResponse.create(
+        content=SimpleBody.construct(data=commands_summary),
+        status_code=status.HTTP_200_OK,
+    )
+
+
 @commands_router.get(
     path="/runs/{runId}/commands/{commandId}",
     summary="Get full details about a specific command in the run",
@@ -0,0 +1,163 @@
+"""A memory-bounded cache of data read from the run store."""
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple, TypeVar
+
+
+_ValueT = TypeVar("_ValueT")
+
+# (run ID or None, cache key)
+_EntryKey = Tuple[Optional[str], Hashable]
+
+
+@dataclass(frozen=True)
+class RunCacheMetrics:
+    """A snapshot of a RunCache's effectiveness and memory use."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_size_bytes: int
+
+
+@dataclass(frozen=True)
+class _Entry:
+    value: object
+    size_bytes: int
+
+
+class RunCache:
+    """A least-recently-used cache of run data, bounded by size in bytes.
+
+    Entries belong to a single run, so writing to one run can invalidate
+    just that run's entries. Entries that describe every run, like the list
+    of all runs, belong to no run, and are invalidated whenever any run's
+    resource changes.
+
+    Entry sizes are estimates supplied by the caller, usually the length
+    of the entry's serialized form.
+    """
+
+    def __init__(self, max_size_bytes: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size_bytes: The total estimated size of entries to keep.
+                Least recently used entries are evicted to stay within
+                this limit. If 0, nothing is cached.
+        """
+        self._max_size_bytes = max_size_bytes
+        self._size_bytes = 0
+        self._entries: "OrderedDict[_EntryKey, _Entry]" = OrderedDict()
+        self._keys_by_run: Dict[Optional[str], Set[_EntryKey]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = Lock()
+        # Incremented on every invalidation, so a value loaded concurrently
+        # with a write is not cached after the write has invalidated it.
+        self._generation = 0
+
+    @property
+    def metrics(self) -> RunCacheMetrics:
+        """Get the cache's current hit, miss, and size counts."""
+        return RunCacheMetrics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+            max_size_bytes=self._max_size_bytes,
+        )
+
+    def get_or_load(
+        self,
+        run_id: Optional[str],
+        key: Hashable,
+        load: Callable[[], Tuple[_ValueT, int]],
+    ) -> _ValueT:
+        """Get a cached value, loading and caching it if necessary.
+
+        If `load` raises, nothing is cached and the exception propagates.
+
+        Args:
+            run_id: The run the value belongs to, or None if it
+                describes every run.
+            key: What the value is, unique within its run.
+            load: Read the value from the database, returning it along with
+                an estimate of its size in bytes.
+        """
+        entry_key = (run_id, key)
+
+        with self._lock:
+            entry = self._entries.get(entry_key)
+
+            if entry is not None:
+                self._hits += 1
+                self._entries.move_to_end(entry_key)
+                return entry.value  # type: ignore[return-value]
+
+            self._misses += 1
+            generation = self._generation
+
+        value, size_bytes = load()
+
+        with self._lock:
+            if generation == self._generation and size_bytes <= self._max_size_bytes:
+                self._remove_entry(entry_key)
+                self._entries[entry_key] = _Entry(value=value, size_bytes=size_bytes)
+                self._keys_by_run.setdefault(run_id, set()).add(entry_key)
+                self._size_bytes += size_bytes
+                self._evict()
+
+        return value
+
+    def invalidate_run(self, run_id: str, run_list_changed: bool = True) -> None:
+        """Remove a run's entries.
+
+        Args:
+            run_id: The run whose data changed.
+            run_list_changed: Whether the change affects the run's
+                resource, and so the list of all runs, as well.
+        """
+        with self._lock:
+            self._generation += 1
+            self._remove_run_entries(run_id)
+
+            if run_list_changed:
+                self._remove_run_entries(None)
+
+    def clear(self) -> None:
+        """Remove every entry. Metrics counters are kept."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._keys_by_run.clear()
+            self._size_bytes = 0
+
+    def _remove_run_entries(self, run_id: Optional[str]) -> None:
+        for entry_key in self._keys_by_run.pop(run_id, set()):
+            self._size_bytes -= self._entries.pop(entry_key).size_bytes
+
+    def _remove_entry(self, entry_key: _EntryKey) -> Optional[_Entry]:
+        entry = self._entries.pop(entry_key, None)
+
+        if entry is not None:
+            run_keys = self._keys_by_run[entry_key[0]]
+            run_keys.discard(entry_key)
+
+            if not run_keys:
+                del self._keys_by_run[entry_key[0]]
+
+            self._size_bytes -= entry.size_bytes
+
+        return entry
+
+    def _evict(self) -> None:
+        while self._size_bytes > self._max_size_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove_entry(oldest_key)
+            self._evictions += 1
@@ -91,4 +91,5 @@ class RunController:
             run_id=self._run_id,
             summary=result.state_summary,
             commands=result.commands,
+            replace_commands=False,
         )
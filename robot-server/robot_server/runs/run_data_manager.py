@@ -1,16 +1,23 @@
 """Manage current and historical run data."""
 from datetime import datetime
+from itertools import takewhile
 from typing import List, Optional
 
+import anyio
+
+from opentrons.protocol_runner import ProtocolRunResult
 from opentrons.protocol_engine import (
+    ProtocolEngine,
     EngineStatus,
     LabwareOffsetCreate,
     StateSummary,
     CommandSlice,
     CurrentCommand,
     Command,
+    CommandStatus,
 )
 
+from robot_server.commands_summary import CommandsSummary
 from robot_server.protocols import ProtocolResource
 from robot_server.service.task_runner import TaskRunner
 
@@ -53,6 +60,10 @@ def _build_run(
     )
 
 
+def _is_complete(command: Command) -> bool:
+    return command.status in (CommandStatus.SUCCEEDED, CommandStatus.FAILED)
+
+
 class RunNotCurrentError(ValueError):
     """Error raised when a requested run is not the current run."""
 
@@ -66,14 +77,27 @@ class RunDataManager:
     Args:
         engine_store: In-memory store of the current run's ProtocolEngine.
         run_store: Persistent database of current and historical run data.
+        task_runner: Background task runner.
+        command_flush_interval: If set, the current run's completed commands
+            are written to the run store in the background, at most once every
+            `command_flush_interval` seconds, while the run is in progress.
+        command_flush_batch_size: Maximum number of commands to write
+            to the run store in each background flush.
     """
 
     def __init__(
-        self, engine_store: EngineStore, run_store: RunStore, task_runner: TaskRunner
+        self,
+        engine_store: EngineStore,
+        run_store: RunStore,
+        task_runner: TaskRunner,
+        command_flush_interval: Optional[float] = None,
+        command_flush_batch_size: int = 100,
     ) -> None:
         self._engine_store = engine_store
         self._run_store = run_store
         self._task_runner = task_runner
+        self._command_flush_interval = command_flush_interval
+        self._command_flush_batch_size = command_flush_batch_size
 
     @property
     def current_run_id(self) -> Optional[str]:
@@ -104,11 +128,7 @@ class RunDataManager:
         prev_run_id = self._engine_store.current_run_id
         if prev_run_id is not None:
             prev_run_result = await self._engine_store.clear()
-            self._run_store.update_run_state(
-                run_id=prev_run_id,
-                summary=prev_run_result.state_summary,
-                commands=prev_run_result.commands,
-            )
+            self._archive(run_id=prev_run_id, run_result=prev_run_result)
 
         state_summary = await self._engine_store.create(
             run_id=run_id,
@@ -121,6 +141,13 @@ class RunDataManager:
             protocol_id=protocol.protocol_id if protocol is not None else None,
         )
 
+        if self._command_flush_interval is not None:
+            self._task_runner.run(
+                self._flush_commands,
+                run_id=run_id,
+                engine=self._engine_store.engine,
+            )
+
         return _build_run(
             run_resource=run_resource,
             state_summary=state_summary,
@@ -200,12 +227,9 @@ class RunDataManager:
         next_current = current if current is False else True
 
         if next_current is False:
-            commands, state_summary = await self._engine_store.clear()
-            run_resource = self._run_store.update_run_state(
-                run_id=run_id,
-                summary=state_summary,
-                commands=commands,
-            )
+            run_result = await self._engine_store.clear()
+            state_summary = run_result.state_summary
+            run_resource = self._archive(run_id=run_id, run_result=run_result)
         else:
             state_summary = self._engine_store.engine.state_view.get_summary()
             run_resource = self._run_store.get(run_id=run_id)
@@ -243,6 +267,20 @@ class RunDataManager:
             run_id=run_id, cursor=cursor, length=length
         )
 
+    def get_commands_summary(self, run_id: str) -> CommandsSummary:
+        """Get a summary of a run's commands.
+
+        Args:
+            run_id: ID of the run.
+
+        Raises:
+            RunNotFoundError: The given run identifier was not found in the database.
+        """
+        if run_id == self._engine_store.current_run_id:
+            return self._engine_store.commands_summary_tracker.get_summary()
+
+        return self._run_store.get_commands_summary(run_id=run_id)
+
     def get_current_command(self, run_id: str) -> Optional[CurrentCommand]:
         """Get the currently executing command, if any.
 
@@ -271,6 +309,56 @@ class RunDataManager:
 
         return self._run_store.get_command(run_id=run_id, command_id=command_id)
 
+    def _archive(self, run_id: str, run_result: ProtocolRunResult) -> RunResource:
+        # Commands already in the run store were either flushed while the run
+        # was in progress or stored when the run finished; they are final,
+        # so only the remainder needs to be written.
+        return self._run_store.update_run_state(
+            run_id=run_id,
+            summary=run_result.state_summary,
+            commands=run_result.commands,
+            replace_commands=False,
+        )
+
+    async def _flush_commands(self, run_id: str, engine: ProtocolEngine) -> None:
+        """Write a run's completed commands to the store while it's in progress.
+
+        Stops once the run's engine has stopped or the run has been archived.
+        Either way, the commands that haven't been flushed yet are written
+        with the run's final state, see `_archive` and `RunController`.
+        """
+        assert self._command_flush_interval is not None
+        flushed_count = 0
+
+        while True:
+            await anyio.sleep(self._command_flush_interval)
+
+            if (
+                self._engine_store.current_run_id != run_id
+                or engine.state_view.commands.get_is_stopped()
+            ):
+                break
+
+            command_slice = engine.state_view.commands.get_slice(
+                cursor=flushed_count,
+                length=self._command_flush_batch_size,
+            )
+
+            if command_slice.cursor != flushed_count:
+                continue
+
+            # Commands are immutable once complete; stop at the first
+            # incomplete command so that flushed commands stay contiguous
+            completed = list(takewhile(_is_complete, command_slice.commands))
+
+            if len(completed) > 0:
+                self._run_store.insert_commands(
+                    run_id=run_id,
+                    start_index=flushed_count,
+                    commands=completed,
+                )
+                flushed_count += len(completed)
+
     def _get_state_summary(self, run_id: str) -> Optional[StateSummary]:
         result: Optional[StateSummary]
 
@@ -2,23 +2,29 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
-from functools import lru_cache
-from typing import Any, Dict, List, Optional, cast
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import sqlalchemy
-from pydantic import parse_obj_as
+from pydantic import parse_raw_as
 
 from opentrons.util.helpers import utc_now
 from opentrons.protocol_engine import StateSummary, CommandSlice
 from opentrons.protocol_engine.commands import Command
 
-from robot_server.persistence import run_table, action_table
+from robot_server.commands_summary import CommandsSummary, summarize_commands
+from robot_server.persistence import run_table, action_table, run_command_table
 from robot_server.protocols import ProtocolNotFoundError
 
 from .action_models import RunAction, RunActionType
+from .run_cache import RunCache, RunCacheMetrics
 
 
-_CACHE_ENTRIES = 32
+_DEFAULT_CACHE_SIZE_BYTES = 8 * 1024 * 1024
+
+# Rough in-memory sizes of cached values that aren't stored as serialized text.
+_RUN_SIZE_ESTIMATE = 512
+_ACTION_SIZE_ESTIMATE = 256
+_FLAG_SIZE_ESTIMATE = 64
 
 
 @dataclass(frozen=True)
@@ -54,15 +60,32 @@ class CommandNotFoundError(ValueError):
 class RunStore:
     """Methods for storing and retrieving run resources."""
 
-    def __init__(self, sql_engine: sqlalchemy.engine.Engine) -> None:
-        """Initialize a RunStore with sql engine."""
+    def __init__(
+        self,
+        sql_engine: sqlalchemy.engine.Engine,
+        cache_size_bytes: int = _DEFAULT_CACHE_SIZE_BYTES,
+    ) -> None:
+        """Initialize a RunStore with sql engine.
+
+        Args:
+            sql_engine: The database to store runs in.
+            cache_size_bytes: The approximate memory budget for caching
+                data read from the database. 0 disables caching.
+        """
         self._sql_engine = sql_engine
+        self._cache = RunCache(max_size_bytes=cache_size_bytes)
+
+    @property
+    def cache_metrics(self) -> RunCacheMetrics:
+        """Get the read cache's hit, miss, and memory use counts."""
+        return self._cache.metrics
 
     def update_run_state(
         self,
         run_id: str,
         summary: StateSummary,
         commands: List[Command],
+        replace_commands: bool = True,
     ) -> RunResource:
         """Update the run's state summary and commands list.
 
@@ -70,6 +93,11 @@ class RunStore:
             run_id: The run to update
             summary: The run's equipment and status summary.
             commands: The run's commands.
+            replace_commands: If True, any previously stored commands for the run
+                are replaced. If False, previously stored commands, e.g. ones
+                written by `insert_commands` while the run was in progress,
+                are assumed to match the start of `commands`,
+                and only the commands after them are written.
 
         Returns:
             The run resource.
@@ -82,13 +110,20 @@ class RunStore:
             .where(run_table.c.id == run_id)
             .values(
                 _convert_state_to_sql_values(
-                    run_id=run_id,
-                    commands=commands,
                     state_summary=summary,
                     engine_status=summary.status,
+                    commands_summary=summarize_commands(commands),
                 )
             )
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
+        select_count = (
+            sqlalchemy.select(sqlalchemy.func.count())
+            .select_from(run_command_table)
+            .where(run_command_table.c.run_id == run_id)
+        )
         select_run_resource = sqlalchemy.select(_run_columns).where(
             run_table.c.id == run_id
         )
@@ -107,9 +142,60 @@ class RunStore:
 
             action_rows = transaction.execute(select_actions).all()
 
-        self._clear_caches()
+            if replace_commands:
+                transaction.execute(delete_commands)
+                start_index = 0
+            else:
+                start_index = transaction.execute(select_count).scalar_one()
+
+            _insert_command_rows(
+                transaction=transaction,
+                run_id=run_id,
+                start_index=start_index,
+                commands=commands[start_index:],
+            )
+
+        self._cache.invalidate_run(run_id, run_list_changed=False)
         return _convert_row_to_run(row=run_row, action_rows=action_rows)
 
+    def insert_commands(
+        self,
+        run_id: str,
+        start_index: int,
+        commands: Sequence[Command],
+    ) -> None:
+        """Store some of a run's commands while the run is still in progress.
+
+        Only commands that will not change anymore, i.e. completed commands,
+        should be stored this way, and each command should only be stored once.
+
+        Args:
+            run_id: The run the commands belong to.
+            start_index: The index of `commands[0]` in the run's commands list.
+            commands: A contiguous batch of the run's commands.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found in the store.
+            sqlalchemy.exc.IntegrityError: A command was already stored
+                at one of the given indices.
+        """
+        select_run_id = sqlalchemy.select(run_table.c.id).where(
+            run_table.c.id == run_id
+        )
+
+        with self._sql_engine.begin() as transaction:
+            if transaction.execute(select_run_id).one_or_none() is None:
+                raise RunNotFoundError(run_id=run_id)
+
+            _insert_command_rows(
+                transaction=transaction,
+                run_id=run_id,
+                start_index=start_index,
+                commands=commands,
+            )
+
+        self._cache.invalidate_run(run_id, run_list_changed=False)
+
     def insert_action(self, run_id: str, action: RunAction) -> None:
         """Insert a run action into the store.
 
@@ -130,7 +216,7 @@ class RunStore:
             except sqlalchemy.exc.IntegrityError as e:
                 raise RunNotFoundError(run_id=run_id) from e
 
-        self._clear_caches()
+        self._cache.invalidate_run(run_id)
 
     def insert(
         self,
@@ -171,17 +257,20 @@ class RunStore:
                 ), "Insert run failed due to unexpected IntegrityError"
                 raise ProtocolNotFoundError(protocol_id=run.protocol_id)
 
-        self._clear_caches()
+        self._cache.invalidate_run(run.run_id)
         return run
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def has(self, run_id: str) -> bool:
         """Whether a given run exists in the store."""
+        return self._cache.get_or_load(run_id, "has", lambda: self._load_has(run_id))
+
+    def _load_has(self, run_id: str) -> Tuple[bool, int]:
         statement = sqlalchemy.select(run_table.c.id).where(run_table.c.id == run_id)
         with self._sql_engine.begin() as transaction:
-            return transaction.execute(statement).first() is not None
+            result = transaction.execute(statement).first() is not None
+
+        return result, _FLAG_SIZE_ESTIMATE
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get(self, run_id: str) -> RunResource:
         """Get a specific run entry by its identifier.
 
@@ -194,6 +283,9 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
+        return self._cache.get_or_load(run_id, "get", lambda: self._load_run(run_id))
+
+    def _load_run(self, run_id: str) -> Tuple[RunResource, int]:
         select_run_resource = sqlalchemy.select(_run_columns).where(
             run_table.c.id == run_id
         )
@@ -209,15 +301,18 @@ class RunStore:
                 raise RunNotFoundError(run_id) from e
             action_rows = transaction.execute(select_actions).all()
 
-        return _convert_row_to_run(run_row, action_rows)
+        run = _convert_row_to_run(run_row, action_rows)
+        return run, _estimate_run_size(run)
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_all(self) -> List[RunResource]:
         """Get all known run resources.
 
         Returns:
             All stored run entries.
         """
+        return self._cache.get_or_load(None, "get_all", self._load_all_runs)
+
+    def _load_all_runs(self) -> Tuple[List[RunResource], int]:
         select_runs = sqlalchemy.select(_run_columns)
         select_actions = sqlalchemy.select(action_table)
         actions_by_run_id = defaultdict(list)
@@ -229,7 +324,7 @@ class RunStore:
         for action_row in actions:
             actions_by_run_id[action_row.run_id].append(action_row)
 
-        return [
+        result = [
             _convert_row_to_run(
                 row=run_row,
                 action_rows=actions_by_run_id[run_row.id],
@@ -237,7 +332,8 @@ class RunStore:
             for run_row in runs
         ]
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
+        return result, sum(_estimate_run_size(run) for run in result)
+
     def get_state_summary(self, run_id: str) -> Optional[StateSummary]:
         """Get the archived run state summary.
 
@@ -245,6 +341,11 @@ class RunStore:
         captured when the run was archived. It contains
         status, equipment, and error information.
         """
+        return self._cache.get_or_load(
+            run_id, "get_state_summary", lambda: self._load_state_summary(run_id)
+        )
+
+    def _load_state_summary(self, run_id: str) -> Tuple[Optional[StateSummary], int]:
         select_run_data = sqlalchemy.select(run_table.c.state_summary).where(
             run_table.c.id == run_id
         )
@@ -252,27 +353,57 @@ class RunStore:
         with self._sql_engine.begin() as transaction:
             row = transaction.execute(select_run_data).one()
 
-        return (
-            StateSummary.parse_obj(row.state_summary)
-            if row.state_summary is not None
-            else None
+        if row.state_summary is None:
+            return None, _FLAG_SIZE_ESTIMATE
+
+        state_summary = StateSummary.parse_obj(row.state_summary)
+        return state_summary, len(state_summary.json())
+
+    def get_commands_summary(self, run_id: str) -> CommandsSummary:
+        """Get a summary of the run's stored commands.
+
+        The summary is computed when the run's state is updated,
+        so this does not need to read the commands themselves,
+        unless the run was stored before summaries were, or has not been
+        updated yet.
+
+        Raises:
+            RunNotFoundError: The given run ID was not found.
+        """
+        return self._cache.get_or_load(
+            run_id,
+            "get_commands_summary",
+            lambda: self._load_commands_summary(run_id),
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
-    def _get_all_unparsed_commands(self, run_id: str) -> List[Dict[str, Any]]:
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
+    def _load_commands_summary(self, run_id: str) -> Tuple[CommandsSummary, int]:
+        select_summary = sqlalchemy.select(run_table.c.command_summary).where(
             run_table.c.id == run_id
         )
+        select_commands = (
+            sqlalchemy.select(run_command_table.c.command)
+            .where(run_command_table.c.run_id == run_id)
+            .order_by(run_command_table.c.index_in_run)
+        )
 
         with self._sql_engine.begin() as transaction:
             try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound:
-                raise RunNotFoundError(run_id=run_id)
+                row = transaction.execute(select_summary).one()
+            except sqlalchemy.exc.NoResultFound as e:
+                raise RunNotFoundError(run_id=run_id) from e
+
+            if row.command_summary is not None:
+                return (
+                    CommandsSummary.parse_raw(row.command_summary),
+                    len(row.command_summary),
+                )
+
+            command_rows = transaction.execute(select_commands).all()
 
-        return (
-            cast(List[Dict[str, Any]], row.commands) if row.commands is not None else []
+        commands_summary = summarize_commands(
+            [_convert_sql_value_to_command(row.command) for row in command_rows]
         )
+        return commands_summary, len(commands_summary.json())
 
     def get_commands_slice(
         self,
@@ -294,17 +425,40 @@ class RunStore:
         Raises:
             RunNotFoundError: The given run ID was not found.
         """
-        command_intent_dicts = self._get_all_unparsed_commands(run_id)
-        commands_length = len(command_intent_dicts)
-        if cursor is None:
-            cursor = commands_length - length
-
-        # start is inclusive, stop is exclusive
-        actual_cursor = max(0, min(cursor, commands_length - 1))
-        stop = min(commands_length, actual_cursor + length)
+        select_run_id = sqlalchemy.select(run_table.c.id).where(
+            run_table.c.id == run_id
+        )
+        select_count = (
+            sqlalchemy.select(sqlalchemy.func.count())
+            .select_from(run_command_table)
+            .where(run_command_table.c.run_id == run_id)
+        )
+
+        with self._sql_engine.begin() as transaction:
+            if transaction.execute(select_run_id).first() is None:
+                raise RunNotFoundError(run_id=run_id)
+
+            commands_length = transaction.execute(select_count).scalar_one()
+
+            if cursor is None:
+                cursor = commands_length - length
+
+            # start is inclusive, stop is exclusive
+            actual_cursor = max(0, min(cursor, commands_length - 1))
+            stop = min(commands_length, actual_cursor + length)
+            select_slice = (
+                sqlalchemy.select(run_command_table.c.command)
+                .where(
+                    run_command_table.c.run_id == run_id,
+                    run_command_table.c.index_in_run >= actual_cursor,
+                    run_command_table.c.index_in_run < stop,
+                )
+                .order_by(run_command_table.c.index_in_run)
+            )
+            command_rows = transaction.execute(select_slice).all()
+
         sliced_commands: List[Command] = [
-            parse_obj_as(Command, command)  # type: ignore[arg-type]
-            for command in command_intent_dicts[actual_cursor:stop]
+            _convert_sql_value_to_command(row.command) for row in command_rows
         ]
 
         return CommandSlice(
@@ -313,7 +467,6 @@ class RunStore:
             commands=sliced_commands,
         )
 
-    @lru_cache(maxsize=_CACHE_ENTRIES)
     def get_command(self, run_id: str, command_id: str) -> Command:
         """Get run command by id.
 
@@ -328,21 +481,30 @@ class RunStore:
             RunNotFoundError: The given run ID was not found in the store.
             CommandNotFoundError: The given command ID was not found in the store.
         """
-        select_run_commands = sqlalchemy.select(run_table.c.commands).where(
+        return self._cache.get_or_load(
+            run_id,
+            ("get_command", command_id),
+            lambda: self._load_command(run_id, command_id),
+        )
+
+    def _load_command(self, run_id: str, command_id: str) -> Tuple[Command, int]:
+        select_command = sqlalchemy.select(run_command_table.c.command).where(
+            run_command_table.c.run_id == run_id,
+            run_command_table.c.command_id == command_id,
+        )
+        select_run_id = sqlalchemy.select(run_table.c.id).where(
             run_table.c.id == run_id
         )
+
         with self._sql_engine.begin() as transaction:
-            try:
-                row = transaction.execute(select_run_commands).one()
-            except sqlalchemy.exc.NoResultFound as e:
-                raise RunNotFoundError(run_id=run_id) from e
+            row = transaction.execute(select_command).first()
 
-        try:
-            command = next(c for c in row.commands if c["id"] == command_id)
-        except StopIteration as e:
-            raise CommandNotFoundError(command_id=command_id) from e
+            if row is None:
+                if transaction.execute(select_run_id).first() is None:
+                    raise RunNotFoundError(run_id=run_id)
+                raise CommandNotFoundError(command_id=command_id)
 
-        return parse_obj_as(Command, command)  # type: ignore[arg-type]
+        return _convert_sql_value_to_command(row.command), len(row.command)
 
     def remove(self, run_id: str) -> None:
         """Remove a run by its unique identifier.
@@ -357,22 +519,18 @@ class RunStore:
         delete_actions = sqlalchemy.delete(action_table).where(
             action_table.c.run_id == run_id
         )
+        delete_commands = sqlalchemy.delete(run_command_table).where(
+            run_command_table.c.run_id == run_id
+        )
         with self._sql_engine.begin() as transaction:
             transaction.execute(delete_actions)
+            transaction.execute(delete_commands)
             result = transaction.execute(delete_run)
 
         if result.rowcount < 1:
             raise RunNotFoundError(run_id)
 
-        self._clear_caches()
-
-    def _clear_caches(self) -> None:
-        self.has.cache_clear()
-        self.get.cache_clear()
-        self.get_all.cache_clear()
-        self.get_state_summary.cache_clear()
-        self.get_command.cache_clear()
-        self._get_all_unparsed_commands.cache_clear()
+        self._cache.invalidate_run(run_id)
 
 
 # The columns that must be present in a row passed to _convert_row_to_run().
@@ -407,6 +565,10 @@ def _convert_row_to_run(
     )
 
 
+def _estimate_run_size(run: RunResource) -> int:
+    return _RUN_SIZE_ESTIMATE + _ACTION_SIZE_ESTIMATE * len(run.actions)
+
+
 def _convert_run_to_sql_values(run: RunResource) -> Dict[str, object]:
     return {
         "id": run.run_id,
@@ -425,14 +587,48 @@ def _convert_action_to_sql_values(action: RunAction, run_id: str) -> Dict[str, o
 
 
 def _convert_state_to_sql_values(
-    run_id: str,
     state_summary: StateSummary,
-    commands: List[Command],
     engine_status: str,
+    commands_summary: CommandsSummary,
 ) -> Dict[str, object]:
     return {
         "state_summary": state_summary.dict(),
         "engine_status": engine_status,
-        "commands": [command.dict() for command in commands],
+        "command_summary": commands_summary.json(),
         "_updated_at": utc_now(),
     }
+
+
+def _insert_command_rows(
+    transaction: sqlalchemy.engine.Connection,
+    run_id: str,
+    start_index: int,
+    commands: Sequence[Command],
+) -> None:
+    if len(commands) > 0:
+        transaction.execute(
+            sqlalchemy.insert(run_command_table),
+            [
+                _convert_command_to_sql_values(
+                    run_id=run_id, index=start_index + offset, command=command
+                )
+                for offset, command in enumerate(commands)
+            ],
+        )
+
+
+def _convert_command_to_sql_values(
+    run_id: str,
+    index: int,
+    command: Command,
+) -> Dict[str, object]:
+    return {
+        "run_id": run_id,
+        "index_in_run": index,
+        "command_id": command.id,
+        "command": command.json(),
+    }
+
+
+def _convert_sql_value_to_command(value: str) -> Command:
+    return parse_raw_as(Command, value)  # type: ignore[arg-type]
@@ -1,9 +1,9 @@
 from __future__ import annotations
 from anyio import to_thread
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Sequence, TypeVar
 from pydantic import Field, BaseModel
 from pydantic.generics import GenericModel
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from .resource_links import ResourceLinks as DeprecatedResourceLinks
 
 
@@ -140,6 +140,42 @@ class PydanticResponse(JSONResponse, Generic[ResponseBodyT]):
         return content.json().encode(self.charset)
 
 
+class DocumentResponse(Response):
+    """A JSON response assembled from already-serialized JSON documents.
+
+    Use this to serve large resources that are stored as JSON, to avoid
+    parsing and re-serializing them on every request. The documents
+    must be serialized like `PydanticResponse` would serialize them,
+    i.e. without `null` fields.
+    """
+
+    media_type = "application/json"
+
+    @classmethod
+    def simple_body(cls, data: bytes, status_code: int = 200) -> DocumentResponse:
+        """Create a response whose body is like a `SimpleBody`."""
+        return cls(content=b'{"data": ' + data + b"}", status_code=status_code)
+
+    @classmethod
+    def simple_multi_body(
+        cls,
+        data: Sequence[bytes],
+        meta: MultiBodyMeta,
+        status_code: int = 200,
+    ) -> DocumentResponse:
+        """Create a response whose body is like a `SimpleMultiBody`."""
+        return cls(
+            content=(
+                b'{"data": ['
+                + b", ".join(data)
+                + b'], "meta": '
+                + meta.json().encode("utf-8")
+                + b"}"
+            ),
+            status_code=status_code,
+        )
+
+
 # TODO(mc, 2021-12-09): remove this model
 class DeprecatedResponseDataModel(BaseModel):
     """A model representing an identifiable resource of the server.
@@ -12,6 +12,12 @@ from opentrons.config import infer_config_base_dir
 log = logging.getLogger(__name__)
 
 
+# The names of the profiles in robot_server.persistence.database.DATABASE_PROFILES.
+# Defined here, rather than there, because the persistence package imports
+# this module, so importing from it here would be circular.
+DatabaseProfileName = typing_extensions.Literal["default", "performance"]
+
+
 @lru_cache(maxsize=1)
 def get_settings() -> "RobotServerSettings":
     """Get the settings"""
@@ -75,5 +81,63 @@ class RobotServerSettings(BaseSettings):
         ),
     )
 
+    database_profile: DatabaseProfileName = Field(
+        "default",
+        description=(
+            "How to tune the server's SQLite database."
+            " `default` uses SQLite's defaults."
+            " `performance` uses write-ahead logging with fewer fsyncs,"
+            " larger caches, memory-mapped I/O, and a pool of reusable"
+            " connections. This makes reads and writes faster, especially on"
+            " slow storage, but the last few writes before a power loss"
+            " may be lost."
+        ),
+    )
+
+    run_command_flush_interval: typing.Optional[float] = Field(
+        None,
+        description=(
+            "If set, the number of seconds between background writes of"
+            " the current run's completed commands to persistent storage."
+            " This keeps the run's history on disk up to date while it's in"
+            " progress, so archiving the run only has to write its final"
+            " few commands. If unset, a run's commands are only written"
+            " when the run finishes or is archived."
+        ),
+        gt=0,
+    )
+
+    run_cache_size: int = Field(
+        8 * 1024 * 1024,
+        description=(
+            "The approximate number of bytes of memory to use for caching"
+            " stored runs' data, like their commands, once it has been read"
+            " from persistent storage. The least recently used data is"
+            " evicted to stay within this limit. Set to 0 to disable caching."
+        ),
+        ge=0,
+    )
+
+    analysis_worker_count: int = Field(
+        1,
+        description=(
+            "The number of worker processes that analyze uploaded protocols."
+            " This is the most analyses that can run at once; further"
+            " uploads wait for a free worker. Analyses run outside the"
+            " server's own process, so they don't slow down the active run."
+        ),
+        ge=1,
+    )
+
+    analysis_timeout: typing.Optional[float] = Field(
+        None,
+        description=(
+            "If set, the number of seconds a protocol analysis may run"
+            " before it's stopped and recorded as failed. If unset,"
+            " analyses may run indefinitely."
+        ),
+        gt=0,
+    )
+
     class Config:
         env_prefix = "OT_ROBOT_SERVER_"
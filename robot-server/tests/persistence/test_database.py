@@ -0,0 +1,66 @@
+"""Tests for robot_server.persistence.database."""
+from pathlib import Path
+
+import pytest
+import sqlalchemy
+
+from robot_server.persistence.database import DATABASE_PROFILES, create_sql_engine
+from robot_server.settings import DatabaseProfileName
+
+
+@pytest.mark.parametrize(
+    ("profile_name", "expected_journal_mode", "expected_synchronous"),
+    [
+        # SQLite's default synchronous level is 2 (FULL)
+        ("default", "delete", 2),
+        # NORMAL is 1
+        ("performance", "wal", 1),
+    ],
+)
+def test_profile_pragmas(
+    tmp_path: Path,
+    profile_name: DatabaseProfileName,
+    expected_journal_mode: str,
+    expected_synchronous: int,
+) -> None:
+    """It should apply the profile's pragmas to every connection."""
+    sql_engine = create_sql_engine(
+        path=tmp_path / "test.db",
+        profile=DATABASE_PROFILES[profile_name],
+    )
+
+    try:
+        with sql_engine.begin() as transaction:
+            journal_mode = transaction.exec_driver_sql(
+                "PRAGMA journal_mode"
+            ).scalar_one()
+            synchronous = transaction.exec_driver_sql("PRAGMA synchronous").scalar_one()
+            foreign_keys = transaction.exec_driver_sql(
+                "PRAGMA foreign_keys"
+            ).scalar_one()
+    finally:
+        sql_engine.dispose()
+
+    assert journal_mode == expected_journal_mode
+    assert synchronous == expected_synchronous
+    assert foreign_keys == 1
+
+
+def test_performance_profile_reuses_connections(tmp_path: Path) -> None:
+    """It should keep connections open in a pool between transactions."""
+    sql_engine = create_sql_engine(
+        path=tmp_path / "test.db",
+        profile=DATABASE_PROFILES["performance"],
+    )
+
+    try:
+        with sql_engine.begin():
+            pass
+        with sql_engine.begin():
+            pass
+
+        pool = sql_engine.pool
+        assert isinstance(pool, sqlalchemy.pool.QueuePool)
+        assert pool.checkedin() == 1  # type: ignore[no-untyped-call]
+    finally:
+        sql_engine.dispose()
@@ -1,11 +1,15 @@
 """Test SQL database migrations."""
+import json
+import zlib
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List
 
 import pytest
 import sqlalchemy
 from pytest_lazyfixture import lazy_fixture  # type: ignore[import]
 
+from robot_server.persistence import legacy_pickle
 from robot_server.persistence.database import create_sql_engine
 from robot_server.persistence.tables import (
     migration_table,
@@ -13,10 +17,12 @@ from robot_server.persistence.tables import (
     action_table,
     protocol_table,
     analysis_table,
+    run_command_table,
 )
+from robot_server.protocols.analysis_models import AnalysisResult
 
 
-TABLES = [run_table, action_table, protocol_table, analysis_table]
+TABLES = [run_table, action_table, protocol_table, analysis_table, run_command_table]
 
 
 @pytest.fixture
@@ -26,6 +32,9 @@ def database_v0(tmp_path: Path) -> Path:
     sql_engine = create_sql_engine(db_path)
     sql_engine.execute("DROP TABLE migration")
     sql_engine.execute("DROP TABLE run")
+    sql_engine.execute("DROP INDEX ix_analysis_cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN command_summary")
     sql_engine.execute(
         """
         CREATE TABLE run (
@@ -46,6 +55,61 @@ def database_v1(tmp_path: Path) -> Path:
     """Create a database matching schema version 1."""
     db_path = tmp_path / "migration-test-v1.db"
     sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP TABLE run_command")
+    sql_engine.execute("DROP INDEX ix_analysis_cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN command_summary")
+    sql_engine.execute("ALTER TABLE run DROP COLUMN command_summary")
+    sql_engine.execute("UPDATE migration SET version = 1")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v2(tmp_path: Path) -> Path:
+    """Create a database matching schema version 2."""
+    db_path = tmp_path / "migration-test-v2.db"
+    sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP INDEX ix_analysis_cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN command_summary")
+    sql_engine.execute("ALTER TABLE run DROP COLUMN command_summary")
+    sql_engine.execute("UPDATE migration SET version = 2")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v3(tmp_path: Path) -> Path:
+    """Create a database matching schema version 3."""
+    db_path = tmp_path / "migration-test-v3.db"
+    sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP INDEX ix_analysis_cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN command_summary")
+    sql_engine.execute("ALTER TABLE run DROP COLUMN command_summary")
+    sql_engine.execute("UPDATE migration SET version = 3")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v4(tmp_path: Path) -> Path:
+    """Create a database matching schema version 4."""
+    db_path = tmp_path / "migration-test-v4.db"
+    sql_engine = create_sql_engine(db_path)
+    sql_engine.execute("DROP INDEX ix_analysis_cache_key")
+    sql_engine.execute("ALTER TABLE analysis DROP COLUMN cache_key")
+    sql_engine.execute("UPDATE migration SET version = 4")
+    sql_engine.dispose()
+    return db_path
+
+
+@pytest.fixture
+def database_v5(tmp_path: Path) -> Path:
+    """Create a database matching schema version 5."""
+    db_path = tmp_path / "migration-test-v5.db"
+    sql_engine = create_sql_engine(db_path)
     sql_engine.dispose()
     return db_path
 
@@ -64,19 +128,101 @@ def subject(database_path: Path) -> Generator[sqlalchemy.engine.Engine, None, No
 
 
 @pytest.mark.parametrize(
-    "database_path",
+    ("database_path", "expected_versions"),
     [
-        lazy_fixture("database_v0"),
-        lazy_fixture("database_v1"),
+        (lazy_fixture("database_v0"), [5]),
+        (lazy_fixture("database_v1"), [1, 5]),
+        (lazy_fixture("database_v2"), [2, 5]),
+        (lazy_fixture("database_v3"), [3, 5]),
+        (lazy_fixture("database_v4"), [4, 5]),
+        (lazy_fixture("database_v5"), [5]),
     ],
 )
-def test_migration(subject: sqlalchemy.engine.Engine) -> None:
+def test_migration(
+    subject: sqlalchemy.engine.Engine,
+    expected_versions: List[int],
+) -> None:
     """It should migrate a table."""
     migrations = subject.execute(sqlalchemy.select(migration_table)).all()
 
-    assert [m.version for m in migrations] == [1]
+    assert [m.version for m in migrations] == expected_versions
 
     # all table queries work without raising
     for table in TABLES:
         values = subject.execute(sqlalchemy.select(table)).all()
         assert values == []
+
+
+def test_migrate_1_to_2_moves_commands(database_v1: Path) -> None:
+    """It should move pickled run commands into the run_command table."""
+    created_at = datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
+    commands = [
+        {"id": "command-1", "createdAt": created_at, "commandType": "home"},
+        {"id": "command-2", "createdAt": created_at, "commandType": "pause"},
+    ]
+
+    # open the database without migrating it
+    v1_engine = sqlalchemy.create_engine(f"sqlite:///{database_v1}")
+    v1_engine.execute(
+        sqlalchemy.insert(run_table).values(
+            id="run-id", created_at=created_at, commands=commands
+        )
+    )
+    v1_engine.dispose()
+
+    subject = create_sql_engine(database_v1)
+    run_row = subject.execute(sqlalchemy.select(run_table)).one()
+    command_rows = subject.execute(
+        sqlalchemy.select(run_command_table).order_by(run_command_table.c.index_in_run)
+    ).all()
+    subject.dispose()
+
+    assert run_row.commands is None
+    assert [(row.run_id, row.index_in_run, row.command_id) for row in command_rows] == [
+        ("run-id", 0, "command-1"),
+        ("run-id", 1, "command-2"),
+    ]
+    assert json.loads(command_rows[1].command) == {
+        "id": "command-2",
+        "createdAt": "2021-01-01T00:00:00+00:00",
+        "commandType": "pause",
+    }
+
+
+def test_migrate_2_to_3_reencodes_analyses(database_v2: Path) -> None:
+    """It should re-encode pickled analyses as compressed JSON without nulls."""
+    created_at = datetime(year=2021, month=1, day=1, tzinfo=timezone.utc)
+    completed_analysis = {
+        "id": "analysis-id",
+        "result": AnalysisResult.OK,
+        "commands": [{"id": "command-id", "createdAt": created_at, "error": None}],
+        "errors": [],
+    }
+
+    # open the database without migrating it
+    v2_engine = sqlalchemy.create_engine(f"sqlite:///{database_v2}")
+    v2_engine.execute(
+        sqlalchemy.insert(protocol_table).values(
+            id="protocol-id", created_at=created_at
+        )
+    )
+    v2_engine.execute(
+        sqlalchemy.insert(analysis_table).values(
+            id="analysis-id",
+            protocol_id="protocol-id",
+            analyzer_version="initial",
+            completed_analysis=legacy_pickle.dumps(completed_analysis),
+        )
+    )
+    v2_engine.dispose()
+
+    subject = create_sql_engine(database_v2)
+    analysis_row = subject.execute(sqlalchemy.select(analysis_table)).one()
+    subject.dispose()
+
+    assert json.loads(zlib.decompress(analysis_row.completed_analysis)) == {
+        "id": "analysis-id",
+        "result": "ok",
+        "commands": [{"id": "command-id", "createdAt": "2021-01-01T00:00:00+00:00"}],
+        "errors": [],
+    }
@@ -41,11 +41,16 @@ EXPECTED_STATEMENTS = [
         protocol_id VARCHAR NOT NULL,
         analyzer_version VARCHAR NOT NULL,
         completed_analysis BLOB NOT NULL,
+        command_summary VARCHAR,
+        cache_key VARCHAR,
         PRIMARY KEY (id),
         FOREIGN KEY(protocol_id) REFERENCES protocol (id)
     )
     """,
     """
+    CREATE INDEX ix_analysis_cache_key ON analysis (cache_key)
+    """,
+    """
     CREATE INDEX ix_analysis_protocol_id ON analysis (protocol_id)
     """,
     """
@@ -57,6 +62,7 @@ EXPECTED_STATEMENTS = [
         commands BLOB,
         engine_status VARCHAR,
         _updated_at DATETIME,
+        command_summary VARCHAR,
         PRIMARY KEY (id),
         FOREIGN KEY(protocol_id) REFERENCES protocol (id)
     )
@@ -71,6 +77,19 @@ EXPECTED_STATEMENTS = [
         FOREIGN KEY(run_id) REFERENCES run (id)
     )
     """,
+    """
+    CREATE TABLE run_command (
+        run_id VARCHAR NOT NULL,
+        index_in_run INTEGER NOT NULL,
+        command_id VARCHAR NOT NULL,
+        command VARCHAR NOT NULL,
+        PRIMARY KEY (run_id, index_in_run),
+        FOREIGN KEY(run_id) REFERENCES run (id)
+    )
+    """,
+    """
+    CREATE INDEX ix_run_command_run_id_command_id ON run_command (run_id, command_id)
+    """,
 ]
 
 
@@ -87,6 +106,27 @@ def _normalize_statement(statement: str) -> str:
     return "\n".join(lines)
 
 
+def _sort_index_statements(statements: List[str]) -> List[str]:
+    """Sort each run of consecutive CREATE INDEX statements.
+
+    SQLAlchemy emits a table's indexes in set order, which varies between runs,
+    and the order they're created in doesn't matter.
+    """
+    result: List[str] = []
+    index_statements: List[str] = []
+
+    for statement in statements:
+        if statement.startswith("CREATE INDEX"):
+            index_statements.append(statement)
+        else:
+            result.extend(sorted(index_statements))
+            index_statements = []
+            result.append(statement)
+
+    result.extend(sorted(index_statements))
+    return result
+
+
 def test_creating_tables_emits_expected_statements() -> None:
     """Test that fresh databases are created with with the expected statements.
 
@@ -106,7 +146,11 @@ def test_creating_tables_emits_expected_statements() -> None:
     engine = sqlalchemy.create_mock_engine("sqlite://", record_statement)
     add_tables_to_db(cast(sqlalchemy.engine.Engine, engine))
 
-    normalized_actual = [_normalize_statement(s) for s in actual_statements]
-    normalized_expected = [_normalize_statement(s) for s in EXPECTED_STATEMENTS]
+    normalized_actual = _sort_index_statements(
+        [_normalize_statement(s) for s in actual_statements]
+    )
+    normalized_expected = _sort_index_statements(
+        [_normalize_statement(s) for s in EXPECTED_STATEMENTS]
+    )
 
     assert normalized_actual == normalized_expected
@@ -0,0 +1,60 @@
+"""Tests for analysis cache keys."""
+from pathlib import Path
+
+import pytest
+
+from opentrons.config import feature_flags
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.analysis_cache_key import compute_analysis_cache_key
+
+
+_PROTOCOL = """
+metadata = {{"apiLevel": "{api_level}"}}
+
+def run(ctx):
+    ctx.comment("{comment}")
+"""
+
+
+async def _read_protocol(
+    directory: Path, api_level: str = "2.12", comment: str = "hello"
+) -> ProtocolSource:
+    directory.mkdir()
+    main_file = directory / "protocol.py"
+    main_file.write_text(_PROTOCOL.format(api_level=api_level, comment=comment))
+    return await ProtocolReader().read_saved(files=[main_file], directory=directory)
+
+
+async def test_same_protocol_same_key(tmp_path: Path) -> None:
+    """Identical protocols in different directories should share a key."""
+    source_1 = await _read_protocol(tmp_path / "1")
+    source_2 = await _read_protocol(tmp_path / "2")
+
+    assert await compute_analysis_cache_key(
+        source_1
+    ) == await compute_analysis_cache_key(source_2)
+
+
+async def test_different_protocol_different_key(tmp_path: Path) -> None:
+    """Protocols whose contents or API versions differ should not share a key."""
+    source = await _read_protocol(tmp_path / "1")
+    different_contents = await _read_protocol(tmp_path / "2", comment="goodbye")
+    different_api_level = await _read_protocol(tmp_path / "3", api_level="2.11")
+
+    key = await compute_analysis_cache_key(source)
+
+    assert await compute_analysis_cache_key(different_contents) != key
+    assert await compute_analysis_cache_key(different_api_level) != key
+
+
+async def test_feature_flags_change_key(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Changing a feature flag that affects analysis should change the key."""
+    source = await _read_protocol(tmp_path / "1")
+    key = await compute_analysis_cache_key(source)
+
+    monkeypatch.setattr(feature_flags, "short_fixed_trash", lambda: True)
+
+    assert await compute_analysis_cache_key(source) != key
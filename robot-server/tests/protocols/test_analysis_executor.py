@@ -0,0 +1,116 @@
+"""Tests for the AnalysisExecutor, with real worker processes."""
+from pathlib import Path
+from typing import AsyncIterator
+
+import anyio
+import pytest
+
+from opentrons.protocol_engine import EngineStatus
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisCancelledError,
+    AnalysisTimeoutError,
+)
+
+
+_QUICK_PROTOCOL = """
+metadata = {"apiLevel": "2.12"}
+
+def run(ctx):
+    ctx.comment("hello")
+"""
+
+_SLOW_PROTOCOL = """
+import time
+
+metadata = {"apiLevel": "2.12"}
+
+def run(ctx):
+    time.sleep(60)
+"""
+
+
+async def _read_protocol(directory: Path, contents: str) -> ProtocolSource:
+    directory.mkdir()
+    main_file = directory / "protocol.py"
+    main_file.write_text(contents)
+    return await ProtocolReader().read_saved(files=[main_file], directory=directory)
+
+
+@pytest.fixture
+async def quick_protocol(tmp_path: Path) -> ProtocolSource:
+    """Get a protocol that analyzes quickly."""
+    return await _read_protocol(tmp_path / "quick", _QUICK_PROTOCOL)
+
+
+@pytest.fixture
+async def slow_protocol(tmp_path: Path) -> ProtocolSource:
+    """Get a protocol that takes a minute to analyze."""
+    return await _read_protocol(tmp_path / "slow", _SLOW_PROTOCOL)
+
+
+@pytest.fixture
+async def subject() -> AsyncIterator[AnalysisExecutor]:
+    """Get an AnalysisExecutor test subject with a single worker."""
+    subject = AnalysisExecutor(max_workers=1, timeout=30)
+    yield subject
+    await subject.close()
+
+
+async def test_analyze(
+    subject: AnalysisExecutor, quick_protocol: ProtocolSource
+) -> None:
+    """It should analyze protocols in a worker process, reusing the worker."""
+    for _ in range(2):
+        result = await subject.analyze(protocol_id="protocol-id", source=quick_protocol)
+
+        assert result.state_summary.status == EngineStatus.SUCCEEDED
+        assert result.state_summary.errors == []
+        assert len(result.commands) > 0
+
+
+async def test_analyze_timeout(
+    quick_protocol: ProtocolSource, slow_protocol: ProtocolSource
+) -> None:
+    """It should stop an analysis that times out, and replace its worker."""
+    subject = AnalysisExecutor(max_workers=1, timeout=5)
+
+    try:
+        with pytest.raises(AnalysisTimeoutError):
+            await subject.analyze(protocol_id="protocol-id", source=slow_protocol)
+
+        result = await subject.analyze(protocol_id="protocol-id", source=quick_protocol)
+        assert result.state_summary.errors == []
+    finally:
+        await subject.close()
+
+
+async def test_cancel_running_and_queued(
+    subject: AnalysisExecutor,
+    quick_protocol: ProtocolSource,
+    slow_protocol: ProtocolSource,
+) -> None:
+    """It should cancel a protocol's running and queued analyses."""
+    errors = []
+
+    async def analyze(source: ProtocolSource) -> None:
+        try:
+            await subject.analyze(protocol_id="protocol-id", source=source)
+        except AnalysisCancelledError as e:
+            errors.append(e)
+
+    with anyio.fail_after(20):
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(analyze, slow_protocol)
+            task_group.start_soon(analyze, slow_protocol)
+            # Let the first analysis start and the second queue up behind it.
+            await anyio.sleep(0.5)
+            subject.cancel(protocol_id="some-other-protocol-id")
+            subject.cancel(protocol_id="protocol-id")
+
+    assert len(errors) == 2
+
+    result = await subject.analyze(protocol_id="protocol-id", source=quick_protocol)
+    assert result.state_summary.errors == []
@@ -1,4 +1,5 @@
 """Tests for the AnalysisStore interface."""
+import json
 import pytest
 
 from datetime import datetime, timezone
@@ -20,10 +21,12 @@ from opentrons.protocol_reader import (
     JsonProtocolConfig,
 )
 
+from robot_server.commands_summary import CommandsSummary, summarize_commands
 from robot_server.protocols.analysis_models import (
     AnalysisResult,
     AnalysisStatus,
     AnalysisSummary,
+    AnalysisCacheStats,
     PendingAnalysis,
     CompletedAnalysis,
 )
@@ -203,6 +206,124 @@ async def test_add_analysis_equipment(
         liquids=[],
     )
     assert await subject.get_by_protocol("protocol-id") == [result]
+    assert subject.get_summaries_by_protocol("protocol-id") == [
+        AnalysisSummary(
+            id="analysis-id",
+            status=AnalysisStatus.COMPLETED,
+            commandsSummary=CommandsSummary(
+                totalLength=0, countsByStatus={}, countsByType={}, errors=[]
+            ),
+        )
+    ]
+
+
+async def test_get_as_document(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should return analyses serialized like an HTTP response would be."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-id"))
+
+    labware = pe_types.LoadedLabware(
+        id="labware-id",
+        loadName="load-name",
+        definitionUri="namespace/load-name/42",
+        location=pe_types.DeckSlotLocation(slotName=DeckSlotName.SLOT_1),
+        offsetId=None,
+    )
+
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-1")
+    await subject.update(
+        analysis_id="analysis-id-1",
+        labware=[labware],
+        pipettes=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+    )
+    subject.add_pending(protocol_id="protocol-id", analysis_id="analysis-id-2")
+
+    completed_result = await subject.get_as_document("analysis-id-1")
+    pending_result = await subject.get_as_document("analysis-id-2")
+    all_results = await subject.get_by_protocol_as_documents("protocol-id")
+
+    expected_completed = {
+        "id": "analysis-id-1",
+        "status": "completed",
+        "result": "ok",
+        "labware": [
+            {
+                "id": "labware-id",
+                "loadName": "load-name",
+                "definitionUri": "namespace/load-name/42",
+                "location": {"slotName": "1"},
+            }
+        ],
+        "pipettes": [],
+        "commands": [],
+        "errors": [],
+        "liquids": [],
+    }
+    expected_pending = {"id": "analysis-id-2", "status": "pending"}
+
+    assert json.loads(completed_result) == expected_completed
+    assert json.loads(pending_result) == expected_pending
+    assert [json.loads(r) for r in all_results] == [
+        expected_completed,
+        expected_pending,
+    ]
+
+    with pytest.raises(AnalysisNotFoundError, match="analysis-id-3"):
+        await subject.get_as_document("analysis-id-3")
+
+
+async def test_complete_from_cache(
+    subject: AnalysisStore, protocol_store: ProtocolStore
+) -> None:
+    """It should reuse the most recent analysis with the same cache key."""
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-1"))
+    protocol_store.insert(make_dummy_protocol_resource(protocol_id="protocol-2"))
+
+    subject.add_pending(protocol_id="protocol-1", analysis_id="analysis-id-1")
+    assert not await subject.complete_from_cache(
+        analysis_id="analysis-id-1", cache_key="cache-key"
+    )
+    await subject.update(
+        analysis_id="analysis-id-1",
+        labware=[],
+        pipettes=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+        cache_key="cache-key",
+    )
+
+    subject.add_pending(protocol_id="protocol-2", analysis_id="analysis-id-2")
+    assert not await subject.complete_from_cache(
+        analysis_id="analysis-id-2", cache_key="other-cache-key"
+    )
+    assert await subject.complete_from_cache(
+        analysis_id="analysis-id-2", cache_key="cache-key"
+    )
+
+    assert await subject.get("analysis-id-2") == CompletedAnalysis(
+        id="analysis-id-2",
+        result=AnalysisResult.OK,
+        labware=[],
+        pipettes=[],
+        commands=[],
+        errors=[],
+        liquids=[],
+    )
+    assert subject.get_summaries_by_protocol("protocol-2") == [
+        AnalysisSummary(
+            id="analysis-id-2",
+            status=AnalysisStatus.COMPLETED,
+            commandsSummary=summarize_commands([]),
+        )
+    ]
+    assert subject.get_cache_stats() == AnalysisCacheStats(
+        hits=1, misses=2, hitRate=1 / 3
+    )
 
 
 class AnalysisResultSpec(NamedTuple):
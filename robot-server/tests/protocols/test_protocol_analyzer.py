@@ -1,6 +1,6 @@
 """Tests for the ProtocolAnalyzer."""
 import pytest
-from decoy import Decoy
+from decoy import Decoy, matchers
 from datetime import datetime
 from pathlib import Path
 
@@ -14,18 +14,24 @@ from opentrons.protocol_engine import (
     errors as pe_errors,
     types as pe_types,
 )
-from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
+from opentrons.protocol_runner import ProtocolRunResult
 from opentrons.protocol_reader import ProtocolSource, JsonProtocolConfig
 
+from robot_server.protocols.analysis_executor import (
+    AnalysisExecutor,
+    AnalysisCancelledError,
+    AnalysisTimeoutError,
+)
+from robot_server.protocols.analysis_cache_key import compute_analysis_cache_key
 from robot_server.protocols.analysis_store import AnalysisStore
 from robot_server.protocols.protocol_store import ProtocolResource
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
 
 
 @pytest.fixture
-def protocol_runner(decoy: Decoy) -> ProtocolRunner:
-    """Get a mocked out ProtocolRunner."""
-    return decoy.mock(cls=ProtocolRunner)
+def analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mocked out AnalysisExecutor."""
+    return decoy.mock(cls=AnalysisExecutor)
 
 
 @pytest.fixture
@@ -36,24 +42,20 @@ def analysis_store(decoy: Decoy) -> AnalysisStore:
 
 @pytest.fixture
 def subject(
-    protocol_runner: ProtocolRunner,
+    analysis_executor: AnalysisExecutor,
     analysis_store: AnalysisStore,
 ) -> ProtocolAnalyzer:
     """Get a ProtocolAnalyzer test subject."""
     return ProtocolAnalyzer(
-        protocol_runner=protocol_runner,
+        analysis_executor=analysis_executor,
         analysis_store=analysis_store,
     )
 
 
-async def test_analyze(
-    decoy: Decoy,
-    protocol_runner: ProtocolRunner,
-    analysis_store: AnalysisStore,
-    subject: ProtocolAnalyzer,
-) -> None:
-    """It should be able to analyze a protocol."""
-    protocol_resource = ProtocolResource(
+@pytest.fixture
+def protocol_resource() -> ProtocolResource:
+    """Get a protocol resource to analyze."""
+    return ProtocolResource(
         protocol_id="protocol-id",
         created_at=datetime(year=2021, month=1, day=1),
         source=ProtocolSource(
@@ -67,6 +69,15 @@ async def test_analyze(
         protocol_key="dummy-data-111",
     )
 
+
+async def test_analyze(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should be able to analyze a protocol."""
     analysis_command = pe_commands.WaitForResume(
         id="command-id",
         key="command-key",
@@ -96,7 +107,11 @@ async def test_analyze(
         mount=MountType.LEFT,
     )
 
-    decoy.when(await protocol_runner.run(protocol_resource.source)).then_return(
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", source=protocol_resource.source
+        )
+    ).then_return(
         ProtocolRunResult(
             commands=[analysis_command],
             state_summary=StateSummary(
@@ -125,5 +140,106 @@ async def test_analyze(
             pipettes=[analysis_pipette],
             errors=[analysis_error],
             liquids=[],
+            cache_key=await compute_analysis_cache_key(protocol_resource.source),
+        ),
+    )
+
+
+async def test_analyze_timeout(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should store a failed analysis if the analysis times out."""
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", source=protocol_resource.source
+        )
+    ).then_raise(AnalysisTimeoutError(timeout=12.3))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    errors_captor = matchers.Captor()
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id="analysis-id",
+            commands=[],
+            labware=[],
+            pipettes=[],
+            errors=errors_captor,
+            liquids=[],
+        ),
+    )
+
+    assert len(errors_captor.value) == 1
+    assert errors_captor.value[0].errorType == "AnalysisTimeoutError"
+    assert (
+        errors_captor.value[0].detail
+        == "Analysis did not complete within 12.3 seconds."
+    )
+
+
+async def test_analyze_cancelled(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should not store anything if the analysis is cancelled."""
+    decoy.when(
+        await analysis_executor.analyze(
+            protocol_id="protocol-id", source=protocol_resource.source
+        )
+    ).then_raise(AnalysisCancelledError(protocol_id="protocol-id"))
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_store.update(
+            analysis_id=matchers.Anything(),
+            commands=matchers.Anything(),
+            labware=matchers.Anything(),
+            pipettes=matchers.Anything(),
+            errors=matchers.Anything(),
+            liquids=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
+async def test_analyze_from_cache(
+    decoy: Decoy,
+    analysis_executor: AnalysisExecutor,
+    analysis_store: AnalysisStore,
+    protocol_resource: ProtocolResource,
+    subject: ProtocolAnalyzer,
+) -> None:
+    """It should reuse an identical protocol's analysis instead of simulating."""
+    cache_key = await compute_analysis_cache_key(protocol_resource.source)
+
+    decoy.when(
+        await analysis_store.complete_from_cache(
+            analysis_id="analysis-id", cache_key=cache_key
+        )
+    ).then_return(True)
+
+    await subject.analyze(
+        protocol_resource=protocol_resource,
+        analysis_id="analysis-id",
+    )
+
+    decoy.verify(
+        await analysis_executor.analyze(
+            protocol_id=matchers.Anything(), source=matchers.Anything()
         ),
+        times=0,
     )
@@ -0,0 +1,109 @@
+"""Tests for robot_server.protocols.protocol_source_cache."""
+import json
+from pathlib import Path
+
+import pytest
+
+from opentrons_shared_data.labware import load_definition
+from opentrons.protocol_reader import ProtocolReader, ProtocolSource
+
+from robot_server.protocols.protocol_source_cache import (
+    get_cache_file,
+    hash_files,
+    is_cache_file,
+    read_cached_source,
+    write_cached_source,
+)
+
+
+@pytest.fixture
+def protocol_directory(tmp_path: Path) -> Path:
+    """Get a directory with a Python protocol and a custom labware file in it."""
+    directory = tmp_path / "protocol-id"
+    directory.mkdir()
+    (directory / "protocol.py").write_text(
+        "metadata = {'apiLevel': '2.12', 'protocolName': 'Hello'}\n"
+        "def run(ctx): pass\n"
+    )
+    (directory / "labware.json").write_text(
+        json.dumps(load_definition("opentrons_96_tiprack_300ul", 1))
+    )
+    return directory
+
+
+async def _read(protocol_directory: Path) -> ProtocolSource:
+    return await ProtocolReader().read_saved(
+        files=list(protocol_directory.iterdir()), directory=protocol_directory
+    )
+
+
+def test_get_cache_file(tmp_path: Path) -> None:
+    """It should place the cache file next to the protocol's directory."""
+    result = get_cache_file(tmp_path / "protocol-id")
+
+    assert result == tmp_path / "protocol-id.source.json"
+    assert is_cache_file(result.name)
+    assert not is_cache_file("protocol-id")
+
+
+async def test_round_trip(protocol_directory: Path) -> None:
+    """It should read back the same ProtocolSource that it cached."""
+    source = await _read(protocol_directory)
+    files_hash = hash_files(list(protocol_directory.iterdir()))
+
+    write_cached_source(
+        protocol_directory=protocol_directory,
+        files_hash=files_hash,
+        source=source,
+    )
+    result = read_cached_source(
+        protocol_directory=protocol_directory, files_hash=files_hash
+    )
+
+    assert result is not None
+    assert result.main_file == source.main_file
+    assert sorted(result.files, key=str) == sorted(source.files, key=str)
+    assert result == ProtocolSource(
+        directory=source.directory,
+        main_file=source.main_file,
+        files=result.files,
+        metadata=source.metadata,
+        config=source.config,
+        labware_definitions=source.labware_definitions,
+    )
+
+
+async def test_read_missing_or_outdated(protocol_directory: Path) -> None:
+    """It should ignore a cache that's missing or doesn't match the files."""
+    files = list(protocol_directory.iterdir())
+    files_hash = hash_files(files)
+
+    assert (
+        read_cached_source(protocol_directory=protocol_directory, files_hash=files_hash)
+        is None
+    )
+
+    write_cached_source(
+        protocol_directory=protocol_directory,
+        files_hash=files_hash,
+        source=await _read(protocol_directory),
+    )
+    (protocol_directory / "protocol.py").write_text(
+        "metadata = {'apiLevel': '2.12'}\ndef run(ctx): pass\n"
+    )
+    new_hash = hash_files(files)
+
+    assert new_hash != files_hash
+    assert (
+        read_cached_source(protocol_directory=protocol_directory, files_hash=new_hash)
+        is None
+    )
+
+
+def test_read_corrupt(protocol_directory: Path) -> None:
+    """It should ignore a cache that can't be parsed."""
+    get_cache_file(protocol_directory).write_text("{not json")
+
+    result = read_cached_source(protocol_directory=protocol_directory, files_hash="abc")
+
+    assert result is None
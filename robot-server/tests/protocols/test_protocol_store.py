@@ -3,8 +3,11 @@ import pytest
 from datetime import datetime, timezone
 from pathlib import Path
 
+from decoy import Decoy, matchers
+
 from opentrons.protocols.api_support.types import APIVersion
 from opentrons.protocol_reader import (
+    ProtocolReader,
     ProtocolSource,
     ProtocolSourceFile,
     ProtocolFileRole,
@@ -318,3 +321,46 @@ def test_get_usage_info(
             is_used_by_run=False,
         ),
     ]
+
+
+async def test_rehydrate_uses_cached_sources(
+    decoy: Decoy, tmp_path: Path, sql_engine: SQLEngine
+) -> None:
+    """It should reuse the sources cached on insert instead of re-reading files."""
+    protocols_directory = tmp_path / "protocols"
+    protocol_directory = protocols_directory / "protocol-id"
+    protocol_directory.mkdir(parents=True)
+    (protocol_directory / "protocol.py").write_text(
+        "metadata = {'apiLevel': '2.12'}\ndef run(ctx): pass\n"
+    )
+    source = await ProtocolReader().read_saved(
+        files=[protocol_directory / "protocol.py"], directory=protocol_directory
+    )
+    ProtocolStore.create_empty(sql_engine=sql_engine).insert(
+        ProtocolResource(
+            protocol_id="protocol-id",
+            created_at=datetime(year=2021, month=1, day=1, tzinfo=timezone.utc),
+            source=source,
+            protocol_key=None,
+        )
+    )
+
+    assert (protocols_directory / "protocol-id.source.json").exists()
+
+    protocol_reader = decoy.mock(cls=ProtocolReader)
+    subject = await ProtocolStore.rehydrate(
+        sql_engine=sql_engine,
+        protocols_directory=protocols_directory,
+        protocol_reader=protocol_reader,
+    )
+
+    assert subject.get("protocol-id").source == source
+    decoy.verify(
+        await protocol_reader.read_saved(
+            files=matchers.Anything(), directory=matchers.Anything()
+        ),
+        times=0,
+    )
+
+    subject.remove("protocol-id")
+    assert list(protocols_directory.iterdir()) == []
@@ -1,4 +1,5 @@
 """Tests for the /protocols router."""
+import json
 import pytest
 from datetime import datetime
 from decoy import Decoy, matchers
@@ -18,10 +19,16 @@ from opentrons.protocol_reader import (
 )
 
 from robot_server.errors import ApiError
-from robot_server.service.json_api import SimpleEmptyBody, MultiBodyMeta
+from robot_server.service.json_api import (
+    SimpleBody,
+    SimpleEmptyBody,
+    SimpleMultiBody,
+    MultiBodyMeta,
+)
 from robot_server.service.task_runner import TaskRunner
 from robot_server.protocols.analysis_store import AnalysisStore, AnalysisNotFoundError
 from robot_server.protocols.protocol_analyzer import ProtocolAnalyzer
+from robot_server.protocols.analysis_executor import AnalysisExecutor
 from robot_server.protocols.protocol_auto_deleter import ProtocolAutoDeleter
 from robot_server.protocols.analysis_models import (
     AnalysisStatus,
@@ -29,12 +36,14 @@ from robot_server.protocols.analysis_models import (
     CompletedAnalysis,
     PendingAnalysis,
     AnalysisResult,
+    AnalysisCacheStats,
 )
 
 from robot_server.protocols.protocol_models import (
     Metadata,
     Protocol,
     ProtocolFile,
+    ProtocolListMeta,
     ProtocolType,
 )
 from robot_server.protocols.protocol_store import (
@@ -78,6 +87,12 @@ def protocol_analyzer(decoy: Decoy) -> ProtocolAnalyzer:
     return decoy.mock(cls=ProtocolAnalyzer)
 
 
+@pytest.fixture
+def analysis_executor(decoy: Decoy) -> AnalysisExecutor:
+    """Get a mocked out AnalysisExecutor."""
+    return decoy.mock(cls=AnalysisExecutor)
+
+
 @pytest.fixture
 def task_runner(decoy: Decoy) -> TaskRunner:
     """Get a mocked out TaskRunner."""
@@ -93,14 +108,22 @@ def protocol_auto_deleter(decoy: Decoy) -> ProtocolAutoDeleter:
 async def test_get_protocols_no_protocols(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_store: AnalysisStore,
 ) -> None:
     """It should return an empty collection response with no protocols loaded."""
+    cache_stats = AnalysisCacheStats(hits=0, misses=0, hitRate=0)
+
     decoy.when(protocol_store.get_all()).then_return([])
+    decoy.when(analysis_store.get_cache_stats()).then_return(cache_stats)
 
-    result = await get_protocols(protocol_store=protocol_store)
+    result = await get_protocols(
+        protocol_store=protocol_store, analysis_store=analysis_store
+    )
 
     assert result.content.data == []
-    assert result.content.meta == MultiBodyMeta(cursor=0, totalLength=0)
+    assert result.content.meta == ProtocolListMeta(
+        cursor=0, totalLength=0, analysisCache=cache_stats
+    )
     assert result.status_code == 200
 
 
@@ -163,6 +186,8 @@ async def test_get_protocols(
     )
 
     decoy.when(protocol_store.get_all()).then_return([resource_1, resource_2])
+    cache_stats = AnalysisCacheStats(hits=1, misses=3, hitRate=0.25)
+    decoy.when(analysis_store.get_cache_stats()).then_return(cache_stats)
     decoy.when(analysis_store.get_summaries_by_protocol("abc")).then_return(
         [analysis_1]
     )
@@ -176,7 +201,9 @@ async def test_get_protocols(
     )
 
     assert result.content.data == [expected_protocol_1, expected_protocol_2]
-    assert result.content.meta == MultiBodyMeta(cursor=0, totalLength=2)
+    assert result.content.meta == ProtocolListMeta(
+        cursor=0, totalLength=2, analysisCache=cache_stats
+    )
     assert result.status_code == 200
 
 
@@ -363,11 +390,19 @@ async def test_create_protocol_not_readable(
 async def test_delete_protocol_by_id(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
-    """It should remove a single protocol file."""
-    result = await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+    """It should remove a single protocol file and cancel its analyses."""
+    result = await delete_protocol_by_id(
+        "protocol-id",
+        protocol_store=protocol_store,
+        analysis_executor=analysis_executor,
+    )
 
-    decoy.verify(protocol_store.remove(protocol_id="protocol-id"))
+    decoy.verify(
+        protocol_store.remove(protocol_id="protocol-id"),
+        analysis_executor.cancel(protocol_id="protocol-id"),
+    )
 
     assert result.content == SimpleEmptyBody()
     assert result.status_code == 200
@@ -376,6 +411,7 @@ async def test_delete_protocol_by_id(
 async def test_delete_protocol_not_found(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     not_found_error = ProtocolNotFoundError("protocol-id")
@@ -385,7 +421,11 @@ async def test_delete_protocol_not_found(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_executor=analysis_executor,
+        )
 
     assert exc_info.value.status_code == 404
 
@@ -393,6 +433,7 @@ async def test_delete_protocol_not_found(
 async def test_delete_protocol_run_exists(
     decoy: Decoy,
     protocol_store: ProtocolStore,
+    analysis_executor: AnalysisExecutor,
 ) -> None:
     """It should 404 if the protocol to delete is not found."""
     run_exists_error = ProtocolUsedByRunError("protocol-id")
@@ -402,7 +443,11 @@ async def test_delete_protocol_run_exists(
     )
 
     with pytest.raises(ApiError) as exc_info:
-        await delete_protocol_by_id("protocol-id", protocol_store=protocol_store)
+        await delete_protocol_by_id(
+            "protocol-id",
+            protocol_store=protocol_store,
+            analysis_executor=analysis_executor,
+        )
 
     assert exc_info.value.status_code == 409
 
@@ -424,9 +469,9 @@ async def test_get_protocol_analyses(
     )
 
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get_by_protocol("protocol-id")).then_return(
-        [analysis]
-    )
+    decoy.when(
+        await analysis_store.get_by_protocol_as_documents("protocol-id")
+    ).then_return([analysis.json(exclude_none=True).encode("utf-8")])
 
     result = await get_protocol_analyses(
         protocolId="protocol-id",
@@ -435,7 +480,12 @@ async def test_get_protocol_analyses(
     )
 
     assert result.status_code == 200
-    assert result.content.data == [analysis]
+    assert json.loads(result.body) == json.loads(
+        SimpleMultiBody.construct(
+            data=[analysis],
+            meta=MultiBodyMeta(cursor=0, totalLength=1),
+        ).json()
+    )
 
 
 async def test_get_protocol_analyses_not_found(
@@ -466,7 +516,9 @@ async def test_get_protocol_analysis_by_id(
     analysis = PendingAnalysis(id="analysis-id")
 
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get("analysis-id")).then_return(analysis)
+    decoy.when(await analysis_store.get_as_document("analysis-id")).then_return(
+        analysis.json(exclude_none=True).encode("utf-8")
+    )
 
     result = await get_protocol_analysis_by_id(
         protocolId="protocol-id",
@@ -476,7 +528,9 @@ async def test_get_protocol_analysis_by_id(
     )
 
     assert result.status_code == 200
-    assert result.content.data == analysis
+    assert json.loads(result.body) == json.loads(
+        SimpleBody.construct(data=analysis).json()
+    )
 
 
 async def test_get_protocol_analysis_by_id_protocol_not_found(
@@ -506,7 +560,7 @@ async def test_get_protocol_analysis_by_id_analysis_not_found(
 ) -> None:
     """It should get a single full analysis by ID."""
     decoy.when(protocol_store.has("protocol-id")).then_return(True)
-    decoy.when(await analysis_store.get("analysis-id")).then_raise(
+    decoy.when(await analysis_store.get_as_document("analysis-id")).then_raise(
         AnalysisNotFoundError("oh no")
     )
 
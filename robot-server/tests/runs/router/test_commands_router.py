@@ -12,6 +12,7 @@ from opentrons.protocol_engine import (
     errors as pe_errors,
 )
 
+from robot_server.commands_summary import CommandsSummary
 from robot_server.errors import ApiError
 from robot_server.service.json_api import (
     RequestModel,
@@ -29,6 +30,7 @@ from robot_server.runs.router.commands_router import (
     create_run_command,
     get_run_command,
     get_run_commands,
+    get_run_commands_summary,
     get_current_run_engine_from_url,
 )
 
@@ -369,6 +371,48 @@ async def test_get_run_commands_not_found(
     assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
 
 
+async def test_get_run_commands_summary(
+    decoy: Decoy, mock_run_data_manager: RunDataManager
+) -> None:
+    """It should return a summary of the run's commands."""
+    commands_summary = CommandsSummary(
+        totalLength=1,
+        countsByStatus={pe_commands.CommandStatus.SUCCEEDED: 1},
+        countsByType={"home": 1},
+        errors=[],
+    )
+
+    decoy.when(mock_run_data_manager.get_commands_summary(run_id="run-id")).then_return(
+        commands_summary
+    )
+
+    result = await get_run_commands_summary(
+        runId="run-id",
+        run_data_manager=mock_run_data_manager,
+    )
+
+    assert result.content.data == commands_summary
+    assert result.status_code == 200
+
+
+async def test_get_run_commands_summary_not_found(
+    decoy: Decoy, mock_run_data_manager: RunDataManager
+) -> None:
+    """It should 404 if the run does not exist."""
+    decoy.when(mock_run_data_manager.get_commands_summary(run_id="run-id")).then_raise(
+        RunNotFoundError("run-id")
+    )
+
+    with pytest.raises(ApiError) as exc_info:
+        await get_run_commands_summary(
+            runId="run-id",
+            run_data_manager=mock_run_data_manager,
+        )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.content["errors"][0]["id"] == "RunNotFound"
+
+
 async def test_get_run_command_by_id(
     decoy: Decoy, mock_run_data_manager: RunDataManager
 ) -> None:
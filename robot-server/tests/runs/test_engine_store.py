@@ -13,6 +13,7 @@ from opentrons.protocol_engine import ProtocolEngine, StateSummary, types as pe_
 from opentrons.protocol_runner import ProtocolRunner, ProtocolRunResult
 from opentrons.protocol_reader import ProtocolReader, ProtocolSource
 
+from robot_server.commands_summary import CommandsSummaryTracker
 from robot_server.protocols import ProtocolResource
 from robot_server.runs.engine_store import EngineStore, EngineConflictError
 
@@ -43,6 +44,7 @@ async def test_create_engine(subject: EngineStore) -> None:
     assert isinstance(result, StateSummary)
     assert isinstance(subject.runner, ProtocolRunner)
     assert isinstance(subject.engine, ProtocolEngine)
+    assert isinstance(subject.commands_summary_tracker, CommandsSummaryTracker)
 
 
 async def test_create_engine_with_labware_offsets(subject: EngineStore) -> None:
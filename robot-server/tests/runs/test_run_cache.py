@@ -0,0 +1,146 @@
+"""Tests for robot_server.runs.run_cache."""
+from typing import List, Tuple
+
+import pytest
+
+from robot_server.runs.run_cache import RunCache, RunCacheMetrics
+
+
+class _Loader:
+    def __init__(self, value: str, size: int) -> None:
+        self.value = value
+        self.size = size
+        self.calls = 0
+
+    def __call__(self) -> Tuple[str, int]:
+        self.calls += 1
+        return self.value, self.size
+
+
+def test_get_or_load_caches_value() -> None:
+    """It should only load a value once, and track hits and misses."""
+    subject = RunCache(max_size_bytes=100)
+    load = _Loader("value", 10)
+
+    assert subject.get_or_load("run-id", "key", load) == "value"
+    assert subject.get_or_load("run-id", "key", load) == "value"
+    assert load.calls == 1
+    assert subject.metrics == RunCacheMetrics(
+        hits=1,
+        misses=1,
+        evictions=0,
+        entries=1,
+        size_bytes=10,
+        max_size_bytes=100,
+    )
+
+
+def test_get_or_load_does_not_cache_errors() -> None:
+    """It should not cache anything if loading raises."""
+    subject = RunCache(max_size_bytes=100)
+
+    def _raise() -> Tuple[str, int]:
+        raise LookupError("oh no")
+
+    with pytest.raises(LookupError):
+        subject.get_or_load("run-id", "key", _raise)
+
+    assert subject.metrics.entries == 0
+
+
+def test_evicts_least_recently_used() -> None:
+    """It should evict the least recently used entries to stay within budget."""
+    subject = RunCache(max_size_bytes=25)
+    loads: List[_Loader] = [_Loader(f"value-{i}", 10) for i in range(3)]
+
+    subject.get_or_load("run-1", "key", loads[0])
+    subject.get_or_load("run-2", "key", loads[1])
+    # Use run-1's entry so that run-2's is the least recently used.
+    subject.get_or_load("run-1", "key", loads[0])
+    subject.get_or_load("run-3", "key", loads[2])
+
+    subject.get_or_load("run-1", "key", loads[0])
+    subject.get_or_load("run-2", "key", loads[1])
+
+    assert [load.calls for load in loads] == [1, 2, 1]
+    assert subject.metrics.evictions == 2
+    assert subject.metrics.size_bytes == 20
+
+
+def test_does_not_cache_oversized_values() -> None:
+    """It should not cache a value larger than the whole budget."""
+    subject = RunCache(max_size_bytes=25)
+    small = _Loader("small", 10)
+    large = _Loader("large", 30)
+
+    subject.get_or_load("run-1", "key", small)
+    subject.get_or_load("run-2", "key", large)
+    subject.get_or_load("run-1", "key", small)
+    subject.get_or_load("run-2", "key", large)
+
+    assert small.calls == 1
+    assert large.calls == 2
+
+
+def test_zero_size_disables_caching() -> None:
+    """It should cache nothing if its budget is 0."""
+    subject = RunCache(max_size_bytes=0)
+    load = _Loader("value", 1)
+
+    subject.get_or_load("run-id", "key", load)
+    subject.get_or_load("run-id", "key", load)
+
+    assert load.calls == 2
+
+
+def test_invalidate_run() -> None:
+    """It should only invalidate the given run's entries, and the run list's."""
+    subject = RunCache(max_size_bytes=100)
+    run_1 = _Loader("run-1", 10)
+    run_2 = _Loader("run-2", 10)
+    all_runs = _Loader("all", 10)
+
+    def _read_all() -> None:
+        subject.get_or_load("run-1", "key", run_1)
+        subject.get_or_load("run-2", "key", run_2)
+        subject.get_or_load(None, "key", all_runs)
+
+    _read_all()
+    subject.invalidate_run("run-1", run_list_changed=False)
+    _read_all()
+
+    assert (run_1.calls, run_2.calls, all_runs.calls) == (2, 1, 1)
+
+    subject.invalidate_run("run-1")
+    _read_all()
+
+    assert (run_1.calls, run_2.calls, all_runs.calls) == (3, 1, 2)
+    assert subject.metrics.size_bytes == 30
+
+
+def test_invalidate_during_load() -> None:
+    """It should not cache a value if it was invalidated while loading."""
+    subject = RunCache(max_size_bytes=100)
+    load = _Loader("value", 10)
+
+    def _load_while_writing() -> Tuple[str, int]:
+        subject.invalidate_run("run-id")
+        return load()
+
+    subject.get_or_load("run-id", "key", _load_while_writing)
+    subject.get_or_load("run-id", "key", load)
+
+    assert load.calls == 2
+
+
+def test_clear() -> None:
+    """It should remove every entry."""
+    subject = RunCache(max_size_bytes=100)
+    load = _Loader("value", 10)
+
+    subject.get_or_load("run-id", "key", load)
+    subject.clear()
+    subject.get_or_load("run-id", "key", load)
+
+    assert load.calls == 2
+    assert subject.metrics.size_bytes == 10
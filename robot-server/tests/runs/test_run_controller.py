@@ -157,6 +157,7 @@ async def test_create_play_action_to_start(
             run_id=run_id,
             summary=engine_state_summary,
             commands=protocol_commands,
+            replace_commands=False,
         ),
         times=1,
     )
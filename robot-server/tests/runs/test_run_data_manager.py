@@ -21,6 +21,7 @@ from opentrons.protocol_engine import (
     LabwareOffset,
 )
 
+from robot_server.commands_summary import CommandsSummary
 from robot_server.protocols import ProtocolResource
 from robot_server.runs.engine_store import EngineStore, EngineConflictError
 from robot_server.runs.run_data_manager import RunDataManager, RunNotCurrentError
@@ -249,6 +250,132 @@ async def test_create_engine_error(
     )
 
 
+async def test_create_flushes_commands(
+    decoy: Decoy,
+    mock_engine_store: EngineStore,
+    mock_run_store: RunStore,
+    mock_task_runner: TaskRunner,
+    engine_state_summary: StateSummary,
+    run_resource: RunResource,
+) -> None:
+    """It should write completed commands to the store while the run is current."""
+    run_id = "hello world"
+    created_at = datetime(year=2021, month=1, day=1)
+    engine = mock_engine_store.engine
+    func_captor = matchers.Captor()
+
+    command_1 = commands.WaitForResume(
+        id="command-1",
+        key="command-key",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=commands.CommandStatus.SUCCEEDED,
+        params=commands.WaitForResumeParams(),
+    )
+    command_2 = commands.WaitForResume(
+        id="command-2",
+        key="command-key",
+        createdAt=datetime(year=2021, month=1, day=1),
+        status=commands.CommandStatus.RUNNING,
+        params=commands.WaitForResumeParams(),
+    )
+    command_2_done = command_2.copy(update={"status": commands.CommandStatus.FAILED})
+
+    subject = RunDataManager(
+        engine_store=mock_engine_store,
+        run_store=mock_run_store,
+        task_runner=mock_task_runner,
+        command_flush_interval=0,
+        command_flush_batch_size=2,
+    )
+
+    decoy.when(
+        await mock_engine_store.create(run_id=run_id, labware_offsets=[], protocol=None)
+    ).then_return(engine_state_summary)
+    decoy.when(
+        mock_run_store.insert(run_id=run_id, protocol_id=None, created_at=created_at)
+    ).then_return(run_resource)
+
+    await subject.create(
+        run_id=run_id,
+        created_at=created_at,
+        labware_offsets=[],
+        protocol=None,
+    )
+
+    decoy.verify(mock_task_runner.run(func_captor, run_id=run_id, engine=engine))
+
+    decoy.when(engine.state_view.commands.get_slice(cursor=0, length=2)).then_return(
+        CommandSlice(commands=[command_1, command_2], cursor=0, total_length=2)
+    )
+    decoy.when(engine.state_view.commands.get_slice(cursor=1, length=2)).then_return(
+        CommandSlice(commands=[command_2_done], cursor=1, total_length=2)
+    )
+    decoy.when(mock_engine_store.current_run_id).then_return(run_id, run_id, None)
+
+    await func_captor.value(run_id=run_id, engine=engine)
+
+    decoy.verify(
+        mock_run_store.insert_commands(
+            run_id=run_id, start_index=0, commands=[command_1]
+        ),
+        mock_run_store.insert_commands(
+            run_id=run_id, start_index=1, commands=[command_2_done]
+        ),
+    )
+
+
+async def test_flush_commands_stops_with_engine(
+    decoy: Decoy,
+    mock_engine_store: EngineStore,
+    mock_run_store: RunStore,
+    mock_task_runner: TaskRunner,
+    engine_state_summary: StateSummary,
+    run_resource: RunResource,
+) -> None:
+    """It should stop flushing commands once the engine has stopped."""
+    run_id = "hello world"
+    created_at = datetime(year=2021, month=1, day=1)
+    engine = mock_engine_store.engine
+    func_captor = matchers.Captor()
+
+    subject = RunDataManager(
+        engine_store=mock_engine_store,
+        run_store=mock_run_store,
+        task_runner=mock_task_runner,
+        command_flush_interval=0,
+    )
+
+    decoy.when(
+        await mock_engine_store.create(run_id=run_id, labware_offsets=[], protocol=None)
+    ).then_return(engine_state_summary)
+    decoy.when(
+        mock_run_store.insert(run_id=run_id, protocol_id=None, created_at=created_at)
+    ).then_return(run_resource)
+
+    await subject.create(
+        run_id=run_id,
+        created_at=created_at,
+        labware_offsets=[],
+        protocol=None,
+    )
+
+    decoy.verify(mock_task_runner.run(func_captor, run_id=run_id, engine=engine))
+
+    decoy.when(mock_engine_store.current_run_id).then_return(run_id)
+    decoy.when(engine.state_view.commands.get_is_stopped()).then_return(True)
+
+    await func_captor.value(run_id=run_id, engine=engine)
+
+    decoy.verify(
+        mock_run_store.insert_commands(
+            run_id=matchers.Anything(),
+            start_index=matchers.Anything(),
+            commands=matchers.Anything(),
+        ),
+        times=0,
+    )
+
+
 async def test_get_current_run(
     decoy: Decoy,
     mock_engine_store: EngineStore,
@@ -493,6 +620,7 @@ async def test_update_current(
             run_id=run_id,
             summary=engine_state_summary,
             commands=[run_command],
+            replace_commands=False,
         )
     ).then_return(run_resource)
 
@@ -541,6 +669,7 @@ async def test_update_current_noop(
             run_id=run_id,
             summary=matchers.Anything(),
             commands=matchers.Anything(),
+            replace_commands=matchers.Anything(),
         ),
         times=0,
     )
@@ -624,6 +753,7 @@ async def test_create_archives_existing(
             run_id=run_id_old,
             summary=engine_state_summary,
             commands=[run_command],
+            replace_commands=False,
         )
     )
 
@@ -689,6 +819,42 @@ def test_get_commands_slice_current_run(
     assert expected_command_slice == result
 
 
+def test_get_commands_summary_from_db(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_run_store: RunStore,
+) -> None:
+    """It should get a historical run's commands summary from the run store."""
+    commands_summary = CommandsSummary(
+        totalLength=0, countsByStatus={}, countsByType={}, errors=[]
+    )
+    decoy.when(mock_run_store.get_commands_summary(run_id="run-id")).then_return(
+        commands_summary
+    )
+
+    assert subject.get_commands_summary(run_id="run-id") == commands_summary
+
+
+def test_get_commands_summary_current_run(
+    decoy: Decoy,
+    subject: RunDataManager,
+    mock_engine_store: EngineStore,
+) -> None:
+    """It should get the current run's commands summary from its tracker."""
+    commands_summary = CommandsSummary(
+        totalLength=1,
+        countsByStatus={commands.CommandStatus.SUCCEEDED: 1},
+        countsByType={"waitForResume": 1},
+        errors=[],
+    )
+    decoy.when(mock_engine_store.current_run_id).then_return("run-id")
+    decoy.when(mock_engine_store.commands_summary_tracker.get_summary()).then_return(
+        commands_summary
+    )
+
+    assert subject.get_commands_summary(run_id="run-id") == commands_summary
+
+
 def test_get_commands_slice_from_db_run_not_found(
     decoy: Decoy, subject: RunDataManager, mock_run_store: RunStore
 ) -> None:
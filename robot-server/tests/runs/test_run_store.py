@@ -4,9 +4,11 @@ from typing import List, Optional, Type
 
 import pytest
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
 
 from opentrons_shared_data.pipette.dev_types import PipetteNameType
 
+from robot_server.commands_summary import CommandsSummary
 from robot_server.protocols.protocol_store import ProtocolNotFoundError
 from robot_server.runs.run_store import (
     RunStore,
@@ -374,6 +376,54 @@ def test_get_command(
     assert result == protocol_commands[1]
 
 
+def test_get_command_cached_per_run(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """Writing to one run should not evict another run's cached commands."""
+    for run_id in ["run-1", "run-2"]:
+        subject.insert(
+            run_id=run_id, protocol_id=None, created_at=datetime.now(timezone.utc)
+        )
+        subject.update_run_state(
+            run_id=run_id,
+            summary=state_summary,
+            commands=protocol_commands[:1],
+        )
+
+    subject.get_command(run_id="run-1", command_id="pause-1")
+    subject.get_command(run_id="run-2", command_id="pause-1")
+    subject.insert_commands(
+        run_id="run-2", start_index=1, commands=protocol_commands[1:2]
+    )
+
+    assert subject.get_command(run_id="run-1", command_id="pause-1") == (
+        protocol_commands[0]
+    )
+    assert subject.get_command(run_id="run-2", command_id="pause-2") == (
+        protocol_commands[1]
+    )
+    assert subject.cache_metrics.hits == 1
+    assert subject.cache_metrics.misses == 3
+
+
+def test_cache_disabled(
+    sql_engine: Engine,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should read from the database every time if caching is disabled."""
+    subject = RunStore(sql_engine=sql_engine, cache_size_bytes=0)
+    subject.insert(
+        run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+
+    assert subject.get(run_id="run-id") == subject.get(run_id="run-id")
+    assert subject.cache_metrics.hits == 0
+    assert subject.cache_metrics.size_bytes == 0
+
+
 @pytest.mark.parametrize(
     "input_run_id, input_command_id, expected_exception",
     [
@@ -402,6 +452,163 @@ def test_get_command_raise_exception(
         subject.get_command(run_id=input_run_id, command_id=input_command_id)
 
 
+def test_update_run_state_replaces_commands(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should replace previously stored commands on update."""
+    subject.insert(
+        run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands[:1],
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", cursor=None, length=10)
+
+    assert result == CommandSlice(
+        commands=protocol_commands[:1], cursor=0, total_length=1
+    )
+
+
+def test_insert_commands(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should store batches of commands while a run is in progress."""
+    subject.insert(
+        run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+    subject.insert_commands(
+        run_id="run-id", start_index=0, commands=protocol_commands[:1]
+    )
+    subject.insert_commands(
+        run_id="run-id", start_index=1, commands=protocol_commands[1:2]
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", cursor=None, length=10)
+
+    assert result == CommandSlice(
+        commands=protocol_commands[:2], cursor=0, total_length=2
+    )
+    assert subject.get_command(run_id="run-id", command_id="pause-2") == (
+        protocol_commands[1]
+    )
+
+
+def test_insert_commands_run_not_found(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should raise if the commands' run does not exist."""
+    with pytest.raises(RunNotFoundError, match="run-not-found"):
+        subject.insert_commands(
+            run_id="run-not-found", start_index=0, commands=protocol_commands
+        )
+
+
+def test_insert_commands_already_stored(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should not mistake a command stored twice for a missing run."""
+    subject.insert(
+        run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+    subject.insert_commands(
+        run_id="run-id", start_index=0, commands=protocol_commands[:2]
+    )
+
+    with pytest.raises(IntegrityError):
+        subject.insert_commands(
+            run_id="run-id", start_index=1, commands=protocol_commands[1:]
+        )
+
+
+def test_update_run_state_keeps_inserted_commands(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should only write commands that were not already inserted."""
+    subject.insert(
+        run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+    subject.insert_commands(
+        run_id="run-id", start_index=0, commands=protocol_commands[:2]
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        # stand-in for the earlier commands, which should not be written again
+        commands=[protocol_commands[2], protocol_commands[2], protocol_commands[2]],
+        replace_commands=False,
+    )
+
+    result = subject.get_commands_slice(run_id="run-id", cursor=None, length=10)
+
+    assert result == CommandSlice(commands=protocol_commands, cursor=0, total_length=3)
+
+
+def test_get_commands_summary(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+    state_summary: StateSummary,
+) -> None:
+    """It should get the summary of the run's commands stored with its state."""
+    subject.insert(
+        run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+    subject.update_run_state(
+        run_id="run-id",
+        summary=state_summary,
+        commands=protocol_commands,
+    )
+
+    result = subject.get_commands_summary(run_id="run-id")
+
+    assert result == CommandsSummary(
+        totalLength=3,
+        countsByStatus={pe_commands.CommandStatus.SUCCEEDED: 3},
+        countsByType={"waitForResume": 3},
+        errors=[],
+    )
+
+
+def test_get_commands_summary_without_state(
+    subject: RunStore,
+    protocol_commands: List[pe_commands.Command],
+) -> None:
+    """It should compute the summary from stored commands if it's not stored."""
+    subject.insert(
+        run_id="run-id", protocol_id=None, created_at=datetime.now(timezone.utc)
+    )
+    subject.insert_commands(
+        run_id="run-id", start_index=0, commands=protocol_commands[:2]
+    )
+
+    result = subject.get_commands_summary(run_id="run-id")
+
+    assert result == CommandsSummary(
+        totalLength=2,
+        countsByStatus={pe_commands.CommandStatus.SUCCEEDED: 2},
+        countsByType={"waitForResume": 2},
+        errors=[],
+    )
+
+    with pytest.raises(RunNotFoundError, match="run-not-found"):
+        subject.get_commands_summary(run_id="run-not-found")
+
+
 def test_get_command_slice(
     subject: RunStore,
     protocol_commands: List[pe_commands.Command],
@@ -0,0 +1,212 @@
+"""Tests for robot_server.commands_summary."""
+from datetime import datetime
+from typing import List
+
+from decoy import Decoy
+
+from opentrons.protocol_engine import (
+    CommandSlice,
+    CurrentCommand,
+    commands as pe_commands,
+    errors as pe_errors,
+)
+from opentrons.protocol_engine.state import CommandView, StateView
+
+from robot_server.commands_summary import (
+    CommandsSummary,
+    CommandsSummaryTracker,
+    summarize_commands,
+)
+
+
+def test_summarize_commands() -> None:
+    """It should count, time, and collect the errors of commands."""
+    error = pe_errors.ErrorOccurrence(
+        id="error-id",
+        createdAt=datetime(year=2022, month=2, day=2, minute=4),
+        errorType="BadError",
+        detail="oh no",
+    )
+    commands: List[pe_commands.Command] = [
+        pe_commands.Home(
+            id="command-1",
+            key="command-1",
+            status=pe_commands.CommandStatus.SUCCEEDED,
+            createdAt=datetime(year=2022, month=2, day=2, minute=0),
+            startedAt=datetime(year=2022, month=2, day=2, minute=1),
+            completedAt=datetime(year=2022, month=2, day=2, minute=2),
+            params=pe_commands.HomeParams(),
+        ),
+        pe_commands.WaitForResume(
+            id="command-2",
+            key="command-2",
+            status=pe_commands.CommandStatus.FAILED,
+            createdAt=datetime(year=2022, month=2, day=2, minute=0),
+            startedAt=datetime(year=2022, month=2, day=2, minute=3),
+            completedAt=datetime(year=2022, month=2, day=2, minute=4),
+            params=pe_commands.WaitForResumeParams(),
+            error=error,
+        ),
+        pe_commands.Home(
+            id="command-3",
+            key="command-3",
+            status=pe_commands.CommandStatus.QUEUED,
+            createdAt=datetime(year=2022, month=2, day=2, minute=0),
+            params=pe_commands.HomeParams(),
+        ),
+    ]
+
+    assert summarize_commands(commands) == CommandsSummary(
+        totalLength=3,
+        countsByStatus={
+            pe_commands.CommandStatus.SUCCEEDED: 1,
+            pe_commands.CommandStatus.FAILED: 1,
+            pe_commands.CommandStatus.QUEUED: 1,
+        },
+        countsByType={"home": 2, "waitForResume": 1},
+        startedAt=datetime(year=2022, month=2, day=2, minute=1),
+        completedAt=datetime(year=2022, month=2, day=2, minute=4),
+        errors=[error],
+    )
+
+
+def test_summarize_no_commands() -> None:
+    """It should summarize an empty list of commands."""
+    assert summarize_commands([]) == CommandsSummary(
+        totalLength=0,
+        countsByStatus={},
+        countsByType={},
+        startedAt=None,
+        completedAt=None,
+        errors=[],
+    )
+
+
+def test_track_commands_summary(decoy: Decoy) -> None:
+    """It should summarize a run's commands, reading only new or changed ones."""
+    state_view = decoy.mock(cls=StateView)
+    command_view = decoy.mock(cls=CommandView)
+    decoy.when(state_view.commands).then_return(command_view)
+    error = pe_errors.ErrorOccurrence(
+        id="error-id",
+        createdAt=datetime(year=2022, month=2, day=2, minute=4),
+        errorType="BadError",
+        detail="oh no",
+    )
+    command_1 = pe_commands.Home(
+        id="command-1",
+        key="command-1",
+        status=pe_commands.CommandStatus.SUCCEEDED,
+        createdAt=datetime(year=2022, month=2, day=2, minute=0),
+        startedAt=datetime(year=2022, month=2, day=2, minute=1),
+        completedAt=datetime(year=2022, month=2, day=2, minute=2),
+        params=pe_commands.HomeParams(),
+    )
+    command_2 = pe_commands.WaitForResume(
+        id="command-2",
+        key="command-2",
+        status=pe_commands.CommandStatus.RUNNING,
+        createdAt=datetime(year=2022, month=2, day=2, minute=0),
+        startedAt=datetime(year=2022, month=2, day=2, minute=3),
+        params=pe_commands.WaitForResumeParams(),
+    )
+    command_2_failed = command_2.copy(
+        update={
+            "status": pe_commands.CommandStatus.FAILED,
+            "completedAt": datetime(year=2022, month=2, day=2, minute=4),
+            "error": error,
+        }
+    )
+    command_3 = pe_commands.Home(
+        id="command-3",
+        key="command-3",
+        status=pe_commands.CommandStatus.QUEUED,
+        createdAt=datetime(year=2022, month=2, day=2, minute=0),
+        params=pe_commands.HomeParams(),
+    )
+    command_3_failed = command_3.copy(
+        update={
+            "status": pe_commands.CommandStatus.FAILED,
+            "completedAt": datetime(year=2022, month=2, day=2, minute=4),
+        }
+    )
+    command_4 = command_3.copy(update={"id": "command-4", "key": "command-4"})
+
+    subject = CommandsSummaryTracker(state_view=state_view)
+
+    decoy.when(state_view.version).then_return(1, 2)
+    decoy.when(
+        command_view.get_count_by_status(pe_commands.CommandStatus.QUEUED)
+    ).then_return(1)
+    decoy.when(
+        command_view.get_count_by_status(pe_commands.CommandStatus.RUNNING)
+    ).then_return(1, 0)
+    decoy.when(
+        command_view.get_count_by_status(pe_commands.CommandStatus.SUCCEEDED)
+    ).then_return(1)
+    decoy.when(
+        command_view.get_count_by_status(pe_commands.CommandStatus.FAILED)
+    ).then_return(0, 2)
+    decoy.when(command_view.get_slice(cursor=0, length=3)).then_return(
+        CommandSlice(
+            commands=[command_1, command_2, command_3], cursor=0, total_length=3
+        )
+    )
+    decoy.when(command_view.get_slice(cursor=3, length=1)).then_return(
+        CommandSlice(commands=[command_4], cursor=3, total_length=4)
+    )
+    decoy.when(command_view.get("command-1")).then_return(command_1)
+    decoy.when(command_view.get("command-2")).then_return(command_2, command_2_failed)
+    decoy.when(command_view.get("command-3")).then_return(command_3_failed)
+    decoy.when(command_view.get_current()).then_return(
+        CurrentCommand(
+            command_id="command-2",
+            command_key="command-2",
+            created_at=datetime(year=2022, month=2, day=2, minute=0),
+            index=1,
+        ),
+        None,
+    )
+
+    assert subject.get_summary() == CommandsSummary(
+        totalLength=3,
+        countsByStatus={
+            pe_commands.CommandStatus.QUEUED: 1,
+            pe_commands.CommandStatus.RUNNING: 1,
+            pe_commands.CommandStatus.SUCCEEDED: 1,
+        },
+        countsByType={"home": 2, "waitForResume": 1},
+        startedAt=datetime(year=2022, month=2, day=2, minute=1),
+        completedAt=datetime(year=2022, month=2, day=2, minute=2),
+        errors=[],
+    )
+    assert subject.get_summary() == CommandsSummary(
+        totalLength=4,
+        countsByStatus={
+            pe_commands.CommandStatus.QUEUED: 1,
+            pe_commands.CommandStatus.SUCCEEDED: 1,
+            pe_commands.CommandStatus.FAILED: 2,
+        },
+        countsByType={"home": 3, "waitForResume": 1},
+        startedAt=datetime(year=2022, month=2, day=2, minute=1),
+        completedAt=datetime(year=2022, month=2, day=2, minute=4),
+        errors=[error],
+    )
+    decoy.verify(command_view.get("command-4"), times=0)
+
+
+def test_track_commands_summary_unchanged_state(decoy: Decoy) -> None:
+    """It should reuse the last summary if the state has not changed since."""
+    state_view = decoy.mock(cls=StateView)
+    command_view = decoy.mock(cls=CommandView)
+    decoy.when(state_view.commands).then_return(command_view)
+    decoy.when(state_view.version).then_return(1)
+    decoy.when(command_view.get_current()).then_return(None)
+    for status in pe_commands.CommandStatus:
+        decoy.when(command_view.get_count_by_status(status)).then_return(0)
+
+    subject = CommandsSummaryTracker(state_view=state_view)
+    result = subject.get_summary()
+
+    assert subject.get_summary() is result
+    decoy.verify(command_view.get_current(), times=1)
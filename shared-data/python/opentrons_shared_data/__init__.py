@@ -7,7 +7,7 @@ the main opentrons package
 import os
 import json
 
-from .load import get_shared_data_root, load_shared_data
+from .load import get_shared_data_root, load_shared_data, list_shared_data
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 
@@ -19,4 +19,9 @@ except (FileNotFoundError, OSError):
     __version__ = "unknown"
 
 
-__all__ = ["__version__", "get_shared_data_root", "load_shared_data"]
+__all__ = [
+    "__version__",
+    "get_shared_data_root",
+    "load_shared_data",
+    "list_shared_data",
+]
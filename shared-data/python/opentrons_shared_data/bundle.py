@@ -0,0 +1,141 @@
+"""A single, indexed file containing many shared data files.
+
+Reading thousands of small JSON files is slow on the robot's SD card, so
+the most frequently used definitions are also packed into one bundle file
+at build time. The bundle is memory-mapped, so opening it reads only its
+index, and each lookup reads only the requested file's bytes.
+
+The bundle layout is:
+
+- The magic bytes ``_MAGIC``.
+- The length of the index, as an 8 byte big-endian unsigned integer.
+- The index, a JSON object mapping each file's path, relative to the shared
+  data root and using forward slashes, to its ``[offset, length]``.
+  Offsets are relative to the end of the index.
+- The contents of every file, concatenated.
+"""
+import json
+import mmap
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple, Union
+
+_MAGIC = b"OTSDBND1"
+_LENGTH_SIZE = 8
+
+BUNDLE_FILE_NAME = "bundle.bin"
+
+BUNDLED_DIRECTORIES = [
+    "labware/definitions/2",
+    "deck/definitions",
+    "pipette/definitions",
+]
+"""Directories, relative to the shared data root, whose files are bundled."""
+
+
+class BundleFormatError(ValueError):
+    """Raised if a bundle file is not in the expected format."""
+
+
+def _to_key(path: Union[str, Path]) -> str:
+    return Path(path).as_posix()
+
+
+def write_bundle(root: Path, files: Iterable[Path], target: Path) -> None:
+    """Pack shared data files into a bundle.
+
+    JSON files are minimized; anything else is stored as-is.
+
+    Args:
+        root: The shared data root that `files` are relative to.
+        files: The files to bundle, relative to `root`.
+        target: Where to write the bundle.
+    """
+    index: Dict[str, Tuple[int, int]] = {}
+    contents: List[bytes] = []
+    offset = 0
+
+    for file in sorted(files, key=_to_key):
+        data = (root / file).read_bytes()
+
+        if file.suffix == ".json":
+            data = json.dumps(json.loads(data), separators=(",", ":")).encode()
+
+        index[_to_key(file)] = (offset, len(data))
+        contents.append(data)
+        offset += len(data)
+
+    index_bytes = json.dumps(index, separators=(",", ":")).encode()
+
+    with open(target, "wb") as f:
+        f.write(_MAGIC)
+        f.write(len(index_bytes).to_bytes(_LENGTH_SIZE, "big"))
+        f.write(index_bytes)
+
+        for data in contents:
+            f.write(data)
+
+
+def find_bundled_files(root: Path) -> List[Path]:
+    """Get every file under `root` that belongs in the bundle, relative to `root`."""
+    return [
+        path.relative_to(root)
+        for directory in BUNDLED_DIRECTORIES
+        for path in (root / directory).glob("**/*.json")
+    ]
+
+
+class SharedDataBundle:
+    """A read-only, memory-mapped view of a bundle file."""
+
+    def __init__(self, path: Path) -> None:
+        """Open a bundle file and read its index.
+
+        Raises:
+            BundleFormatError: The file is not a bundle.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_size = len(_MAGIC) + _LENGTH_SIZE
+
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            raise BundleFormatError(f"{path} is not a shared data bundle.")
+
+        index_size = int.from_bytes(self._mmap[len(_MAGIC) : header_size], "big")
+        index_bytes = self._mmap[header_size : header_size + index_size]
+        self._data_start = header_size + index_size
+        self._index: Dict[str, Tuple[int, int]] = {
+            key: (offset, length)
+            for key, (offset, length) in json.loads(index_bytes).items()
+        }
+        self._children: Dict[str, Set[str]] = {}
+
+        for key in self._index:
+            parts = key.split("/")
+
+            for depth in range(len(parts)):
+                parent = "/".join(parts[:depth])
+                self._children.setdefault(parent, set()).add(parts[depth])
+
+    def has(self, path: Union[str, Path]) -> bool:
+        """Whether a file is in the bundle."""
+        return _to_key(path) in self._index
+
+    def load(self, path: Union[str, Path]) -> bytes:
+        """Get the contents of a bundled file.
+
+        Raises:
+            KeyError: The file is not in the bundle.
+        """
+        offset, length = self._index[_to_key(path)]
+        start = self._data_start + offset
+        return self._mmap[start : start + length]
+
+    def list_directory(self, path: Union[str, Path]) -> List[str]:
+        """Get the names of a directory's bundled files and subdirectories.
+
+        Raises:
+            KeyError: No bundled files are in the directory.
+        """
+        key = _to_key(path)
+        return sorted(self._children["" if key == "." else key])
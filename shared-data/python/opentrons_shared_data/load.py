@@ -4,6 +4,13 @@ import os
 from pathlib import Path
 from functools import lru_cache
 
+from .bundle import (
+    BUNDLE_FILE_NAME,
+    BUNDLED_DIRECTORIES,
+    BundleFormatError,
+    SharedDataBundle,
+)
+
 log = logging.getLogger(__name__)
 
 ENV_SHARED_DATA_PATH = "OT_SHARED_DATA_PATH"
@@ -47,11 +54,57 @@ def get_shared_data_root() -> Path:
     raise SharedDataMissingError()
 
 
+@lru_cache(maxsize=1)
+def get_shared_data_bundle() -> typing.Optional[SharedDataBundle]:
+    """
+    Get the bundle of frequently used shared data files, if there is one.
+
+    The bundle is built when this package is built, so it's only present in
+    the shared data root of an installed package.
+    """
+    bundle_path = get_shared_data_root() / BUNDLE_FILE_NAME
+
+    try:
+        return SharedDataBundle(bundle_path)
+    except FileNotFoundError:
+        return None
+    except (BundleFormatError, OSError, ValueError):
+        log.warning(f"Ignoring unreadable shared data bundle {bundle_path}")
+        return None
+
+
 def load_shared_data(path: typing.Union[str, Path]) -> bytes:
     """
     Load file from shared data directory.
 
     path is relative to the root of all shared data (ie. no "shared-data")
     """
+    bundle = get_shared_data_bundle()
+    if bundle is not None and bundle.has(path):
+        return bundle.load(path)
+
     with open(get_shared_data_root() / path, "rb") as f:
         return f.read()
+
+
+def list_shared_data(path: typing.Union[str, Path]) -> typing.List[str]:
+    """
+    List the names of the files and subdirectories of a shared data directory.
+
+    path is relative to the root of all shared data (ie. no "shared-data")
+    """
+    bundle = get_shared_data_bundle()
+    if bundle is not None and _is_bundled_directory(Path(path)):
+        try:
+            return bundle.list_directory(path)
+        except KeyError:
+            pass
+
+    return sorted(os.listdir(get_shared_data_root() / path))
+
+
+def _is_bundled_directory(path: Path) -> bool:
+    return any(
+        path == Path(bundled) or Path(bundled) in path.parents
+        for bundled in BUNDLED_DIRECTORIES
+    )
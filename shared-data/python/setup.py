@@ -10,8 +10,14 @@ from setuptools import setup, find_packages
 
 HERE = os.path.abspath(os.path.dirname(__file__))
 sys.path.append(os.path.join(HERE, "..", "..", "scripts"))
+sys.path.insert(0, HERE)
 
 from python_build_utils import normalize_version  # noqa: E402
+from opentrons_shared_data.bundle import (  # noqa: E402
+    BUNDLE_FILE_NAME,
+    find_bundled_files,
+    write_bundle,
+)
 
 # make stdout blocking since Travis sets it to nonblocking
 if os.name == "posix":
@@ -97,6 +103,24 @@ class BuildWithData(build_py.build_py):
         )
         return files
 
+    def run(self) -> None:
+        super().run()
+        # Also pack the most frequently read definitions into one indexed file,
+        # so the robot can load them without walking thousands of small files.
+        bundle_file = (
+            Path(self.build_lib)
+            / "opentrons_shared_data"
+            / DEST_BASE_PATH
+            / BUNDLE_FILE_NAME
+        )
+        self.announce(f"writing shared data bundle {bundle_file}")
+        bundle_file.parent.mkdir(parents=True, exist_ok=True)
+        write_bundle(
+            root=Path(DATA_ROOT),
+            files=find_bundled_files(Path(DATA_ROOT)),
+            target=bundle_file,
+        )
+
 
 def get_version():
     buildno = os.getenv("BUILD_NUMBER")
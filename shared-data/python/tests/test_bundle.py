@@ -0,0 +1,120 @@
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from opentrons_shared_data import load
+from opentrons_shared_data.bundle import (
+    BUNDLE_FILE_NAME,
+    BundleFormatError,
+    SharedDataBundle,
+    find_bundled_files,
+    write_bundle,
+)
+
+
+@pytest.fixture
+def shared_data_root(tmp_path: Path) -> Path:
+    root = tmp_path / "shared-data"
+    labware_dir = root / "labware" / "definitions" / "2"
+    (labware_dir / "plate").mkdir(parents=True)
+    (labware_dir / "plate" / "1.json").write_text('{"a": 1,\n "b": [1, 2]}')
+    (labware_dir / "tiprack").mkdir()
+    (labware_dir / "tiprack" / "1.json").write_text("{}")
+    (labware_dir / "tiprack" / "2.json").write_text("{}")
+    (root / "labware" / "schemas").mkdir(parents=True)
+    (root / "labware" / "schemas" / "2.json").write_text('{"not": "bundled"}')
+    return root
+
+
+@pytest.fixture
+def bundled_root(
+    shared_data_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    write_bundle(
+        root=shared_data_root,
+        files=find_bundled_files(shared_data_root),
+        target=shared_data_root / BUNDLE_FILE_NAME,
+    )
+    # Delete the original files to make sure they're read from the bundle.
+    for path in (shared_data_root / "labware/definitions/2").glob("*/*.json"):
+        path.unlink()
+
+    monkeypatch.setenv(load.ENV_SHARED_DATA_PATH, str(shared_data_root))
+    load.get_shared_data_root.cache_clear()
+    load.get_shared_data_bundle.cache_clear()
+    yield shared_data_root
+    load.get_shared_data_root.cache_clear()
+    load.get_shared_data_bundle.cache_clear()
+
+
+def test_find_bundled_files(shared_data_root: Path) -> None:
+    assert sorted(find_bundled_files(shared_data_root)) == [
+        Path("labware/definitions/2/plate/1.json"),
+        Path("labware/definitions/2/tiprack/1.json"),
+        Path("labware/definitions/2/tiprack/2.json"),
+    ]
+
+
+def test_bundle_round_trip(shared_data_root: Path, tmp_path: Path) -> None:
+    target = tmp_path / "bundle.bin"
+    write_bundle(
+        root=shared_data_root,
+        files=find_bundled_files(shared_data_root),
+        target=target,
+    )
+    subject = SharedDataBundle(target)
+
+    assert subject.load("labware/definitions/2/plate/1.json") == b'{"a":1,"b":[1,2]}'
+    assert subject.load(Path("labware/definitions/2/tiprack/2.json")) == b"{}"
+    assert subject.has("labware/definitions/2/plate/1.json")
+    assert not subject.has("labware/schemas/2.json")
+    assert subject.list_directory("labware/definitions/2") == ["plate", "tiprack"]
+    assert subject.list_directory("labware/definitions/2/tiprack") == [
+        "1.json",
+        "2.json",
+    ]
+
+    with pytest.raises(KeyError):
+        subject.load("labware/schemas/2.json")
+
+
+def test_bundle_format_error(tmp_path: Path) -> None:
+    not_a_bundle = tmp_path / "bundle.bin"
+    not_a_bundle.write_bytes(b"hello world")
+
+    with pytest.raises(BundleFormatError):
+        SharedDataBundle(not_a_bundle)
+
+
+def test_load_shared_data_uses_bundle(bundled_root: Path) -> None:
+    assert load.get_shared_data_bundle() is not None
+    assert (
+        load.load_shared_data("labware/definitions/2/plate/1.json")
+        == b'{"a":1,"b":[1,2]}'
+    )
+    # Files outside of the bundle are still read from disk.
+    assert load.load_shared_data("labware/schemas/2.json") == b'{"not": "bundled"}'
+    assert load.list_shared_data("labware/definitions/2") == ["plate", "tiprack"]
+    assert load.list_shared_data("labware") == ["definitions", "schemas"]
+
+
+def test_load_shared_data_without_bundle(
+    shared_data_root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(load.ENV_SHARED_DATA_PATH, str(shared_data_root))
+    load.get_shared_data_root.cache_clear()
+    load.get_shared_data_bundle.cache_clear()
+
+    try:
+        assert load.get_shared_data_bundle() is None
+        assert load.load_shared_data("labware/definitions/2/plate/1.json") == (
+            b'{"a": 1,\n "b": [1, 2]}'
+        )
+        assert load.list_shared_data("labware/definitions/2/tiprack") == [
+            "1.json",
+            "2.json",
+        ]
+    finally:
+        load.get_shared_data_root.cache_clear()
+        load.get_shared_data_bundle.cache_clear()